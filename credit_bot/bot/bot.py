@@ -17,7 +17,16 @@ from telegram.ext import (
     filters,
 )
 
+from credit_bot.bot.executor import CalculationUnavailable, executor
+from credit_bot.bot.instrumentation import instrument_handlers
+from credit_bot.bot.metrics_endpoint import start_metrics_server
+from credit_bot.bot.profile_command import register_profiler
+from credit_bot.bot.rate_limiter import InstrumentedRateLimiter
 from credit_bot.bot.registration import register_handlers
+from credit_bot.bot.telemetry import telemetry
+from credit_bot.bot.update_processor import DEFAULT_CONCURRENCY, PerUserUpdateProcessor
+from credit_bot.bot.webhook import run_webhook
+from credit_bot.bot.webhook_config import WebhookConfig
 
 # Загружаем переменные из .env файла, если он существует
 env_path = Path(__file__).parent.parent.parent / ".env"
@@ -37,23 +46,12 @@ class CreditBot:
     def _build_application(self) -> Application:
         """Создаёт и настраивает приложение Telegram."""
         
-        # #region agent log
-        import json
-        log_path = Path(__file__).parent.parent.parent / ".cursor" / "debug.log"
-        try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps({
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "A",
-                    "location": "bot.py:_build_application:entry",
-                    "message": "Building application",
-                    "data": {"token_length": len(self._token) if self._token else 0},
-                    "timestamp": int(__import__("time").time() * 1000)
-                }) + "\n")
-        except Exception:
-            pass
-        # #endregion
+        telemetry.emit(
+            "bot.py:_build_application:entry",
+            "Building application",
+            "A",
+            {"token_length": len(self._token) if self._token else 0},
+        )
 
         # Проверяем наличие прокси в переменных окружения
         proxy_url = os.getenv("TELEGRAM_PROXY")
@@ -72,60 +70,50 @@ class CreditBot:
             .connect_timeout(connect_timeout)  # Таймаут подключения в секундах
             .read_timeout(read_timeout)  # Таймаут чтения в секундах
             .write_timeout(write_timeout)  # Таймаут записи в секундах
+            # Разные пользователи обрабатываются параллельно, один — по порядку
+            .concurrent_updates(
+                PerUserUpdateProcessor(
+                    int(os.getenv("BOT_CONCURRENCY", DEFAULT_CONCURRENCY))
+                )
+            )
+            # Замер длительности запросов к Bot API для /metrics
+            .rate_limiter(InstrumentedRateLimiter())
         )
         if proxy_url:
-            # #region agent log
-            try:
-                with open(log_path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps({
-                        "sessionId": "debug-session",
-                        "runId": "run1",
-                        "hypothesisId": "E",
-                        "location": "bot.py:_build_application:proxy_setup",
-                        "message": "Setting up proxy",
-                        "data": {"proxy_url": proxy_url},
-                        "timestamp": int(__import__("time").time() * 1000)
-                    }) + "\n")
-            except Exception:
-                pass
-            # #endregion
+            telemetry.emit(
+                "bot.py:_build_application:proxy_setup",
+                "Setting up proxy",
+                "E",
+                {"proxy_url": proxy_url},
+            )
             
             # В версии 22.5 может быть proxy_url вместо proxy
             proxy_set = False
             try:
                 builder = builder.proxy(proxy_url)
                 proxy_set = True
-                logger.info(f"Прокси настроен через .proxy(): {proxy_url}")
+                logger.info("Прокси настроен через .proxy(): {}", proxy_url)
             except AttributeError:
                 # Если метод proxy не существует, пробуем proxy_url
                 try:
                     builder = builder.proxy_url(proxy_url)
                     proxy_set = True
-                    logger.info(f"Прокси настроен через .proxy_url(): {proxy_url}")
+                    logger.info("Прокси настроен через .proxy_url(): {}", proxy_url)
                 except AttributeError:
                     # Если и это не работает, используем request_kwargs
-                    logger.warning(f"Прямая поддержка прокси недоступна, используем request_kwargs")
+                    logger.warning("Прямая поддержка прокси недоступна, используем request_kwargs")
             except Exception as e:
-                logger.error(f"Ошибка при настройке прокси: {e}")
+                logger.error("Ошибка при настройке прокси: {}", e)
                 raise
             
-            # #region agent log
-            try:
-                with open(log_path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps({
-                        "sessionId": "debug-session",
-                        "runId": "run1",
-                        "hypothesisId": "F",
-                        "location": "bot.py:_build_application:proxy_set",
-                        "message": "Proxy setup result",
-                        "data": {"proxy_set": proxy_set, "proxy_url": proxy_url},
-                        "timestamp": int(__import__("time").time() * 1000)
-                    }) + "\n")
-            except Exception:
-                pass
-            # #endregion
+            telemetry.emit(
+                "bot.py:_build_application:proxy_set",
+                "Proxy setup result",
+                "F",
+                {"proxy_set": proxy_set, "proxy_url": proxy_url},
+            )
             
-            logger.info(f"Используется прокси для подключения к Telegram API: {proxy_url}")
+            logger.info("Используется прокси для подключения к Telegram API: {}", proxy_url)
         
         # Проверяем наличие кастомного базового URL для Telegram API (для обхода блокировок)
         api_base_url = os.getenv("TELEGRAM_API_BASE_URL")
@@ -138,43 +126,24 @@ class CreditBot:
             # Убираем завершающий слэш
             api_base_url = api_base_url.rstrip("/")
             builder = builder.base_url(api_base_url)
-            logger.info(f"Используется кастомный базовый URL для Telegram API: {api_base_url}")
+            logger.info("Используется кастомный базовый URL для Telegram API: {}", api_base_url)
         
-        # #region agent log
-        try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps({
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "B",
-                    "location": "bot.py:_build_application:before_build",
-                    "message": "Before builder.build()",
-                    "data": {},
-                    "timestamp": int(__import__("time").time() * 1000)
-                }) + "\n")
-        except Exception:
-            pass
-        # #endregion
+        telemetry.emit(
+            "bot.py:_build_application:before_build", "Before builder.build()", "B"
+        )
         
         app = builder.build()
         
-        # #region agent log
-        try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps({
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "C",
-                    "location": "bot.py:_build_application:after_build",
-                    "message": "After builder.build()",
-                    "data": {"app_type": type(app).__name__, "has_bot": hasattr(app, "bot")},
-                    "timestamp": int(__import__("time").time() * 1000)
-                }) + "\n")
-        except Exception:
-            pass
-        # #endregion
+        telemetry.emit(
+            "bot.py:_build_application:after_build",
+            "After builder.build()",
+            "C",
+            {"app_type": type(app).__name__, "has_bot": hasattr(app, "bot")},
+        )
         
         register_handlers(app)
+        instrument_handlers(app)
+        register_profiler(app)
         
         # Добавляем обработчик ошибок
         async def error_handler(update: object, context: CallbackContext) -> None:
@@ -182,26 +151,17 @@ class CreditBot:
             error = context.error
             if isinstance(error, TimedOut):
                 logger.warning("Таймаут при отправке сообщения в Telegram.")
+            elif isinstance(error, CalculationUnavailable):
+                if isinstance(update, Update) and update.effective_message:
+                    await update.effective_message.reply_text(str(error))
             else:
                 logger.exception("Необработанная ошибка в боте.")
         
         app.add_error_handler(error_handler)
         
-        # #region agent log
-        try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps({
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "D",
-                    "location": "bot.py:_build_application:exit",
-                    "message": "Application built successfully",
-                    "data": {},
-                    "timestamp": int(__import__("time").time() * 1000)
-                }) + "\n")
-        except Exception:
-            pass
-        # #endregion
+        telemetry.emit(
+            "bot.py:_build_application:exit", "Application built successfully", "D"
+        )
         
         return app
 
@@ -216,29 +176,24 @@ class CreditBot:
         logger.info("Telegram-бот остановлен.")
 
     def run(self) -> None:
-        """Запускает бота в режиме polling."""
+        """Запускает бота в режиме polling или webhook (BOT_MODE)."""
         
         import asyncio
         
-        # #region agent log
-        import json
-        log_path = Path(__file__).parent.parent.parent / ".cursor" / "debug.log"
-        try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps({
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "E",
-                    "location": "bot.py:run:entry",
-                    "message": "Starting bot run",
-                    "data": {},
-                    "timestamp": int(__import__("time").time() * 1000)
-                }) + "\n")
-        except Exception:
-            pass
-        # #endregion
+        telemetry.emit("bot.py:run:entry", "Starting bot run", "E")
+        # Ошибки настройки вебхука (нет URL или секрета) прерывают запуск сразу
+        webhook_config = WebhookConfig.from_env()
 
         async def _run_async() -> None:
+            """Запускает сервер метрик и бота, останавливает сервер при выходе."""
+            metrics_server = await start_metrics_server()
+            try:
+                await _run_with_retries()
+            finally:
+                if metrics_server is not None:
+                    await metrics_server.stop()
+
+        async def _run_with_retries() -> None:
             """Асинхронная функция для запуска бота с явной инициализацией."""
             max_retries = 3
             retry_delay = 5  # секунды
@@ -247,42 +202,36 @@ class CreditBot:
                 try:
                     self._application = self._build_application()
                     
-                    # #region agent log
-                    try:
-                        with open(log_path, "a", encoding="utf-8") as f:
-                            f.write(json.dumps({
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "H",
-                                "location": "bot.py:run:before_initialize",
-                                "message": "Before initialize",
-                                "data": {"app_created": self._application is not None, "attempt": attempt},
-                                "timestamp": int(__import__("time").time() * 1000)
-                            }) + "\n")
-                    except Exception:
-                        pass
-                    # #endregion
-                    
-                    logger.info(f"Запуск Telegram-бота... (попытка {attempt}/{max_retries})")
+                    telemetry.emit(
+                        "bot.py:run:before_initialize",
+                        "Before initialize",
+                        "H",
+                        {
+                            "app_created": self._application is not None,
+                            "attempt": attempt,
+                        },
+                    )
                     
+                    logger.info("Запуск Telegram-бота... (попытка {}/{})", attempt, max_retries)
+
+                    if webhook_config is not None:
+                        await run_webhook(self._application, webhook_config)
+                        executor.shutdown()
+                        break
+
                     # Явная инициализация для версии 22.5
                     await self._application.initialize()
                     
-                    # #region agent log
-                    try:
-                        with open(log_path, "a", encoding="utf-8") as f:
-                            f.write(json.dumps({
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "I",
-                                "location": "bot.py:run:after_initialize",
-                                "message": "After initialize",
-                                "data": {"bot_id": getattr(self._application.bot, 'id', None) if hasattr(self._application, 'bot') else None},
-                                "timestamp": int(__import__("time").time() * 1000)
-                            }) + "\n")
-                    except Exception:
-                        pass
-                    # #endregion
+                    telemetry.emit(
+                        "bot.py:run:after_initialize",
+                        "After initialize",
+                        "I",
+                        {
+                            "bot_id": getattr(self._application.bot, "id", None)
+                            if hasattr(self._application, "bot")
+                            else None
+                        },
+                    )
                     
                     await self._application.start()
                     await self._application.updater.start_polling(
@@ -299,34 +248,26 @@ class CreditBot:
                     await self._application.updater.stop()
                     await self._application.stop()
                     await self._application.shutdown()
+                    executor.shutdown()
                     break  # Успешно запустились, выходим из цикла повторов
                     
                 except NetworkError as exc:
-                    # #region agent log
-                    try:
-                        with open(log_path, "a", encoding="utf-8") as f:
-                            f.write(json.dumps({
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "K",
-                                "location": "bot.py:run:network_error",
-                                "message": "Network error (proxy issue?)",
-                                "data": {
-                                    "attempt": attempt,
-                                    "max_retries": max_retries,
-                                    "error_type": type(exc).__name__,
-                                    "error_msg": str(exc)[:200]
-                                },
-                                "timestamp": int(__import__("time").time() * 1000)
-                            }) + "\n")
-                    except Exception:
-                        pass
-                    # #endregion
+                    telemetry.emit(
+                        "bot.py:run:network_error",
+                        "Network error (proxy issue?)",
+                        "K",
+                        {
+                            "attempt": attempt,
+                            "max_retries": max_retries,
+                            "error_type": type(exc).__name__,
+                            "error_msg": str(exc)[:200],
+                        },
+                    )
                     
                     if attempt < max_retries:
-                        logger.warning(f"Ошибка сети/прокси (попытка {attempt}/{max_retries}): {type(exc).__name__}")
-                        logger.warning(f"Детали: {str(exc)[:200]}")
-                        logger.info(f"Повтор через {retry_delay} сек...")
+                        logger.warning("Ошибка сети/прокси (попытка {}/{}): {}", attempt, max_retries, type(exc).__name__)
+                        logger.warning("Детали: {}", str(exc)[:200])
+                        logger.info("Повтор через {} сек...", retry_delay)
                         await asyncio.sleep(retry_delay)
                         # Закрываем приложение перед повторной попыткой
                         try:
@@ -344,24 +285,15 @@ class CreditBot:
                         raise
                     
                 except TimedOut as exc:
-                    # #region agent log
-                    try:
-                        with open(log_path, "a", encoding="utf-8") as f:
-                            f.write(json.dumps({
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "J",
-                                "location": "bot.py:run:timeout",
-                                "message": "Connection timeout",
-                                "data": {"attempt": attempt, "max_retries": max_retries},
-                                "timestamp": int(__import__("time").time() * 1000)
-                            }) + "\n")
-                    except Exception:
-                        pass
-                    # #endregion
+                    telemetry.emit(
+                        "bot.py:run:timeout",
+                        "Connection timeout",
+                        "J",
+                        {"attempt": attempt, "max_retries": max_retries},
+                    )
                     
                     if attempt < max_retries:
-                        logger.warning(f"Таймаут подключения (попытка {attempt}/{max_retries}). Повтор через {retry_delay} сек...")
+                        logger.warning("Таймаут подключения (попытка {}/{}). Повтор через {} сек...", attempt, max_retries, retry_delay)
                         await asyncio.sleep(retry_delay)
                         # Закрываем приложение перед повторной попыткой
                         try:
@@ -379,21 +311,15 @@ class CreditBot:
                         raise
                         
                 except Exception as exc:
-                    # #region agent log
-                    try:
-                        with open(log_path, "a", encoding="utf-8") as f:
-                            f.write(json.dumps({
-                                "sessionId": "debug-session",
-                                "runId": "run1",
-                                "hypothesisId": "G",
-                                "location": "bot.py:run:exception",
-                                "message": "Exception caught in async",
-                                "data": {"exception_type": type(exc).__name__, "exception_msg": str(exc)},
-                                "timestamp": int(__import__("time").time() * 1000)
-                            }) + "\n")
-                    except Exception:
-                        pass
-                    # #endregion
+                    telemetry.emit(
+                        "bot.py:run:exception",
+                        "Exception caught in async",
+                        "G",
+                        {
+                            "exception_type": type(exc).__name__,
+                            "exception_msg": str(exc),
+                        },
+                    )
                     logger.exception("Ошибка при запуске бота.")
                     raise
         
@@ -404,6 +330,9 @@ class CreditBot:
         except Exception as exc:
             logger.exception("Сбой при запуске бота.")
             raise
+        finally:
+            # Дописываем буфер телеметрии перед выходом
+            telemetry.close()
 
 
 def create_bot(token: str | None = None) -> CreditBot:
@@ -2,27 +2,42 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from telegram import Update
 
 from credit_bot.core.calculator import CreditCalculator
-from credit_bot.core.models import EarlyRepayment, EarlyRepaymentStrategy
-from credit_bot.bot.formatters import format_early_result
+from credit_bot.core.models import (
+    EarlyRepayment,
+    EarlyRepaymentStrategy,
+    Loan,
+    PaymentSchedule,
+)
+from credit_bot.bot.executor import executor
+from credit_bot.bot.formatters import format_comparison, format_early_result
 from credit_bot.bot.keyboards import get_main_menu_keyboard
 from credit_bot.bot.session import sessions
 
 calculator = CreditCalculator()
 
 
-async def calculate_and_send_early_result(
-    update: Update, strategy: EarlyRepaymentStrategy, session
-) -> None:
-    """Выполняет расчёт досрочного погашения и отправляет результат.
+async def _reply(update: Update, text: str, **kwargs) -> None:
+    """Отвечает сообщением или редактирует сообщение с кнопками."""
 
-    После отправки результата сценарий считается завершённым,
-    временные поля сессии очищаются.
-    """
+    # У апдейта с нажатием кнопки атрибут ``message`` есть, но равен None
+    if update.callback_query is not None:
+        await update.callback_query.edit_message_text(text, **kwargs)
+    else:
+        await update.message.reply_text(text, **kwargs)
 
-    base_schedule = calculator.generate_payment_schedule(
+
+async def _extra_amount(
+    update: Update, session
+) -> Optional[tuple[PaymentSchedule, float]]:
+    """Возвращает базовый график и сумму досрочки сверх обычного платежа."""
+
+    base_schedule = await executor.run(
+        calculator.generate_payment_schedule,
         session.loan_amount,
         session.term_months,
         session.annual_interest_rate,
@@ -32,49 +47,73 @@ async def calculate_and_send_early_result(
     # банк сначала спишет обычный ежемесячный платёж,
     # остаток пойдёт на досрочное погашение основного долга.
     if not base_schedule.payments:
-        return
+        return None
     index = session.payments_made or 0
     index = min(max(index, 0), base_schedule.months - 1)
     regular_payment = base_schedule.payments[index].payment_amount
 
-    total_amount = session.early_repayment_amount
-    extra_amount = total_amount - regular_payment
+    extra_amount = session.early_repayment_amount - regular_payment
     if extra_amount <= 0:
         # Если пользователь ввёл сумму, не превышающую обычный платёж,
         # досрочного погашения по сути нет.
-        if hasattr(update, "message"):
-            await update.message.reply_text(
-                "Сумма должна быть больше обычного ежемесячного платежа, "
-                "чтобы было досрочное погашение."
-            )
-        else:
-            await update.callback_query.edit_message_text(
-                "Сумма должна быть больше обычного ежемесячного платежа, "
-                "чтобы было досрочное погашение."
-            )
-        return
+        await _reply(
+            update,
+            "Сумма должна быть больше обычного ежемесячного платежа, "
+            "чтобы было досрочное погашение.",
+        )
+        return None
+    return base_schedule, extra_amount
+
+
+async def _send_result(update: Update, response: str) -> None:
+    """Отправляет результат и полностью сбрасывает сессию."""
+
+    await _reply(
+        update, response, parse_mode="Markdown", reply_markup=get_main_menu_keyboard()
+    )
+    await sessions.reset_async(update.effective_user.id)
 
+
+async def calculate_and_send_early_result(
+    update: Update, strategy: EarlyRepaymentStrategy, session
+) -> None:
+    """Выполняет расчёт досрочного погашения и отправляет результат.
+
+    После отправки результата сценарий считается завершённым,
+    временные поля сессии очищаются.
+    """
+
+    prepared = await _extra_amount(update, session)
+    if prepared is None:
+        return
+    base_schedule, extra_amount = prepared
     repayment = EarlyRepayment(
         amount=extra_amount,
         strategy=strategy,
         execute_after_payments=session.payments_made,
     )
-    result = calculator.apply_early_repayment(
-        base_schedule, repayment, session.payments_made
+    result = await executor.run(
+        calculator.apply_early_repayment,
+        base_schedule,
+        repayment,
+        session.payments_made,
     )
-    response = format_early_result(result)
-    keyboard = get_main_menu_keyboard()
-    if hasattr(update, "message"):
-        await update.message.reply_text(
-            response, parse_mode="Markdown", reply_markup=keyboard
-        )
-        user_id = update.effective_user.id
-    else:
-        await update.callback_query.edit_message_text(
-            response, parse_mode="Markdown", reply_markup=keyboard
-        )
-        user_id = update.effective_user.id
+    await _send_result(update, format_early_result(result))
 
-    # Полный рестарт после показа результата
-    sessions.reset(user_id)
 
+async def calculate_and_send_comparison(update: Update, session) -> None:
+    """Сравнивает все стратегии досрочки и отправляет таблицу."""
+
+    prepared = await _extra_amount(update, session)
+    if prepared is None:
+        return
+    _, extra_amount = prepared
+    loan = Loan(
+        amount=session.loan_amount,
+        term_months=session.term_months,
+        annual_interest_rate=session.annual_interest_rate,
+    )
+    table = await executor.run(
+        calculator.compare_strategies, loan, extra_amount, session.payments_made
+    )
+    await _send_result(update, format_comparison(table))
@@ -0,0 +1,96 @@
+"""Обработчик inline-кнопок главного меню."""
+
+from __future__ import annotations
+
+from loguru import logger
+from telegram import Update
+from telegram.ext import CallbackContext, ConversationHandler
+
+from credit_bot.bot.session import sessions
+from credit_bot.bot.states import (
+    ENTER_LOAN_AMOUNT,
+    ENTER_PAYMENTS_MADE,
+    ENTER_TARGET_OVERPAYMENT,
+)
+
+
+async def handle_callback(update: Update, context: CallbackContext) -> int:
+    """Обрабатывает нажатия на inline-кнопки."""
+
+    query = update.callback_query
+    await query.answer()
+
+    data = query.data
+    user_id = update.effective_user.id
+    logger.info("Пользователь {} нажал на кнопку: {}", user_id, data)
+
+    if data.startswith("action:"):
+        action = data.split(":")[1]
+        session = await sessions.get_async(user_id)
+        logger.info(
+            "Обработка действия '{}' для пользователя {}. "
+            "Параметры сессии: term_months={}, "
+            "loan_amount={}, rate={}",
+            action,
+            user_id,
+            session.term_months,
+            session.loan_amount,
+            session.annual_interest_rate,
+        )
+
+        # Если базовые параметры не заданы, запрашиваем их
+        if session.term_months is None:
+            if action != "schedule":
+                logger.info(
+                    "Параметры кредита не заданы, "
+                    "запрашиваем их для пользователя {}",
+                    user_id,
+                )
+                # Сохраняем выбранное действие, чтобы после ввода параметров
+                # перейти к нему
+                session.strategy = action
+                await query.edit_message_text(
+                    "Сначала нужно рассчитать базовый график.\n"
+                    "Введите сумму кредита (в рублях):"
+                )
+                return ENTER_LOAN_AMOUNT
+
+        if action == "schedule":
+            # Не сбрасываем сессию полностью, только очищаем для нового расчёта
+            logger.info("Пользователь {} выбрал 'Рассчитать график'", user_id)
+            session.loan_amount = None
+            session.term_months = None
+            session.annual_interest_rate = None
+            await query.edit_message_text("Введите сумму кредита (в рублях):")
+            return ENTER_LOAN_AMOUNT
+        elif action == "reduce_payment":
+            # Сохраняем выбранную стратегию
+            logger.info("Пользователь {} выбрал 'Уменьшить платеж'", user_id)
+            session.strategy = "reduce_payment"
+            await query.edit_message_text("Сколько платежей уже сделано?")
+            return ENTER_PAYMENTS_MADE
+        elif action == "reduce_term":
+            # Сохраняем выбранную стратегию
+            logger.info("Пользователь {} выбрал 'Уменьшить срок'", user_id)
+            session.strategy = "reduce_term"
+            await query.edit_message_text("Сколько платежей уже сделано?")
+            return ENTER_PAYMENTS_MADE
+        elif action == "combined":
+            # Комбинированная стратегия: срок и платёж
+            logger.info(
+                "Пользователь {} выбрал 'Уменьшить срок и платёж' "
+                "(комбинированная стратегия)",
+                user_id,
+            )
+            session.strategy = "combined"
+            await query.edit_message_text("Сколько платежей уже сделано?")
+            return ENTER_PAYMENTS_MADE
+        elif action == "payment":
+            logger.info(
+                "Пользователь {} выбрал 'Подобрать платеж для переплаты'", user_id
+            )
+            await query.edit_message_text("Введите желаемую переплату (в рублях):")
+            return ENTER_TARGET_OVERPAYMENT
+
+    logger.warning("Неизвестный callback_data от пользователя {}: {}", user_id, data)
+    return ConversationHandler.END
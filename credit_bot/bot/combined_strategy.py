@@ -7,6 +7,7 @@ from telegram.ext import CallbackContext, ConversationHandler
 
 from credit_bot.core.calculator import CreditCalculator
 from credit_bot.core.models import EarlyRepayment, EarlyRepaymentStrategy
+from credit_bot.bot.executor import executor
 from credit_bot.bot.formatters import format_early_result
 from credit_bot.bot.keyboards import get_main_menu_keyboard
 from credit_bot.bot.session import sessions
@@ -20,7 +21,7 @@ async def enter_second_amount(update: Update, context: CallbackContext) -> int:
     """Обрабатывает ввод второй суммы для комбинированной стратегии."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     value = parse_float(update.message.text)
     if value is None or value <= 0:
         await update.message.reply_text("Введите положительное число.")
@@ -39,7 +40,7 @@ async def enter_second_payments(update: Update, context: CallbackContext) -> int
     """Обрабатывает ввод второй даты для стратегии срок→платёж."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     value = parse_int(update.message.text)
     if value is None or value <= session.payments_made:
         await update.message.reply_text(
@@ -55,9 +56,12 @@ async def _finish_combined(update: Update, context: CallbackContext) -> None:
     """Завершает расчёт комбинированной стратегии."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
-    base_schedule = calculator.generate_payment_schedule(
-        session.loan_amount, session.term_months, session.annual_interest_rate
+    session = await sessions.get_async(user_id)
+    base_schedule = await executor.run(
+        calculator.generate_payment_schedule,
+        session.loan_amount,
+        session.term_months,
+        session.annual_interest_rate,
     )
     strategy = EarlyRepaymentStrategy(session.strategy)
     repayment = EarlyRepayment(
@@ -67,8 +71,11 @@ async def _finish_combined(update: Update, context: CallbackContext) -> None:
         secondary_amount=session.secondary_amount,
         secondary_execute_after_payments=session.secondary_payments,
     )
-    result = calculator.apply_early_repayment(
-        base_schedule, repayment, session.payments_made
+    result = await executor.run(
+        calculator.apply_early_repayment,
+        base_schedule,
+        repayment,
+        session.payments_made,
     )
     response = format_early_result(result)
     keyboard = get_main_menu_keyboard()
@@ -77,5 +84,5 @@ async def _finish_combined(update: Update, context: CallbackContext) -> None:
     )
 
     # Полный рестарт после показа результата
-    sessions.reset(user_id)
+    await sessions.reset_async(user_id)
 
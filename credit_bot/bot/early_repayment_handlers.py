@@ -6,7 +6,10 @@ from telegram import Update
 from telegram.ext import CallbackContext, ConversationHandler
 
 from credit_bot.core.models import EarlyRepaymentStrategy
-from credit_bot.bot.calculation_helpers import calculate_and_send_early_result
+from credit_bot.bot.calculation_helpers import (
+    calculate_and_send_comparison,
+    calculate_and_send_early_result,
+)
 from credit_bot.bot.keyboards import get_strategy_keyboard
 from credit_bot.bot.session import sessions
 from credit_bot.bot.states import (
@@ -23,7 +26,7 @@ async def enter_payments_made(update: Update, context: CallbackContext) -> int:
     """Обрабатывает ввод количества сделанных платежей."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     
     # Если базовые параметры не заданы, запрашиваем их
     if session.term_months is None:
@@ -51,7 +54,7 @@ async def enter_early_repayment_amount(
     """Обрабатывает ввод суммы досрочки."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     value = parse_float(update.message.text)
     if value is None or value <= 0:
         await update.message.reply_text("Введите положительное число.")
@@ -86,6 +89,10 @@ async def handle_strategy_callback(
         await query.edit_message_text("Неверная команда.")
         return ConversationHandler.END
     strategy_name = data.split(":")[1]
+    if strategy_name == "compare":
+        session = await sessions.get_async(update.effective_user.id)
+        await calculate_and_send_comparison(update, session)
+        return ConversationHandler.END
     strategy_map = {
         "reduce_term": EarlyRepaymentStrategy.REDUCE_TERM,
         "reduce_payment": EarlyRepaymentStrategy.REDUCE_PAYMENT,
@@ -97,7 +104,7 @@ async def handle_strategy_callback(
         await query.edit_message_text("Неверная стратегия.")
         return ConversationHandler.END
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     if strategy in (
         EarlyRepaymentStrategy.COMBINED_PAYMENT_THEN_TERM,
         EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT,
@@ -113,7 +120,7 @@ async def enter_strategy(update: Update, context: CallbackContext) -> int:
     """Обрабатывает выбор стратегии через текст (legacy)."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     text = update.message.text
     strategy_map = {
         "Сократить срок": EarlyRepaymentStrategy.REDUCE_TERM,
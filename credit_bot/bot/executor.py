@@ -0,0 +1,150 @@
+"""Вынос тяжёлых расчётов из цикла событий бота в пул исполнителей."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+from loguru import logger
+
+from credit_bot.bot.executor_slots import ExecutorMetrics, ExecutorSlots
+
+T = TypeVar("T")
+
+MODE_INLINE = "inline"
+MODE_THREAD = "thread"
+MODE_PROCESS = "process"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_QUEUE = 64
+
+# Обёртка вызова в потоке пула для текущего запроса (используется профилировщиком)
+calculation_hook: ContextVar[Optional[Callable]] = ContextVar("hook", default=None)
+
+
+class CalculationUnavailable(RuntimeError):
+    """Расчёт отклонён: очередь переполнена или истёк таймаут."""
+
+
+class CalculationExecutor:
+    """Выполняет синхронные расчёты ядра, не блокируя цикл событий.
+
+    Режим ``thread`` подходит для коротких расчётов, ``process`` — для
+    тяжёлых подборов (обходит GIL, но требует сериализуемых аргументов),
+    ``inline`` выполняет расчёт прямо в цикле событий. Лишние расчёты сверх
+    ``max_queue`` сразу отклоняются; после таймаута расчёт дорабатывает в
+    пуле и держит слот очереди. ``observers`` получают имя, длительность и результат.
+    """
+
+    def __init__(
+        self,
+        mode: str = MODE_THREAD,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        if mode not in (MODE_INLINE, MODE_THREAD, MODE_PROCESS):
+            raise ValueError(f"Неизвестный режим исполнителя: {mode}")
+        if max_queue <= 0:
+            raise ValueError("Размер очереди должен быть положительным.")
+        self.mode = mode
+        self.workers = workers
+        self.timeout = timeout
+        self.max_queue = max_queue
+        self.metrics = ExecutorMetrics()
+        self.observers: list[Callable[[str, float, object], None]] = []
+        self._slots = ExecutorSlots(self.metrics, max_queue)
+        self._pool: Optional[Executor] = None
+
+    @classmethod
+    def from_env(cls) -> CalculationExecutor:
+        """Создаёт исполнитель по переменным окружения CALC_*."""
+
+        workers = os.getenv("CALC_WORKERS")
+        timeout = float(os.getenv("CALC_TIMEOUT", DEFAULT_TIMEOUT))
+        return cls(
+            mode=os.getenv("CALC_EXECUTOR", MODE_THREAD).strip().lower(),
+            workers=int(workers) if workers else None,
+            timeout=timeout if timeout > 0 else None,
+            max_queue=int(os.getenv("CALC_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+        )
+
+    def _get_pool(self) -> Executor:
+        """Создаёт пул при первом обращении."""
+
+        if self._pool is None:
+            if self.mode == MODE_PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="calc"
+                )
+        return self._pool
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Выполняет ``func(*args, **kwargs)`` в пуле с учётом лимитов."""
+
+        metrics = self.metrics
+        if not self._slots.acquire():
+            logger.warning("Очередь расчётов переполнена ({}).", self.max_queue)
+            raise CalculationUnavailable("Сервис перегружен, попробуйте позже.")
+        started = time.perf_counter()
+        try:
+            if self.mode == MODE_INLINE:
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    self._slots.release(started)
+            else:
+                result = await self._submit(partial(func, *args, **kwargs), started)
+        except asyncio.TimeoutError:
+            metrics.timeouts += 1
+            logger.warning("Расчёт {} превысил таймаут.", func)
+            raise CalculationUnavailable(
+                "Расчёт занял слишком много времени, попробуйте другие параметры."
+            ) from None
+        except Exception:
+            metrics.failed += 1
+            raise
+        metrics.completed += 1
+        self._notify(func, time.perf_counter() - started, result)
+        return result
+
+    async def _submit(self, call: Callable[[], T], started: float) -> T:
+        """Отправляет расчёт в пул; слот освобождается по его завершении."""
+
+        hook = calculation_hook.get()
+        if hook is not None and self.mode == MODE_THREAD:
+            call = partial(hook, call)
+        job = self._get_pool().submit(call)
+        job.add_done_callback(partial(self._slots.release, started))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), self.timeout)
+        except asyncio.TimeoutError:
+            self._slots.abandon(job)
+            raise
+
+    def _notify(self, func: Callable, elapsed: float, result: object) -> None:
+        """Передаёт результат наблюдателям; их ошибки не влияют на расчёт."""
+
+        name = getattr(func, "__name__", str(func))
+        for observer in self.observers:
+            try:
+                observer(name, elapsed, result)
+            except Exception:
+                logger.exception("Наблюдатель расчёта {} завершился ошибкой.", name)
+
+    def shutdown(self) -> None:
+        """Останавливает пул, не дожидаясь зависших расчётов."""
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Общий исполнитель расчётов для всех обработчиков бота
+executor = CalculationExecutor.from_env()
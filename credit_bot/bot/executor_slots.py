@@ -0,0 +1,70 @@
+"""Учёт слотов очереди исполнителя расчётов."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ExecutorMetrics:
+    """Счётчики работы исполнителя расчётов.
+
+    ``in_flight`` — расчёты, занимающие слот очереди, включая
+    ``abandoned``: брошенные по таймауту, но ещё выполняющиеся в пуле.
+    """
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    abandoned: int = 0
+    busy_seconds: float = 0.0
+
+
+class ExecutorSlots:
+    """Слоты очереди расчётов: занимаются в цикле событий, а освобождаются
+    и из потоков пула, когда расчёт действительно завершился."""
+
+    def __init__(self, metrics: ExecutorMetrics, max_queue: int) -> None:
+        self.metrics = metrics
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._abandoned: set[Future] = set()
+
+    def acquire(self) -> bool:
+        """Занимает слот; при переполненной очереди учитывает отказ."""
+
+        metrics = self.metrics
+        with self._lock:
+            if metrics.in_flight >= self.max_queue:
+                metrics.rejected += 1
+                return False
+            metrics.submitted += 1
+            metrics.in_flight += 1
+            metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+            return True
+
+    def release(self, started: float, job: Optional[Future] = None) -> None:
+        """Освобождает слот расчёта, начатого в момент ``started``."""
+
+        with self._lock:
+            self.metrics.in_flight -= 1
+            self.metrics.busy_seconds += time.perf_counter() - started
+            if job in self._abandoned:
+                self._abandoned.discard(job)
+                self.metrics.abandoned -= 1
+
+    def abandon(self, job: Future) -> None:
+        """Отмечает расчёт, который продолжает работу после таймаута."""
+
+        with self._lock:
+            if not job.done():
+                self._abandoned.add(job)
+                self.metrics.abandoned += 1
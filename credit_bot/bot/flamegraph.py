@@ -0,0 +1,62 @@
+"""Преобразование статистики cProfile в свёрнутые стеки для flamegraph."""
+
+from __future__ import annotations
+
+import pstats
+from collections import defaultdict
+from typing import Iterator
+
+# Ключ функции в pstats: (файл, строка, имя)
+FuncKey = tuple[str, int, str]
+MAX_DEPTH = 64
+# Пути короче микросекунды не выводятся
+MIN_MICROSECONDS = 1
+
+
+def _label(func: FuncKey) -> str:
+    """Возвращает подпись кадра ``модуль:имя``."""
+
+    filename, _, name = func
+    if filename == "~":
+        return name.strip("<>").replace(" ", "_")
+    module = filename.replace("\\", "/").rsplit("/", 1)[-1].removesuffix(".py")
+    return f"{module}:{name}"
+
+
+def folded_stacks(stats: pstats.Stats) -> Iterator[str]:
+    """Строит строки ``кадр;кадр;кадр мкс`` для flamegraph.pl и speedscope.
+
+    cProfile хранит только пары «вызывающий — вызываемый», поэтому полные
+    стеки восстанавливаются приближённо: время вызываемой функции делится
+    между путями пропорционально накопленному времени по каждому ребру.
+    """
+
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: dict[FuncKey, dict[FuncKey, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    totals: dict[str, float] = defaultdict(float)
+
+    def walk(func: FuncKey, path: tuple[str, ...], share: float) -> None:
+        _, _, own, cumulative, _ = raw[func]
+        frames = path + (_label(func),)
+        totals[";".join(frames)] += own * share
+        if len(frames) >= MAX_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_total = raw[callee][3]
+            if callee_total <= 0 or _label(callee) in frames:
+                continue
+            callee_share = share * min(1.0, edge_time / callee_total)
+            # Отсекаем пути, которые всё равно не попадут в вывод
+            if callee_total * callee_share * 1_000_000 >= MIN_MICROSECONDS:
+                walk(callee, frames, callee_share)
+
+    for root in roots:
+        walk(root, (), 1.0)
+    for stack, seconds in totals.items():
+        microseconds = round(seconds * 1_000_000)
+        if microseconds >= MIN_MICROSECONDS:
+            yield f"{stack} {microseconds}"
@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
-from credit_bot.core.models import PaymentSchedule
+from credit_bot.core.comparison import StrategyComparison
+from credit_bot.core.models import EarlyRepaymentStrategy, PaymentSchedule
+
+# Строк помесячного графика на одной странице
+PAGE_ROWS = 12
+
+STRATEGY_LABELS = {
+    EarlyRepaymentStrategy.REDUCE_TERM: "Уменьшить срок",
+    EarlyRepaymentStrategy.REDUCE_PAYMENT: "Уменьшить платёж",
+    EarlyRepaymentStrategy.COMBINED_PAYMENT_THEN_TERM: "Платёж → срок",
+    EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT: "Срок → платёж",
+}
 
 
 def format_schedule(schedule: PaymentSchedule) -> str:
@@ -24,7 +35,10 @@ def format_early_result(result: dict) -> str:
     """Описывает перерасчёт после досрочного платежа."""
 
     schedule = result["schedule"]
-    body = ["*Досрочное погашение*", f"• Проценты до досрочки: `{result['interest_before']:.2f}` ₽"]
+    body = [
+        "*Досрочное погашение*",
+        f"• Проценты до досрочки: `{result['interest_before']:.2f}` ₽",
+    ]
     if schedule.payments:
         body.append(f"• Новый платёж: `{schedule.payments[0].payment_amount:.2f}` ₽")
     body.append(f"• Новая переплата: `{result['total_interest']:.2f}` ₽")
@@ -43,3 +57,51 @@ def format_payment_plan(plan: dict) -> str:
     ]
     return "\n".join(body)
 
+
+def format_comparison(table: StrategyComparison) -> str:
+    """Формирует таблицу сравнения стратегий досрочки."""
+
+    body = [
+        "*Сравнение стратегий*",
+        f"• Досрочка: `{table.repayment_amount:.2f}` ₽",
+        f"• Переплата без досрочки: `{table.base_interest:.2f}` ₽",
+    ]
+    best = table.best()
+    for row in table.rows:
+        mark = " ✅" if row is best else ""
+        body.append(
+            f"\n*{STRATEGY_LABELS[row.strategy]}*{mark}\n"
+            f"• Платёж: `{row.monthly_payment:.2f}` ₽, "
+            f"срок: `{row.months_left}` мес.\n"
+            f"• Переплата: `{row.total_interest:.2f}` ₽, "
+            f"экономия: `{row.savings:.2f}` ₽"
+        )
+    return "\n".join(body)
+
+
+def page_count(schedule: PaymentSchedule) -> int:
+    """Возвращает число страниц помесячного графика."""
+
+    return max(1, -(-schedule.months // PAGE_ROWS))
+
+
+def format_schedule_page(schedule: PaymentSchedule, page: int) -> str:
+    """Формирует страницу помесячного графика под итогами расчёта."""
+
+    start = page * PAGE_ROWS
+    end = start + PAGE_ROWS
+    lines = [
+        f"{'№':>3} {'Платёж':>10} {'Тело':>10} {'Проценты':>9} {'Остаток':>11}",
+        *(
+            f"{row.number:>3} {row.payment_amount:>10.2f} "
+            f"{row.principal_amount:>10.2f} {row.interest_amount:>9.2f} "
+            f"{row.remaining_principal:>11.2f}"
+            for row in schedule.payments[start:end]
+        ),
+    ]
+    table = "\n".join(lines)
+    return (
+        f"{format_schedule(schedule)}\n\n"
+        f"*Страница {page + 1} из {page_count(schedule)}*\n"
+        f"```\n{table}\n```"
+    )
@@ -0,0 +1,142 @@
+"""Минимальный HTTP/1.1-сервер на asyncio для вебхука и служебных страниц."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+# Ограничение тела запроса: апдейты Telegram заметно меньше
+MAX_BODY_BYTES = 1024 * 1024
+# Сколько ждать следующего запроса в keep-alive соединении, секунды
+KEEPALIVE_TIMEOUT = 75.0
+
+
+@dataclass(frozen=True, slots=True)
+class Request:
+    """Разобранный HTTP-запрос (имена заголовков в нижнем регистре)."""
+
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+
+# Статус, тело и Content-Type ответа
+Response = tuple[int, bytes, str]
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class HttpServer:
+    """HTTP-сервер с таблицей маршрутов «метод + путь → обработчик»."""
+
+    def __init__(self, host: str, port: int, max_body: int = MAX_BODY_BYTES) -> None:
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self._routes: dict[tuple[str, str], Handler] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        """Регистрирует обработчик для метода и пути."""
+
+        self._routes[(method.upper(), path)] = handler
+
+    async def start(self) -> None:
+        """Начинает принимать соединения."""
+
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        sockets = self._server.sockets or ()
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        logger.info("HTTP-сервер слушает {}:{}", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Закрывает сервер и ждёт завершения соединений."""
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Обслуживает соединение, пока клиент держит keep-alive."""
+
+        try:
+            while True:
+                request = await asyncio.wait_for(
+                    self._read_request(reader), KEEPALIVE_TIMEOUT
+                )
+                if request is None:
+                    break
+                if isinstance(request, int):
+                    await self._write(writer, (request, b"", "text/plain"), True)
+                    break
+                response = await self._dispatch(request)
+                close = request.headers.get("connection", "").lower() == "close"
+                await self._write(writer, response, close)
+                if close:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Request | int | None:
+        """Читает запрос; возвращает код ошибки для некорректного запроса."""
+
+        headers: dict[str, str] = {}
+        try:
+            line = await reader.readline()
+            if not line:
+                return None
+            while (header := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = header.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # Строка запроса или заголовка не поместилась в буфер StreamReader
+            return 431
+        parts = line.decode("latin-1").split()
+        length_text = headers.get("content-length", "0")
+        # Только цифры: int() принял бы и "-5", и "+5", и "1_000"
+        if len(parts) != 3 or not (length_text.isascii() and length_text.isdigit()):
+            return 400
+        length = int(length_text)
+        if length > self.max_body:
+            return 413
+        body = await reader.readexactly(length) if length else b""
+        return Request(parts[0].upper(), parts[1].split("?")[0], headers, body)
+
+    async def _dispatch(self, request: Request) -> Response:
+        """Находит обработчик маршрута и перехватывает его ошибки."""
+
+        handler = self._routes.get((request.method, request.path))
+        if handler is None:
+            known = any(path == request.path for _, path in self._routes)
+            return (405 if known else 404), b"", "text/plain"
+        try:
+            return await handler(request)
+        except Exception:
+            logger.exception("Ошибка обработки HTTP-запроса {}.", request.path)
+            return 500, b"", "text/plain"
+
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter, response: Response, close: bool
+    ) -> None:
+        """Отправляет ответ клиенту."""
+
+        status, body, content_type = response
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
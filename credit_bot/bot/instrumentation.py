@@ -0,0 +1,138 @@
+"""Сбор метрик бота и расчётов."""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any, Callable, Iterator
+
+from telegram.ext import Application, BaseHandler, ConversationHandler
+
+from credit_bot.bot import states
+from credit_bot.bot.executor import executor
+from credit_bot.bot.metrics import (
+    COUNT_BUCKETS,
+    CallbackCounter,
+    Counter,
+    Gauge,
+    Histogram,
+    registry,
+)
+from credit_bot.bot.session import sessions
+
+HANDLER_SECONDS = registry.register(
+    Histogram(
+        "credit_bot_handler_seconds",
+        "Длительность обработчиков по состояниям диалога.",
+        ("state", "handler"),
+    )
+)
+CALCULATION_SECONDS = registry.register(
+    Histogram(
+        "credit_bot_calculation_seconds",
+        "Длительность расчётов по методам калькулятора.",
+        ("method",),
+    )
+)
+SCHEDULE_ROWS = registry.register(
+    Counter(
+        "credit_bot_schedule_rows_total",
+        "Число построенных строк графиков.",
+        ("method",),
+    )
+)
+SEARCH_ITERATIONS = registry.register(
+    Histogram(
+        "credit_bot_search_iterations",
+        "Число пересчётов графика за один подбор.",
+        ("method",),
+        COUNT_BUCKETS,
+    )
+)
+registry.register(
+    Gauge("credit_bot_sessions", "Сессии в памяти.", lambda: len(sessions))
+)
+registry.register(
+    Gauge(
+        "credit_bot_calculations_in_flight",
+        "Принятые и не завершённые расчёты.",
+        lambda: executor.metrics.in_flight,
+    )
+)
+registry.register(
+    Gauge(
+        "credit_bot_calculations_abandoned",
+        "Расчёты, брошенные по таймауту и ещё занимающие пул.",
+        lambda: executor.metrics.abandoned,
+    )
+)
+registry.register(
+    CallbackCounter(
+        "credit_bot_calculations_rejected_total",
+        "Расчёты, отклонённые из-за очереди или таймаута.",
+        lambda: executor.metrics.rejected + executor.metrics.timeouts,
+    )
+)
+
+STATE_NAMES = {
+    value: name.lower()
+    for name, value in vars(states).items()
+    if name.isupper() and isinstance(value, int)
+}
+
+
+def observe_calculation(method: str, seconds: float, result: object) -> None:
+    """Учитывает длительность расчёта, строки графиков и итерации подбора."""
+
+    CALCULATION_SECONDS.observe(seconds, method)
+    if isinstance(result, dict):
+        if "evaluations" in result:
+            SEARCH_ITERATIONS.observe(float(result["evaluations"]), method)
+        result = result.get("schedule")
+    months = getattr(result, "months", None)
+    if isinstance(months, int):
+        SCHEDULE_ROWS.inc(method, amount=months)
+
+
+def _timed(handler: BaseHandler, state: str) -> None:
+    """Оборачивает callback обработчика замером длительности."""
+
+    callback: Callable[..., Any] = handler.callback
+    name = getattr(callback, "__name__", type(handler).__name__)
+
+    @functools.wraps(callback)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await callback(*args, **kwargs)
+        finally:
+            HANDLER_SECONDS.observe(time.perf_counter() - started, state, name)
+
+    handler.callback = wrapper
+
+
+def iter_handlers(application: Application) -> Iterator[tuple[str, BaseHandler]]:
+    """Перебирает обработчики приложения вместе с меткой состояния диалога."""
+
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            if not isinstance(handler, ConversationHandler):
+                yield "global", handler
+                continue
+            for entry in handler.entry_points:
+                yield "entry", entry
+            for state, state_handlers in handler.states.items():
+                for item in state_handlers:
+                    yield STATE_NAMES.get(state, str(state)), item
+            for fallback in handler.fallbacks:
+                yield "fallback", fallback
+
+
+def instrument_handlers(application: Application) -> None:
+    """Добавляет замер времени ко всем обработчикам приложения."""
+
+    for state, handler in iter_handlers(application):
+        _timed(handler, state)
+
+
+executor.observers.append(observe_calculation)
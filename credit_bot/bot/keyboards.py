@@ -48,6 +48,36 @@ def get_strategy_keyboard() -> InlineKeyboardMarkup:
         [
             InlineKeyboardButton("Срок → платёж", callback_data="strategy:combo_tp"),
         ],
+        [
+            InlineKeyboardButton("📋 Сравнить все", callback_data="strategy:compare"),
+        ],
     ]
     return InlineKeyboardMarkup(keyboard)
 
+
+def get_schedule_page_keyboard(
+    loan_key: str, page: int, pages: int
+) -> InlineKeyboardMarkup:
+    """Возвращает кнопки листания помесячного графика."""
+
+    targets = [
+        ("⏮", 0, page > 1),
+        ("◀️", page - 1, page > 0),
+        ("▶️", page + 1, page < pages - 1),
+        ("⏭", pages - 1, page < pages - 2),
+    ]
+    row = [
+        InlineKeyboardButton(label, callback_data=f"page:{loan_key}:{target}")
+        for label, target, visible in targets
+        if visible
+    ]
+    return InlineKeyboardMarkup([row] if row else [])
+
+
+def get_schedule_details_keyboard(loan_key: str) -> InlineKeyboardMarkup:
+    """Возвращает кнопку перехода к помесячному графику."""
+
+    button = InlineKeyboardButton(
+        "📅 Помесячный график", callback_data=f"page:{loan_key}:0"
+    )
+    return InlineKeyboardMarkup([[button]])
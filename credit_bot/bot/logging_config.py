@@ -0,0 +1,50 @@
+"""Настройка журналирования: уровни по модулям и неблокирующий вывод."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from loguru import logger
+
+DEFAULT_LEVEL = "INFO"
+DEFAULT_ROTATION = "10 MB"
+
+
+def parse_levels(raw: str) -> dict[str, str]:
+    """Разбирает LOG_LEVELS вида ``credit_bot.core=ERROR,telegram=WARNING``."""
+
+    levels: dict[str, str] = {}
+    for item in raw.split(","):
+        module, _, level = item.partition("=")
+        if module.strip() and level.strip():
+            levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging() -> None:
+    """Перенастраивает вывод loguru по переменным окружения LOG_*.
+
+    ``LOG_LEVEL`` задаёт общий уровень, ``LOG_LEVELS`` — уровни отдельных
+    модулей (по префиксу имени). Записи ниже минимального из уровней
+    отбрасываются loguru до форматирования сообщения. При ``LOG_ENQUEUE=1``
+    (по умолчанию) запись в поток вывода и файл ``LOG_FILE`` выполняет
+    фоновый поток, и обработчики не ждут ввода-вывода.
+    """
+
+    levels = {"": os.getenv("LOG_LEVEL", DEFAULT_LEVEL).upper()}
+    levels.update(parse_levels(os.getenv("LOG_LEVELS", "")))
+    minimum = min(logger.level(level).no for level in levels.values())
+    options = {
+        "level": minimum,
+        "filter": levels,
+        "enqueue": os.getenv("LOG_ENQUEUE", "1") != "0",
+        # Значения переменных в трассировках дороги и могут раскрыть данные
+        "diagnose": False,
+    }
+    logger.remove()
+    logger.add(sys.stderr, **options)
+    log_file = os.getenv("LOG_FILE")
+    if log_file:
+        rotation = os.getenv("LOG_ROTATION", DEFAULT_ROTATION)
+        logger.add(log_file, rotation=rotation, encoding="utf-8", **options)
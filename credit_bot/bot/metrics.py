@@ -0,0 +1,147 @@
+"""Реестр метрик в текстовом формате Prometheus."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Iterable, Sequence, TypeVar
+
+from credit_bot.bot.metrics_format import LabelValues, escape_help, format_labels
+
+# Границы гистограмм длительностей, секунды
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+M = TypeVar("M", bound="Metric")
+
+
+class Metric:
+    """Базовая метрика с именем, описанием и метками."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._lock = Lock()
+
+    def render(self) -> Iterable[str]:
+        """Возвращает строки метрики в формате Prometheus."""
+
+        yield f"# HELP {self.name} {escape_help(self.help_text)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterable[str]:
+        return ()
+
+
+class Counter(Metric):
+    """Монотонно растущий счётчик."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Увеличивает счётчик для набора меток."""
+
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for values, total in items:
+            yield f"{self.name}{format_labels(self.labels, values)} {total}"
+
+
+class Gauge(Metric):
+    """Значение, вычисляемое в момент выгрузки."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        super().__init__(name, help_text)
+        self._read = read
+
+    def _samples(self) -> Iterable[str]:
+        yield f"{self.name} {float(self._read())}"
+
+
+class CallbackCounter(Gauge):
+    """Счётчик, значение которого читается из источника в момент выгрузки."""
+
+    kind = "counter"
+
+
+class Histogram(Metric):
+    """Гистограмма с накопительными корзинами, суммой и числом наблюдений."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._size = len(self.buckets) + 1
+        # По меткам: счётчики корзин (последняя — +Inf) и сумма
+        self._values: dict[LabelValues, tuple[list[int], float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Добавляет наблюдение."""
+
+        position = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(labels) or ([0] * self._size, 0.0)
+            counts[position] += 1
+            self._values[labels] = (counts, total + value)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [
+                (key, list(value[0]), value[1]) for key, value in self._values.items()
+            ]
+        bounds = [*map(str, self.buckets), "+Inf"]
+        for values, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = format_labels(self.labels, values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = format_labels(self.labels, values)
+            yield f"{self.name}_sum{labels} {total}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Набор метрик процесса."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """Добавляет метрику; повторная регистрация имени запрещена."""
+
+        if metric.name in self._metrics:
+            raise ValueError(f"Метрика {metric.name} уже зарегистрирована.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Возвращает все метрики в текстовом формате Prometheus."""
+
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+# Общий реестр метрик бота
+registry = MetricsRegistry()
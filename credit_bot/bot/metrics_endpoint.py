@@ -0,0 +1,27 @@
+"""HTTP-эндпоинт ``/metrics`` в формате Prometheus."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from credit_bot.bot.http_server import HttpServer, Request, Response
+from credit_bot.bot.metrics import registry
+
+
+async def _metrics_page(request: Request) -> Response:
+    """Отдаёт метрики в текстовом формате Prometheus."""
+
+    return 200, registry.render().encode("utf-8"), "text/plain; version=0.0.4"
+
+
+async def start_metrics_server() -> Optional[HttpServer]:
+    """Запускает HTTP-сервер метрик, если задан METRICS_PORT."""
+
+    port = os.getenv("METRICS_PORT")
+    if not port:
+        return None
+    server = HttpServer(os.getenv("METRICS_LISTEN", "127.0.0.1"), int(port))
+    server.route("GET", "/metrics", _metrics_page)
+    await server.start()
+    return server
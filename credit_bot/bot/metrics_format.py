@@ -0,0 +1,31 @@
+"""Экранирование и форматирование строк текстового формата Prometheus."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+LabelValues = tuple[str, ...]
+
+
+def escape_help(text: str) -> str:
+    """Экранирует обратную косую черту и переводы строк в описании."""
+
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def escape_label_value(value: str) -> str:
+    """Экранирует значение метки: ``\\``, ``"`` и переводы строк."""
+
+    return escape_help(value).replace('"', '\\"')
+
+
+def format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    """Формирует блок меток ``{a="1",b="2"}``."""
+
+    pairs = [
+        f'{name}="{escape_label_value(str(value))}"'
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
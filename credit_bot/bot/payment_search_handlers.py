@@ -6,6 +6,7 @@ from telegram import Update
 from telegram.ext import CallbackContext, ConversationHandler
 
 from credit_bot.core.calculator import CreditCalculator
+from credit_bot.bot.executor import executor
 from credit_bot.bot.formatters import format_payment_plan
 from credit_bot.bot.keyboards import get_main_menu_keyboard
 from credit_bot.bot.session import sessions
@@ -21,7 +22,7 @@ async def enter_target_overpayment(
     """Обрабатывает ввод целевой переплаты."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     
     # Если базовые параметры не заданы, запрашиваем их
     if session.term_months is None:
@@ -46,14 +47,15 @@ async def enter_tolerance(update: Update, context: CallbackContext) -> int:
     """Обрабатывает ввод допуска и выполняет подбор платежа."""
 
     user_id = update.effective_user.id
-    session = sessions.get(user_id)
+    session = await sessions.get_async(user_id)
     value = parse_float(update.message.text)
     if value is None or value <= 0:
         await update.message.reply_text("Введите положительное число.")
         return ENTER_TOLERANCE
     session.tolerance = value
 
-    plan = calculator.calculate_payment_by_target_overpayment(
+    plan = await executor.run(
+        calculator.calculate_payment_by_target_overpayment,
         amount=session.loan_amount,
         annual_interest_rate=session.annual_interest_rate,
         target_overpayment=session.target_overpayment,
@@ -66,6 +68,6 @@ async def enter_tolerance(update: Update, context: CallbackContext) -> int:
     )
 
     # Полный рестарт после показа результата
-    sessions.reset(user_id)
+    await sessions.reset_async(user_id)
     return ConversationHandler.END
 
@@ -0,0 +1,49 @@
+"""Переход к действию, выбранному до ввода параметров кредита."""
+
+from __future__ import annotations
+
+from loguru import logger
+from telegram import Update
+from telegram.ext import ConversationHandler
+
+from credit_bot.bot.keyboards import get_main_menu_keyboard
+from credit_bot.bot.states import ENTER_PAYMENTS_MADE, ENTER_TARGET_OVERPAYMENT
+
+# Действие -> (вопрос пользователю, следующее состояние диалога)
+PENDING_ACTIONS = {
+    "reduce_payment": ("Сколько платежей уже сделано?", ENTER_PAYMENTS_MADE),
+    "reduce_term": ("Сколько платежей уже сделано?", ENTER_PAYMENTS_MADE),
+    "combined": ("Сколько платежей уже сделано?", ENTER_PAYMENTS_MADE),
+    "payment": ("Введите желаемую переплату (в рублях):", ENTER_TARGET_OVERPAYMENT),
+}
+
+
+async def resume_pending_action(
+    update: Update, user_id: int, strategy: str | None
+) -> int:
+    """Продолжает сохранённое действие или показывает меню выбора."""
+
+    logger.info(
+        "Проверка сохранённого действия для пользователя {}: strategy={}",
+        user_id,
+        strategy,
+    )
+    if strategy in PENDING_ACTIONS:
+        question, state = PENDING_ACTIONS[strategy]
+        logger.info(
+            "У пользователя {} было выбрано действие '{}', переходим к вопросу: {}",
+            user_id,
+            strategy,
+            question,
+        )
+        await update.message.reply_text(question)
+        return state
+
+    logger.info(
+        "У пользователя {} не было выбрано действие заранее, показываем меню выбора",
+        user_id,
+    )
+    keyboard = get_main_menu_keyboard()
+    await update.message.reply_text("Выберите действие:", reply_markup=keyboard)
+    logger.info("График платежей показан пользователю {}, разговор завершён", user_id)
+    return ConversationHandler.END
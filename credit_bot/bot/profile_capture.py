@@ -0,0 +1,93 @@
+"""Сбор профиля одного запроса: шаги корутины, память и запись на диск."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Coroutine, Optional
+
+from credit_bot.bot.flamegraph import folded_stacks
+
+MEMORY_TOP = 20
+
+
+class _Yield:
+    """Передаёт циклу событий объект, которого ждёт профилируемая корутина."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __await__(self):
+        return (yield self.value)
+
+
+async def drive_profiled(
+    coroutine: Coroutine, profile: cProfile.Profile, busy: list[float]
+):
+    """Выполняет корутину, включая профилировщик только на время её шагов."""
+
+    value: object = None
+    error: Optional[BaseException] = None
+    while True:
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            if error is None:
+                awaited = coroutine.send(value)
+            else:
+                awaited = coroutine.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            profile.disable()
+            busy[0] += time.perf_counter() - started
+        try:
+            value, error = await _Yield(awaited), None
+        except BaseException as exc:  # отмена и ошибки возвращаются в корутину
+            value, error = None, exc
+
+
+class MemoryTracker:
+    """Снимки tracemalloc вокруг запросов; трассировка включена, пока они идут."""
+
+    def __init__(self) -> None:
+        self._active = 0
+
+    def start(self) -> tracemalloc.Snapshot:
+        """Включает трассировку при необходимости и делает исходный снимок."""
+
+        if self._active == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._active = 1
+        elif self._active:
+            self._active += 1
+        return tracemalloc.take_snapshot()
+
+    def stop(self, before: tracemalloc.Snapshot) -> list[str]:
+        """Возвращает крупнейшие приросты памяти с момента ``before``."""
+
+        stats = tracemalloc.take_snapshot().compare_to(before, "lineno")
+        if self._active:
+            self._active -= 1
+            if not self._active:
+                tracemalloc.stop()
+        return [str(stat) for stat in stats[:MEMORY_TOP]]
+
+
+def write_profile(
+    directory: Path, name: str, stats: pstats.Stats, allocations: list[str]
+) -> None:
+    """Дописывает свёрнутые стеки и аллокации в файлы обработчика."""
+
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / f"{name}.folded", "a", encoding="utf-8") as file:
+        file.writelines(f"{line}\n" for line in folded_stacks(stats))
+    if allocations:
+        with open(directory / f"{name}.memory.txt", "a", encoding="utf-8") as file:
+            file.write(f"# {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            file.writelines(f"{line}\n" for line in allocations)
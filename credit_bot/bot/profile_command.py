@@ -0,0 +1,63 @@
+"""Команда администратора /profile для управления профилированием."""
+
+from __future__ import annotations
+
+import os
+
+from loguru import logger
+from telegram import Update
+from telegram.ext import Application, CallbackContext, CommandHandler
+
+from credit_bot.bot.profiling import ALL_HANDLERS, profiler
+
+USAGE = (
+    "/profile — состояние\n"
+    "/profile on [доля] [обработчики...] — включить (по умолчанию все)\n"
+    "/profile off — выключить"
+)
+
+
+def _admin_ids() -> set[int]:
+    """Возвращает id администраторов из ADMIN_IDS (через запятую)."""
+
+    raw = os.getenv("ADMIN_IDS", "")
+    return {int(item) for item in raw.split(",") if item.strip().isdigit()}
+
+
+async def profile_command(update: Update, context: CallbackContext) -> None:
+    """Включает, выключает или показывает профилирование обработчиков."""
+
+    user_id = update.effective_user.id
+    if user_id not in _admin_ids():
+        return
+    args = context.args or []
+    if args and args[0] == "off":
+        profiler.targets.clear()
+    elif args and args[0] == "on":
+        try:
+            if len(args) > 1:
+                profiler.sample_rate = float(args[1].replace(",", "."))
+        except ValueError:
+            await update.message.reply_text(USAGE)
+            return
+        profiler.targets = set(args[2:]) or {ALL_HANDLERS}
+    elif args:
+        await update.message.reply_text(USAGE)
+        return
+    if args:
+        logger.info(
+            "Профилирование изменено пользователем {}: {}", user_id, profiler.targets
+        )
+    targets = ", ".join(sorted(profiler.targets)) or "выключено"
+    await update.message.reply_text(
+        f"Профилирование: {targets}\n"
+        f"Доля запросов: {profiler.sample_rate:g}\n"
+        f"Каталог: {profiler.directory}"
+    )
+
+
+def register_profiler(application: Application) -> None:
+    """Оборачивает обработчики профилировщиком и добавляет команду /profile."""
+
+    profiler.install(application)
+    application.add_handler(CommandHandler("profile", profile_command))
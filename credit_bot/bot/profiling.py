@@ -0,0 +1,131 @@
+"""Выборочное профилирование отдельных обработчиков бота."""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import os
+import pstats
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Coroutine
+
+from loguru import logger
+from telegram.ext import Application, BaseHandler
+
+from credit_bot.bot.executor import calculation_hook
+from credit_bot.bot.instrumentation import iter_handlers
+from credit_bot.bot.profile_capture import MemoryTracker, drive_profiled, write_profile
+
+ALL_HANDLERS = "*"
+DEFAULT_DIR = Path("profiles")
+DEFAULT_SAMPLE_RATE = 0.1
+
+
+class HandlerProfiler:
+    """Профилирует выборку вызовов заданных обработчиков.
+
+    Профилировщик включён только пока выполняется сама корутина обработчика,
+    поэтому параллельные апдейты в профиль не попадают. Время ожидания
+    (Telegram API, пул расчётов) выводится в сводке отдельно, а расчёты в
+    потоке пула профилируются там же и добавляются к профилю запроса. Для
+    каждого обработчика в ``directory`` дописываются свёрнутые стеки
+    ``<имя>.folded`` и при ``memory`` — топ аллокаций ``<имя>.memory.txt``
+    (tracemalloc общий для процесса и учитывает параллельные запросы).
+    """
+
+    def __init__(
+        self,
+        targets: set[str] = frozenset(),
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        directory: Path = DEFAULT_DIR,
+        memory: bool = False,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        self.targets = set(targets)
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.memory = memory
+        self._sampler = sampler
+        self._memory = MemoryTracker()
+
+    @classmethod
+    def from_env(cls) -> HandlerProfiler:
+        """Читает PROFILE_HANDLERS (имена через запятую или ``*``) и PROFILE_*."""
+
+        names = os.getenv("PROFILE_HANDLERS", "")
+        return cls(
+            targets={name.strip() for name in names.split(",") if name.strip()},
+            sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)),
+            directory=Path(os.getenv("PROFILE_DIR", str(DEFAULT_DIR))),
+            memory=os.getenv("PROFILE_MEMORY", "") == "1",
+        )
+
+    def should_profile(self, name: str) -> bool:
+        """Решает, профилировать ли очередной вызов обработчика."""
+
+        if name not in self.targets and ALL_HANDLERS not in self.targets:
+            return False
+        return self._sampler() < self.sample_rate
+
+    def install(self, application: Application) -> None:
+        """Оборачивает все обработчики; без целей обёртка ничего не делает."""
+
+        for _, handler in iter_handlers(application):
+            self._wrap(handler)
+
+    def _wrap(self, handler: BaseHandler) -> None:
+        callback: Callable[..., Any] = handler.callback
+        name = getattr(callback, "__name__", type(handler).__name__)
+
+        @functools.wraps(callback)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not self.should_profile(name):
+                return await callback(*args, **kwargs)
+            return await self.profile(name, callback(*args, **kwargs))
+
+        handler.callback = wrapper
+
+    async def profile(self, name: str, coroutine: Coroutine) -> Any:
+        """Выполняет корутину обработчика под профилировщиком."""
+
+        profile = cProfile.Profile()
+        workers: list[cProfile.Profile] = []
+
+        def in_worker(call: Callable[[], Any]) -> Any:
+            worker = cProfile.Profile()
+            try:
+                return worker.runcall(call)
+            finally:
+                workers.append(worker)
+
+        token = calculation_hook.set(in_worker)
+        memory = self._memory.start() if self.memory else None
+        busy = [0.0]
+        started = time.perf_counter()
+        try:
+            return await drive_profiled(coroutine, profile, busy)
+        finally:
+            calculation_hook.reset(token)
+            wall = time.perf_counter() - started
+            allocations = self._memory.stop(memory) if memory is not None else []
+            stats = pstats.Stats(profile)
+            for worker in workers:
+                stats.add(worker)
+            try:
+                write_profile(self.directory, name, stats, allocations)
+            except OSError as exc:
+                logger.warning("Не удалось сохранить профиль {}: {}", name, exc)
+            logger.info(
+                "Профиль {}: {:.1f} мс, из них в обработчике {:.1f} мс, "
+                "ожидание I/O и пула {:.1f} мс",
+                name,
+                wall * 1000,
+                busy[0] * 1000,
+                (wall - busy[0]) * 1000,
+            )
+
+
+# Профилировщик обработчиков: цели и доля выборки задаются окружением
+profiler = HandlerProfiler.from_env()
@@ -0,0 +1,36 @@
+"""Замер длительности запросов к Telegram Bot API."""
+
+from __future__ import annotations
+
+import time
+
+from telegram.ext import BaseRateLimiter
+
+from credit_bot.bot.metrics import Histogram, registry
+
+TELEGRAM_SECONDS = registry.register(
+    Histogram(
+        "credit_bot_telegram_request_seconds",
+        "Длительность запросов к Telegram Bot API.",
+        ("endpoint",),
+    )
+)
+
+
+class InstrumentedRateLimiter(BaseRateLimiter):
+    """Не ограничивает запросы, а замеряет их длительность по методам API."""
+
+    async def initialize(self) -> None:
+        """Ресурсы не нужны."""
+
+    async def shutdown(self) -> None:
+        """Ресурсы не нужны."""
+
+    async def process_request(
+        self, callback, args, kwargs, endpoint, data, rate_limit_args
+    ):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            return await callback(*args, **kwargs)
+        finally:
+            TELEGRAM_SECONDS.observe(time.perf_counter() - started, endpoint)
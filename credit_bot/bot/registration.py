@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+from telegram import Update
 from telegram.ext import (
     Application,
+    CallbackContext,
     CallbackQueryHandler,
     CommandHandler,
     ConversationHandler,
     MessageHandler,
+    TypeHandler,
     filters,
 )
 
-from credit_bot.bot.handlers import cancel, choose_action, handle_callback, start
+from credit_bot.bot.callback_handlers import handle_callback
+from credit_bot.bot.handlers import cancel, choose_action, start
 from credit_bot.bot.input_handlers import (
     calculate_start,
     enter_interest_rate,
@@ -29,6 +33,8 @@ from credit_bot.bot.payment_search_handlers import (
     enter_target_overpayment,
     enter_tolerance,
 )
+from credit_bot.bot.schedule_pages import show_schedule_page
+from credit_bot.bot.session import sessions
 from credit_bot.bot.states import (
     CHOOSE_ACTION,
     ENTER_EARLY_REPAYMENT_AMOUNT,
@@ -44,6 +50,13 @@ from credit_bot.bot.states import (
 )
 
 
+async def persist_session(update: Update, context: CallbackContext) -> None:
+    """Сохраняет сессию пользователя после обработки апдейта."""
+
+    if update.effective_user is not None:
+        await sessions.persist_async(update.effective_user.id)
+
+
 def register_handlers(application: Application) -> None:
     """Регистрирует все обработчики команд и сообщений."""
 
@@ -88,7 +101,9 @@ def register_handlers(application: Application) -> None:
                 MessageHandler(filters.TEXT & ~filters.COMMAND, enter_second_payments)
             ],
             ENTER_TARGET_OVERPAYMENT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, enter_target_overpayment)
+                MessageHandler(
+                    filters.TEXT & ~filters.COMMAND, enter_target_overpayment
+                )
             ],
             ENTER_TOLERANCE: [
                 MessageHandler(filters.TEXT & ~filters.COMMAND, enter_tolerance)
@@ -99,3 +114,6 @@ def register_handlers(application: Application) -> None:
 
     application.add_handler(CommandHandler("start", start))
     application.add_handler(conv_handler)
+    application.add_handler(CallbackQueryHandler(show_schedule_page, pattern="^page:"))
+    # Отдельная группа выполняется после обработки апдейта основными handler'ами
+    application.add_handler(TypeHandler(Update, persist_session), group=1)
@@ -0,0 +1,95 @@
+"""Постраничный просмотр помесячного графика через inline-кнопки."""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+from loguru import logger
+from telegram import Update
+from telegram.error import BadRequest
+from telegram.ext import CallbackContext
+
+from credit_bot.bot.executor import executor
+from credit_bot.bot.formatters import PAGE_ROWS, format_schedule_page, page_count
+from credit_bot.bot.keyboards import get_schedule_page_keyboard
+from credit_bot.core.calculator import CreditCalculator
+
+# Ограничение Telegram на длину callback_data, байты
+CALLBACK_DATA_LIMIT = 64
+
+calculator = CreditCalculator()
+
+
+def encode_loan(
+    amount: float, term_months: int, annual_interest_rate: float
+) -> Optional[str]:
+    """Кодирует параметры кредита для callback_data кнопок листания.
+
+    Сумма и ставка округляются с точностью ключа кэша (копейки и 1e-6
+    процента). Возвращает ``None``, если кнопка последней страницы
+    не уместится в лимит Telegram.
+    """
+
+    amount, rate = round(amount, 2), round(annual_interest_rate, 6)
+    loan_key = f"{amount!r}:{term_months}:{rate!r}"
+    last_page = max(1, -(-term_months // PAGE_ROWS)) - 1
+    if len(f"page:{loan_key}:{last_page}".encode()) > CALLBACK_DATA_LIMIT:
+        return None
+    return loan_key
+
+
+def decode_page(data: str) -> Optional[tuple[float, int, float, int]]:
+    """Разбирает ``page:<сумма>:<срок>:<ставка>:<страница>``."""
+
+    try:
+        _, amount_text, term_text, rate_text, page_text = data.split(":")
+        amount, rate = float(amount_text), float(rate_text)
+        term, page = int(term_text), int(page_text)
+    except ValueError:
+        return None
+    if not (math.isfinite(amount) and math.isfinite(rate)):
+        return None
+    if amount <= 0 or term <= 0 or rate < 0:
+        return None
+    return amount, term, rate, page
+
+
+def clamp_page(page: int, pages: int) -> int:
+    """Приводит номер страницы к диапазону ``0..pages - 1``."""
+
+    return min(max(page, 0), pages - 1)
+
+
+async def show_schedule_page(update: Update, context: CallbackContext) -> None:
+    """Показывает страницу графика, редактируя то же сообщение.
+
+    Параметры кредита передаются в callback_data, поэтому кнопки работают
+    и после сброса сессии. График берётся из кэша калькулятора, так что
+    листание не пересчитывает его заново.
+    """
+
+    query = update.callback_query
+    await query.answer()
+    parsed = decode_page(query.data)
+    if parsed is None:
+        logger.warning("Некорректные данные страницы графика: {}", query.data)
+        return
+    amount, term, rate, page = parsed
+    schedule = await executor.run(
+        calculator.generate_payment_schedule, amount, term, rate
+    )
+    pages = page_count(schedule)
+    page = clamp_page(page, pages)
+    loan_key = encode_loan(amount, term, rate)
+    keyboard = get_schedule_page_keyboard(loan_key, page, pages) if loan_key else None
+    try:
+        await query.edit_message_text(
+            format_schedule_page(schedule, page),
+            parse_mode="Markdown",
+            reply_markup=keyboard,
+        )
+    except BadRequest as exc:
+        # Повторное нажатие на ту же страницу: сообщение не изменилось
+        if "not modified" not in str(exc).lower():
+            raise
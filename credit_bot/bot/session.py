@@ -2,59 +2,121 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
-
-
-@dataclass
-class UserSession:
-    """Временные данные сессии пользователя."""
-
-    loan_amount: Optional[float] = None
-    term_months: Optional[int] = None
-    annual_interest_rate: Optional[float] = None
-    payments_made: Optional[int] = None
-    early_repayment_amount: Optional[float] = None
-    strategy: Optional[str] = None
-    secondary_amount: Optional[float] = None
-    secondary_payments: Optional[int] = None
-    target_overpayment: Optional[float] = None
-    tolerance: Optional[float] = None
-
-    def reset(self) -> None:
-        """Сбрасывает все поля сессии."""
-
-        self.loan_amount = None
-        self.term_months = None
-        self.annual_interest_rate = None
-        self.payments_made = None
-        self.early_repayment_amount = None
-        self.strategy = None
-        self.secondary_amount = None
-        self.secondary_payments = None
-        self.target_overpayment = None
-        self.tolerance = None
-
-
-class SessionStorage:
-    """Простое хранилище сессий в памяти."""
-
-    def __init__(self) -> None:
-        self._sessions: dict[int, UserSession] = {}
+import asyncio
+import os
+import time
+from typing import Callable, Optional
+
+from credit_bot.bot.session_backends import SessionBackend, backend_from_env
+from credit_bot.bot.session_cache import SessionCache
+from credit_bot.bot.session_io import SessionIO
+from credit_bot.bot.user_session import SESSION_FIELDS, UserSession
+
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class SessionStorage(SessionCache):
+    """Хранилище сессий с вытеснением по простою и лимиту записей.
+
+    В памяти держится не более ``max_entries`` недавно активных сессий
+    (LRU). Сессии, к которым не обращались дольше ``ttl_seconds``,
+    удаляются. Если задан ``backend``, вытесненные и сохранённые через
+    ``persist`` сессии записываются в него и подгружаются при следующем
+    обращении, в том числе после перезапуска бота. Обработчики бота
+    используют асинхронные методы: они обращаются к хранилищу в потоке.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[SessionBackend] = None,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(ttl_seconds, max_entries, track_evicted=backend is not None)
+        self.backend = backend
+        self._clock = clock
+        self._io = None if backend is None else SessionIO(backend, ttl_seconds, clock)
+
+    @classmethod
+    def from_env(cls) -> SessionStorage:
+        """Создаёт хранилище по переменным SESSION_TTL, SESSION_MAX_ENTRIES
+        и настройкам хранилища (см. ``backend_from_env``)."""
+
+        ttl = float(os.getenv("SESSION_TTL", DEFAULT_TTL_SECONDS))
+        return cls(
+            backend=backend_from_env(SESSION_FIELDS),
+            ttl_seconds=ttl if ttl > 0 else None,
+            max_entries=int(os.getenv("SESSION_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
 
     def get(self, user_id: int) -> UserSession:
         """Возвращает сессию пользователя, создавая новую при необходимости."""
 
-        if user_id not in self._sessions:
-            self._sessions[user_id] = UserSession()
-        return self._sessions[user_id]
+        now = self._clock()
+        expired = self._drop_expired(now)
+        session = self._cached(user_id)
+        if session is None:
+            session = self._build(self._io.load(user_id) if self._io else None, now)
+        evicted = self._admit(user_id, session, now)
+        if self._io is not None:
+            self._settle(evicted, self._io.store(expired, evicted))
+        return session
+
+    async def get_async(self, user_id: int) -> UserSession:
+        """Как ``get``, но читает и пишет хранилище в потоке, не блокируя цикл."""
+
+        if self._io is None:
+            return self.get(user_id)
+        now = self._clock()
+        expired = self._drop_expired(now)
+        session = self._cached(user_id)
+        if session is None:
+            record = await asyncio.to_thread(self._io.load, user_id)
+            session = self._build(record, now)
+        evicted = self._admit(user_id, session, now)
+        if expired or evicted:
+            failed = await asyncio.to_thread(self._io.store, expired, evicted)
+            self._settle(evicted, failed)
+        return session
+
+    def persist(self, user_id: int) -> None:
+        """Записывает сессию в постоянное хранилище, если оно задано."""
+
+        entry = self._sessions.get(user_id)
+        if entry is not None and self._io is not None:
+            session, touched_at = entry
+            changed = session.take_dirty()
+            if not self._io.write(user_id, changed, touched_at):
+                session.mark_dirty(changed)
+
+    async def persist_async(self, user_id: int) -> None:
+        """Как ``persist``, но пишет в хранилище в потоке, не блокируя цикл."""
+
+        entry = self._sessions.get(user_id)
+        if entry is None or self._io is None:
+            return
+        session, touched_at = entry
+        # Отметки снимаются в цикле событий, при ошибке записи возвращаются
+        changed = session.take_dirty()
+        if not await asyncio.to_thread(self._io.write, user_id, changed, touched_at):
+            session.mark_dirty(changed)
 
     def reset(self, user_id: int) -> None:
-        """Сбрасывает сессию пользователя."""
+        """Удаляет сессию пользователя из памяти и хранилища."""
 
-        if user_id in self._sessions:
-            self._sessions[user_id].reset()
+        self._forget(user_id)
+        if self._io is not None:
+            self._io.delete(user_id)
+
+    async def reset_async(self, user_id: int) -> None:
+        """Как ``reset``, но удаляет из хранилища в потоке, не блокируя цикл."""
+
+        self._forget(user_id)
+        if self._io is not None:
+            await asyncio.to_thread(self._io.delete, user_id)
 
 
 # Глобальное хранилище сессий, общее для всех модулей бота
-sessions = SessionStorage()
+sessions = SessionStorage.from_env()
@@ -0,0 +1,141 @@
+"""Хранилища сессий: интерфейс, память и SQLite."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Optional, Sequence
+
+# Поля сессии и сохранённое время последнего обращения
+SessionRecord = tuple[dict[str, object], float]
+
+
+class SessionBackend(ABC):
+    """Постоянное хранилище полей сессий пользователей."""
+
+    @abstractmethod
+    def load(self, user_id: int) -> Optional[SessionRecord]:
+        """Возвращает поля сессии и время обращения или ``None``."""
+
+    @abstractmethod
+    def save(self, user_id: int, fields: dict[str, object], touched_at: float) -> None:
+        """Сохраняет переданные поля сессии (остальные не меняются)."""
+
+    @abstractmethod
+    def delete(self, user_id: int) -> None:
+        """Удаляет сессию."""
+
+    @abstractmethod
+    def purge(self, older_than: float) -> int:
+        """Удаляет сессии, к которым не обращались с ``older_than``."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Возвращает число сохранённых сессий."""
+
+    def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
+
+
+class MemorySessionBackend(SessionBackend):
+    """Хранилище в памяти процесса (для разработки и тестов)."""
+
+    def __init__(self) -> None:
+        self._records: dict[int, SessionRecord] = {}
+
+    def load(self, user_id: int) -> Optional[SessionRecord]:
+        record = self._records.get(user_id)
+        return (dict(record[0]), record[1]) if record else None
+
+    def save(self, user_id: int, fields: dict[str, object], touched_at: float) -> None:
+        stored = self._records.get(user_id, ({}, 0.0))[0]
+        self._records[user_id] = ({**stored, **fields}, touched_at)
+
+    def delete(self, user_id: int) -> None:
+        self._records.pop(user_id, None)
+
+    def purge(self, older_than: float) -> int:
+        expired = [key for key, (_, at) in self._records.items() if at < older_than]
+        for user_id in expired:
+            del self._records[user_id]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class SqliteSessionBackend(SessionBackend):
+    """Хранилище в файле SQLite: отдельный столбец на каждое поле сессии."""
+
+    def __init__(self, path: str, columns: Sequence[str]) -> None:
+        self._columns = tuple(columns)
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        fields = ", ".join(f"{name} BLOB" for name in self._columns)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (user_id INTEGER PRIMARY KEY, "
+                f"touched_at REAL NOT NULL, {fields})"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS sessions_touched ON sessions(touched_at)"
+            )
+
+    def load(self, user_id: int) -> Optional[SessionRecord]:
+        query = f"SELECT touched_at, {', '.join(self._columns)} FROM sessions "
+        with self._lock:
+            row = self._db.execute(query + "WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(self._columns, row[1:])), row[0]
+
+    def save(self, user_id: int, fields: dict[str, object], touched_at: float) -> None:
+        unknown = set(fields) - set(self._columns)
+        if unknown:
+            raise ValueError(f"Неизвестные поля сессии: {sorted(unknown)}")
+        names = ["touched_at", *fields]
+        updates = ", ".join(f"{name} = excluded.{name}" for name in names)
+        statement = (
+            f"INSERT INTO sessions (user_id, {', '.join(names)}) "
+            f"VALUES (?{', ?' * len(names)}) "
+            f"ON CONFLICT(user_id) DO UPDATE SET {updates}"
+        )
+        with self._lock, self._db:
+            self._db.execute(statement, (user_id, touched_at, *fields.values()))
+
+    def delete(self, user_id: int) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
+
+    def purge(self, older_than: float) -> int:
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "DELETE FROM sessions WHERE touched_at < ?", (older_than,)
+            )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def backend_from_env(columns: Sequence[str]) -> Optional[SessionBackend]:
+    """Создаёт хранилище по переменным SESSION_BACKEND и SESSION_DB_PATH."""
+
+    kind = os.getenv("SESSION_BACKEND", "").strip().lower()
+    if kind == "sqlite":
+        path = os.getenv("SESSION_DB_PATH", "sessions.sqlite3")
+        return SqliteSessionBackend(path, columns)
+    if kind == "memory":
+        return MemorySessionBackend()
+    if kind:
+        raise ValueError(f"Неизвестное хранилище сессий: {kind}")
+    return None
@@ -0,0 +1,88 @@
+"""Сессии в памяти: LRU-очередь с вытеснением по простою и лимиту."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional
+
+from credit_bot.bot.session_backends import SessionRecord
+from credit_bot.bot.session_io import Evicted
+from credit_bot.bot.user_session import UserSession
+
+
+class SessionCache:
+    """Недавно активные сессии в памяти; обращений к хранилищу не делает.
+
+    Методы только меняют память и возвращают, что нужно удалить или
+    записать в хранилище, — это делает ``SessionStorage``.
+    """
+
+    def __init__(
+        self, ttl_seconds: Optional[float], max_entries: int, track_evicted: bool
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._track_evicted = track_evicted
+        self._sessions: OrderedDict[int, tuple[UserSession, float]] = OrderedDict()
+        # Вытесненные сессии, запись которых в хранилище ещё не завершена
+        self._evicting: dict[int, UserSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _forget(self, user_id: int) -> None:
+        """Убирает сессию пользователя из памяти."""
+
+        self._sessions.pop(user_id, None)
+        self._evicting.pop(user_id, None)
+
+    def _expired(self, touched_at: float, now: float) -> bool:
+        """Проверяет, истёк ли срок простоя сессии."""
+
+        return self.ttl_seconds is not None and now - touched_at > self.ttl_seconds
+
+    def _drop_expired(self, now: float) -> list[int]:
+        """Убирает из памяти простаивающие сессии с начала LRU-очереди."""
+
+        expired = []
+        while self._sessions:
+            user_id, (_, touched_at) = next(iter(self._sessions.items()))
+            if not self._expired(touched_at, now):
+                break
+            del self._sessions[user_id]
+            expired.append(user_id)
+        return expired
+
+    def _cached(self, user_id: int) -> Optional[UserSession]:
+        """Забирает сессию из памяти, в том числе ещё не записанную при вытеснении."""
+
+        entry = self._sessions.pop(user_id, None)
+        return entry[0] if entry else self._evicting.get(user_id)
+
+    def _build(self, record: Optional[SessionRecord], now: float) -> UserSession:
+        """Создаёт сессию из записи хранилища или пустую."""
+
+        if record is None or self._expired(record[1], now):
+            return UserSession()
+        return UserSession(**record[0])
+
+    def _admit(self, user_id: int, session: UserSession, now: float) -> list[Evicted]:
+        """Помещает сессию в конец LRU и вытесняет лишние сессии из памяти."""
+
+        self._sessions[user_id] = (session, now)
+        evicted = []
+        while len(self._sessions) > self.max_entries:
+            oldest, (old, touched_at) = self._sessions.popitem(last=False)
+            if self._track_evicted:
+                self._evicting[oldest] = old
+                evicted.append((oldest, old, old.take_dirty(), touched_at))
+        return evicted
+
+    def _settle(self, evicted: list[Evicted], failed: list[Evicted]) -> None:
+        """Завершает вытеснение: незаписанные поля снова отмечаются изменёнными."""
+
+        for _, session, changed, _ in failed:
+            session.mark_dirty(changed)
+        for user_id, session, _, _ in evicted:
+            if self._evicting.get(user_id) is session:
+                del self._evicting[user_id]
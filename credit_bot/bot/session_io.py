@@ -0,0 +1,76 @@
+"""Обращения к постоянному хранилищу сессий с журналированием ошибок."""
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Callable, Optional
+
+from loguru import logger
+
+from credit_bot.bot.session_backends import SessionBackend, SessionRecord
+from credit_bot.bot.user_session import UserSession
+
+# Как часто (в сохранениях) чистить устаревшие сессии в хранилище
+PURGE_EVERY = 1000
+
+# Вытесненная из памяти сессия: пользователь, сессия, изменённые поля, обращение
+Evicted = tuple[int, UserSession, dict[str, object], float]
+
+
+class SessionIO:
+    """Читает, пишет и удаляет сессии в ``backend``.
+
+    Ошибки хранилища журналируются и не прерывают обработку апдейта.
+    Методы блокирующие: из цикла событий их вызывают через
+    ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        backend: SessionBackend,
+        ttl_seconds: Optional[float],
+        clock: Callable[[], float],
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._saves = count(1)
+
+    def load(self, user_id: int) -> Optional[SessionRecord]:
+        """Читает сессию; ``None`` — если её нет или чтение не удалось."""
+
+        try:
+            return self.backend.load(user_id)
+        except Exception:
+            logger.exception("Не удалось загрузить сессию пользователя {}.", user_id)
+            return None
+
+    def delete(self, user_id: int) -> None:
+        """Удаляет сессию из хранилища."""
+
+        try:
+            self.backend.delete(user_id)
+        except Exception:
+            logger.exception("Не удалось удалить сессию пользователя {}.", user_id)
+
+    def write(
+        self, user_id: int, changed: dict[str, object], touched_at: float
+    ) -> bool:
+        """Пишет поля и чистит устаревшие записи; ``False`` — при ошибке."""
+
+        try:
+            self.backend.save(user_id, changed, touched_at)
+            saves = next(self._saves)
+            if self.ttl_seconds is not None and saves % PURGE_EVERY == 0:
+                self.backend.purge(self._clock() - self.ttl_seconds)
+        except Exception:
+            logger.exception("Не удалось сохранить сессию пользователя {}.", user_id)
+            return False
+        return True
+
+    def store(self, expired: list[int], evicted: list[Evicted]) -> list[Evicted]:
+        """Удаляет истёкшие и пишет вытесненные сессии; возвращает незаписанные."""
+
+        for user_id in expired:
+            self.delete(user_id)
+        return [entry for entry in evicted if not self.write(entry[0], *entry[2:])]
@@ -0,0 +1,149 @@
+"""Буферизованная запись отладочной телеметрии в JSONL."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+
+DEFAULT_PATH = Path(__file__).parent.parent.parent / ".cursor" / "debug.log"
+DEFAULT_CAPACITY = 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+
+class Telemetry:
+    """Кольцевой буфер событий с фоновой пакетной записью.
+
+    ``emit`` только кладёт запись в буфер и никогда не обращается к диску.
+    Фоновый поток раз в ``flush_interval`` секунд дописывает накопленное
+    одним вызовом ``write``. Если буфер переполнен, старые события
+    вытесняются (счётчик ``dropped``). При превышении ``max_bytes`` файл
+    переименовывается в ``.1`` (копии сдвигаются до ``backups``, минимум
+    одна). ``sample_rate`` задаёт долю сохраняемых событий.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_PATH,
+        capacity: int = DEFAULT_CAPACITY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        sample_rate: float = 1.0,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = max(backups, 1)
+        self.sample_rate = sample_rate
+        self.dropped = 0
+        self._sampler = sampler
+        self._buffer: deque[dict[str, object]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._write_failed = False
+
+    def emit(
+        self,
+        location: str,
+        message: str,
+        hypothesis_id: str = "",
+        data: Optional[dict[str, object]] = None,
+    ) -> None:
+        """Добавляет событие в буфер (без обращения к диску)."""
+
+        if self.sample_rate < 1.0 and self._sampler() >= self.sample_rate:
+            return
+        record = {
+            "sessionId": "debug-session",
+            "runId": "run1",
+            "hypothesisId": hypothesis_id,
+            "location": location,
+            "message": message,
+            "data": data or {},
+            "timestamp": int(time.time() * 1000),
+        }
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(record)
+        if self._thread is None:
+            self.start()
+
+    def start(self) -> None:
+        """Запускает фоновый поток записи."""
+
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Останавливает поток и дописывает остаток буфера."""
+
+        thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def flush(self) -> None:
+        """Записывает накопленные события одним пакетом."""
+
+        with self._lock:
+            records = list(self._buffer)
+            self._buffer.clear()
+        if not records:
+            return
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            for record in records
+        ).encode("utf-8")
+        try:
+            self._rotate_if_needed(len(payload))
+            with open(self.path, "ab") as file:
+                file.write(payload)
+        except OSError as exc:
+            # Телеметрия не должна мешать работе бота: сообщаем один раз
+            if not self._write_failed:
+                logger.warning("Не удалось записать телеметрию: {}", exc)
+                self._write_failed = True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def _rotate_if_needed(self, incoming: int) -> None:
+        """Сдвигает файлы журнала, если новый пакет превысит лимит."""
+
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size + incoming <= self.max_bytes:
+            return
+        for index in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+
+# Общая телеметрия бота: путь и доля сохраняемых событий задаются окружением
+telemetry = Telemetry(
+    path=os.getenv("TELEMETRY_PATH", str(DEFAULT_PATH)),
+    sample_rate=float(os.getenv("TELEMETRY_SAMPLE_RATE", "1.0")),
+)
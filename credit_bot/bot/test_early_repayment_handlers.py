@@ -0,0 +1,70 @@
+"""Тесты обработчиков сценария досрочного погашения."""
+
+import asyncio
+
+from telegram import Update
+from telegram.ext import ConversationHandler
+
+from .early_repayment_handlers import handle_strategy_callback
+from .session import sessions
+
+USER_ID = 424_242
+
+
+class RecordingBot:
+    """Бот, запоминающий вызовы Bot API вместо отправки в Telegram."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    async def answer_callback_query(self, **kwargs: object) -> bool:
+        self.calls.append(("answer_callback_query", kwargs))
+        return True
+
+    async def edit_message_text(self, **kwargs: object) -> bool:
+        self.calls.append(("edit_message_text", kwargs))
+        return True
+
+
+def make_callback(data: str, bot: RecordingBot) -> Update:
+    """Создаёт апдейт с нажатием inline-кнопки под сообщением бота."""
+
+    user = {"id": USER_ID, "is_bot": False, "first_name": "Test"}
+    message = {
+        "message_id": 10,
+        "date": 1_700_000_000,
+        "chat": {"id": USER_ID, "type": "private"},
+        "from": {"id": 1, "is_bot": True, "first_name": "bot"},
+        "text": "Выберите стратегию:",
+    }
+    query = {
+        "id": "1",
+        "from": user,
+        "chat_instance": "1",
+        "message": message,
+        "data": data,
+    }
+    return Update.de_json({"update_id": 1, "callback_query": query}, bot)
+
+
+def test_compare_button_edits_message_and_resets_session() -> None:
+    """Кнопка «Сравнить все» отвечает правкой сообщения и сбрасывает сессию."""
+
+    session = sessions.get(USER_ID)
+    session.loan_amount = 1_000_000
+    session.term_months = 120
+    session.annual_interest_rate = 12.0
+    session.payments_made = 12
+    session.early_repayment_amount = 100_000
+    bot = RecordingBot()
+
+    update = make_callback("strategy:compare", bot)
+    state = asyncio.run(handle_strategy_callback(update, None))
+
+    assert state == ConversationHandler.END
+    methods = [method for method, _ in bot.calls]
+    assert methods == ["answer_callback_query", "edit_message_text"]
+    edited = bot.calls[1][1]
+    assert edited["chat_id"] == USER_ID and edited["message_id"] == 10
+    assert edited["parse_mode"] == "Markdown"
+    assert sessions.get(USER_ID).loan_amount is None
@@ -0,0 +1,143 @@
+"""Тесты исполнителя расчётов."""
+
+import asyncio
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from .executor import (
+    MODE_INLINE,
+    MODE_PROCESS,
+    MODE_THREAD,
+    CalculationExecutor,
+    CalculationUnavailable,
+)
+
+
+@pytest.fixture()
+def release() -> Iterator[threading.Event]:
+    """Событие, которое отпускает зависшие в пуле расчёты после теста."""
+
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_queue_limit_rejects_extra_calculations(release: threading.Event) -> None:
+    """Расчёт сверх ``max_queue`` отклоняется сразу и учитывается в метриках."""
+
+    executor = CalculationExecutor(mode=MODE_THREAD, workers=1, max_queue=1)
+
+    async def scenario() -> None:
+        running = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(CalculationUnavailable):
+            await executor.run(sum, [1, 2])
+        release.set()
+        assert await running is True
+
+    asyncio.run(scenario())
+    executor.shutdown()
+    metrics = executor.metrics
+    assert (metrics.submitted, metrics.completed, metrics.rejected) == (1, 1, 1)
+    assert metrics.in_flight == 0
+
+
+def wait_idle(executor: CalculationExecutor) -> None:
+    """Ждёт, пока пул не освободит все слоты очереди."""
+
+    deadline = time.monotonic() + 5
+    while executor.metrics.in_flight and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_timeout_keeps_slot_until_job_finishes(release: threading.Event) -> None:
+    """После таймаута вызывающий получает отказ, но слот занят до конца расчёта."""
+
+    executor = CalculationExecutor(
+        mode=MODE_THREAD, workers=1, timeout=0.05, max_queue=1
+    )
+
+    async def scenario() -> None:
+        with pytest.raises(CalculationUnavailable):
+            await executor.run(release.wait)
+        with pytest.raises(CalculationUnavailable):
+            await executor.run(sum, [1, 2])
+
+    asyncio.run(scenario())
+    metrics = executor.metrics
+    assert (metrics.timeouts, metrics.rejected, metrics.completed) == (1, 1, 0)
+    assert (metrics.in_flight, metrics.abandoned) == (1, 1)
+    release.set()
+    wait_idle(executor)
+    executor.shutdown()
+    assert (metrics.in_flight, metrics.abandoned) == (0, 0)
+
+
+def test_metrics_and_observers() -> None:
+    """Метрики считают успешные и упавшие расчёты, наблюдатели видят результат."""
+
+    executor = CalculationExecutor(mode=MODE_INLINE)
+    seen: list[tuple[str, object]] = []
+    executor.observers.append(lambda name, elapsed, result: seen.append((name, result)))
+
+    async def scenario() -> None:
+        assert await executor.run(sum, [1, 2, 3]) == 6
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(divmod, 1, 0)
+
+    asyncio.run(scenario())
+    metrics = executor.metrics
+    assert (metrics.submitted, metrics.completed, metrics.failed) == (2, 1, 1)
+    assert (metrics.in_flight, metrics.max_in_flight) == (0, 1)
+    assert metrics.busy_seconds >= 0
+    assert seen == [("sum", 6)]
+
+
+def test_from_env_selects_mode_and_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Режим, пул, таймаут и очередь берутся из переменных CALC_*."""
+
+    monkeypatch.setenv("CALC_EXECUTOR", " Process ")
+    monkeypatch.setenv("CALC_WORKERS", "2")
+    monkeypatch.setenv("CALC_TIMEOUT", "0")
+    monkeypatch.setenv("CALC_MAX_QUEUE", "5")
+    executor = CalculationExecutor.from_env()
+    assert executor.mode == MODE_PROCESS
+    assert (executor.workers, executor.timeout, executor.max_queue) == (2, None, 5)
+
+    for name in ("CALC_EXECUTOR", "CALC_WORKERS", "CALC_TIMEOUT", "CALC_MAX_QUEUE"):
+        monkeypatch.delenv(name)
+    executor = CalculationExecutor.from_env()
+    assert (executor.mode, executor.workers, executor.timeout) == (
+        MODE_THREAD,
+        None,
+        30.0,
+    )
+
+
+def test_invalid_settings_are_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Неизвестный режим и пустая очередь отклоняются при создании."""
+
+    monkeypatch.setenv("CALC_EXECUTOR", "fiber")
+    with pytest.raises(ValueError):
+        CalculationExecutor.from_env()
+    with pytest.raises(ValueError):
+        CalculationExecutor(max_queue=0)
+
+
+def test_observer_errors_do_not_fail_calculation() -> None:
+    """Ошибка наблюдателя логируется и не превращается в ошибку расчёта."""
+
+    executor = CalculationExecutor(mode=MODE_THREAD, workers=1)
+
+    def broken(name: str, elapsed: float, result: object) -> None:
+        raise RuntimeError("observer is broken")
+
+    executor.observers.append(broken)
+    assert asyncio.run(executor.run(sum, [1, 2, 3])) == 6
+    wait_idle(executor)
+    executor.shutdown()
+    metrics = executor.metrics
+    assert (metrics.completed, metrics.failed, metrics.in_flight) == (1, 0, 0)
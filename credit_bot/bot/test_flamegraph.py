@@ -0,0 +1,24 @@
+"""Тесты свёрнутых стеков для flamegraph."""
+
+import cProfile
+import pstats
+
+from .flamegraph import folded_stacks
+
+
+def crunch(count: int) -> int:
+    return sum(number * number for number in range(count))
+
+
+def test_folded_stacks_are_well_formed() -> None:
+    """Каждая строка — непустые кадры через ``;`` и положительные микросекунды."""
+
+    profile = cProfile.Profile()
+    profile.runcall(crunch, 200_000)
+    lines = list(folded_stacks(pstats.Stats(profile)))
+    assert lines
+    for line in lines:
+        stack, microseconds = line.rsplit(" ", 1)
+        assert int(microseconds) > 0
+        assert all(frame and " " not in frame for frame in stack.split(";"))
+    assert any(line.startswith("test_flamegraph:crunch") for line in lines)
@@ -0,0 +1,53 @@
+"""Тесты разбора запросов встроенным HTTP-сервером."""
+
+import asyncio
+
+import pytest
+
+from .http_server import HttpServer, Request, Response
+
+# Больше буфера StreamReader по умолчанию (64 КиБ)
+LONG_VALUE = "x" * (128 * 1024)
+
+
+async def echo(request: Request) -> Response:
+    return 200, request.body, "text/plain"
+
+
+async def exchange(raw: bytes) -> str:
+    """Отправляет серверу сырые байты и возвращает строку статуса ответа."""
+
+    server = HttpServer("127.0.0.1", 0)
+    server.route("POST", "/echo", echo)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(raw)
+        await writer.drain()
+        status = await asyncio.wait_for(reader.readline(), 5)
+        writer.close()
+    finally:
+        await server.stop()
+    return status.decode("latin-1").strip()
+
+
+@pytest.mark.parametrize(
+    ("raw", "status"),
+    [
+        (b"POST /echo HTTP/1.1\r\nContent-Length: 2\r\n\r\nok", "200 OK"),
+        (b"POST /echo HTTP/1.1\r\nContent-Length: -5\r\n\r\n", "400 Bad Request"),
+        (b"POST /echo HTTP/1.1\r\nContent-Length: +2\r\n\r\nok", "400 Bad Request"),
+        (b"POST /echo\r\n\r\n", "400 Bad Request"),
+        (
+            f"POST /echo HTTP/1.1\r\nX-Long: {LONG_VALUE}\r\n\r\n".encode(),
+            "431 Request Header Fields Too Large",
+        ),
+        (f"POST /{LONG_VALUE} HTTP/1.1\r\n\r\n".encode(), "431"),
+        (b"POST /echo HTTP/1.1\r\nContent-Length: 99999999\r\n\r\n", "413"),
+    ],
+    ids=["ok", "negative", "signed", "no_version", "long_header", "long_path", "big"],
+)
+def test_malformed_requests_get_error_status(raw: bytes, status: str) -> None:
+    """Некорректный запрос получает код ошибки, а не обрыв соединения."""
+
+    assert asyncio.run(exchange(raw)).startswith(f"HTTP/1.1 {status}")
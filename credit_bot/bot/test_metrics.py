@@ -0,0 +1,110 @@
+"""Тесты метрик в текстовом формате Prometheus."""
+
+import asyncio
+
+import pytest
+
+from .executor import executor
+from .instrumentation import observe_calculation
+from .metrics import (
+    CallbackCounter,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    registry,
+)
+from .rate_limiter import TELEGRAM_SECONDS, InstrumentedRateLimiter
+
+
+def test_render_help_type_and_samples() -> None:
+    """У каждой метрики есть строки HELP и TYPE и значения по меткам."""
+
+    metrics = MetricsRegistry()
+    counter = metrics.register(Counter("app_events_total", "События.", ("kind",)))
+    metrics.register(Gauge("app_sessions", "Сессии.", lambda: 3))
+    metrics.register(CallbackCounter("app_rejected_total", "Отказы.", lambda: 5))
+    counter.inc("start")
+    counter.inc("start", amount=2)
+    assert metrics.render().splitlines() == [
+        "# HELP app_events_total События.",
+        "# TYPE app_events_total counter",
+        'app_events_total{kind="start"} 3.0',
+        "# HELP app_sessions Сессии.",
+        "# TYPE app_sessions gauge",
+        "app_sessions 3.0",
+        "# HELP app_rejected_total Отказы.",
+        "# TYPE app_rejected_total counter",
+        "app_rejected_total 5.0",
+    ]
+    with pytest.raises(ValueError):
+        metrics.register(Counter("app_events_total", "Дубликат."))
+
+
+def test_histogram_buckets_sum_and_count() -> None:
+    """Корзины гистограммы накопительные, с корзиной +Inf, суммой и числом."""
+
+    histogram = Histogram("app_seconds", "Длительность.", ("method",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "pay")
+    assert list(histogram.render())[2:] == [
+        'app_seconds_bucket{method="pay",le="0.1"} 2',
+        'app_seconds_bucket{method="pay",le="1.0"} 3',
+        'app_seconds_bucket{method="pay",le="+Inf"} 4',
+        'app_seconds_sum{method="pay"} 3.65',
+        'app_seconds_count{method="pay"} 4',
+    ]
+
+
+def test_label_values_and_help_are_escaped() -> None:
+    """Кавычки, обратные косые черты и переводы строк экранируются."""
+
+    counter = Counter("app_errors_total", "Ошибки\nпо типам \\ коду.", ("error",))
+    counter.inc('bad "value"\\\n')
+    assert list(counter.render()) == [
+        "# HELP app_errors_total Ошибки\\nпо типам \\\\ коду.",
+        "# TYPE app_errors_total counter",
+        'app_errors_total{error="bad \\"value\\"\\\\\\n"} 1.0',
+    ]
+
+
+def test_rejected_calculations_are_a_counter() -> None:
+    """Отказы исполнителя выгружаются счётчиком с суффиксом ``_total``."""
+
+    text = registry.render()
+    assert "# TYPE credit_bot_calculations_rejected_total counter" in text
+    expected = float(executor.metrics.rejected + executor.metrics.timeouts)
+    assert f"credit_bot_calculations_rejected_total {expected}" in text
+
+
+def test_observe_calculation_counts_rows_and_iterations() -> None:
+    """Наблюдатель учитывает строки графика и итерации подбора."""
+
+    observe_calculation("test_search", 0.2, {"evaluations": 3})
+    text = registry.render()
+    assert 'credit_bot_search_iterations_count{method="test_search"} 1' in text
+    assert 'credit_bot_calculation_seconds_count{method="test_search"} 1' in text
+
+
+def test_rate_limiter_times_requests() -> None:
+    """Длительность учитывается и для успешных, и для упавших запросов."""
+
+    limiter = InstrumentedRateLimiter()
+
+    async def request(value: int) -> int:
+        if value < 0:
+            raise RuntimeError("network down")
+        return value * 2
+
+    async def scenario() -> int:
+        await limiter.initialize()
+        result = await limiter.process_request(request, (21,), {}, "testOk", {}, None)
+        with pytest.raises(RuntimeError):
+            await limiter.process_request(request, (-1,), {}, "testFail", {}, None)
+        await limiter.shutdown()
+        return result
+
+    assert asyncio.run(scenario()) == 42
+    samples = "\n".join(TELEGRAM_SECONDS.render())
+    assert 'credit_bot_telegram_request_seconds_count{endpoint="testOk"} 1' in samples
+    assert 'credit_bot_telegram_request_seconds_count{endpoint="testFail"} 1' in samples
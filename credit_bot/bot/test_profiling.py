@@ -0,0 +1,145 @@
+"""Тесты выборочного профилирования обработчиков."""
+
+import asyncio
+import cProfile
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from telegram import Update
+from telegram.ext import Application, CommandHandler
+
+from .executor import MODE_THREAD, CalculationExecutor
+from .profile_capture import MemoryTracker, drive_profiled
+from .profile_command import profile_command
+from .profiling import HandlerProfiler, profiler
+
+
+class RecordingBot:
+    """Бот, запоминающий отправленные сообщения вместо отправки в Telegram."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send_message(self, **kwargs: object) -> bool:
+        self.sent.append(str(kwargs["text"]))
+        return True
+
+
+def make_command(user_id: int, text: str, bot: RecordingBot) -> Update:
+    """Создаёт апдейт с командой от пользователя ``user_id``."""
+
+    message = {
+        "message_id": 1,
+        "date": 1_700_000_000,
+        "chat": {"id": user_id, "type": "private"},
+        "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+        "text": text,
+    }
+    return Update.de_json({"update_id": 1, "message": message}, bot)
+
+
+def crunch(count: int) -> int:
+    return sum(number * number for number in range(count))
+
+
+def test_sampled_handler_writes_folded_stacks(tmp_path: Path) -> None:
+    """Выбранный вызов пишет профиль со стеками обработчика и потока пула."""
+
+    pool = CalculationExecutor(mode=MODE_THREAD, workers=1)
+
+    async def calculate(update: object, context: object) -> int:
+        await asyncio.sleep(0)
+        return await pool.run(crunch, 20_000)
+
+    application = Application.builder().token("123456:TEST").build()
+    application.add_handler(CommandHandler("calc", calculate))
+    HandlerProfiler({"calculate"}, 1.0, tmp_path, sampler=lambda: 0.0).install(
+        application
+    )
+    wrapped = application.handlers[0][0].callback
+    assert asyncio.run(wrapped(None, None)) == crunch(20_000)
+    pool.shutdown()
+
+    lines = (tmp_path / "calculate.folded").read_text(encoding="utf-8").splitlines()
+    stacks = [line.rsplit(" ", 1)[0] for line in lines]
+    assert any("test_profiling:calculate" in stack for stack in stacks)
+    assert any(stack.endswith("test_profiling:crunch") for stack in stacks)
+
+
+def test_unsampled_handler_is_not_profiled(tmp_path: Path) -> None:
+    """Невыбранные вызовы и обработчики вне целей не профилируются."""
+
+    sampled = HandlerProfiler({"calculate"}, 0.5, tmp_path, sampler=lambda: 0.7)
+    assert not sampled.should_profile("calculate")
+    assert not sampled.should_profile("other")
+    assert HandlerProfiler({"*"}, 0.5, sampler=lambda: 0.1).should_profile("other")
+
+
+def test_errors_and_cancellation_propagate() -> None:
+    """Ошибки и отмена проходят через ``drive_profiled`` в обе стороны."""
+
+    cleaned: list[str] = []
+
+    async def recovers() -> str:
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, divmod, 1, 0)
+        except ZeroDivisionError:
+            return "recovered"
+        return "unreachable"
+
+    async def fails() -> None:
+        await asyncio.sleep(0)
+        raise KeyError("broken")
+
+    async def waits() -> None:
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cleaned.append("finally")
+
+    async def scenario() -> None:
+        assert await drive_profiled(recovers(), cProfile.Profile(), [0.0]) == (
+            "recovered"
+        )
+        with pytest.raises(KeyError):
+            await drive_profiled(fails(), cProfile.Profile(), [0.0])
+        task = asyncio.create_task(drive_profiled(waits(), cProfile.Profile(), [0.0]))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert cleaned == ["finally"]
+
+
+def test_non_admin_profile_command_is_ignored(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Команду /profile выполняет только администратор из ADMIN_IDS."""
+
+    monkeypatch.setenv("ADMIN_IDS", "1, 42")
+    monkeypatch.setattr(profiler, "targets", set())
+    monkeypatch.setattr(profiler, "sample_rate", 0.1)
+    bot = RecordingBot()
+    context = SimpleNamespace(args=["on", "0,5"])
+
+    asyncio.run(profile_command(make_command(7, "/profile on 0,5", bot), context))
+    assert bot.sent == [] and profiler.targets == set()
+
+    asyncio.run(profile_command(make_command(42, "/profile on 0,5", bot), context))
+    assert profiler.targets == {"*"} and profiler.sample_rate == 0.5
+    assert len(bot.sent) == 1 and "Профилирование: *" in bot.sent[0]
+
+
+def test_memory_tracker_stops_after_last_request() -> None:
+    """Трассировка памяти выключается, только когда завершился последний запрос."""
+
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc уже включён снаружи")
+    tracker = MemoryTracker()
+    first, second = tracker.start(), tracker.start()
+    tracker.stop(first)
+    assert tracemalloc.is_tracing()
+    assert isinstance(tracker.stop(second), list)
+    assert not tracemalloc.is_tracing()
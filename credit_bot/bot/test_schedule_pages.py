@@ -0,0 +1,95 @@
+"""Тесты постраничного просмотра графика."""
+
+import pytest
+
+from credit_bot.core.calculator import CreditCalculator
+
+from .formatters import PAGE_ROWS, format_schedule_page, page_count
+from .keyboards import get_schedule_page_keyboard
+from .schedule_pages import CALLBACK_DATA_LIMIT, clamp_page, decode_page, encode_loan
+
+
+def page_targets(loan_key: str, page: int, pages: int) -> list[tuple[str, int]]:
+    """Возвращает подписи кнопок листания и номера страниц, куда они ведут."""
+
+    keyboard = get_schedule_page_keyboard(loan_key, page, pages)
+    return [
+        (button.text, int(button.callback_data.rsplit(":", 1)[1]))
+        for row in keyboard.inline_keyboard
+        for button in row
+    ]
+
+
+def test_loan_key_uses_cache_precision() -> None:
+    """Сумма и ставка кодируются с точностью ключа кэша и читаются обратно."""
+
+    loan_key = encode_loan(1_000_000.123456, 60, 10.123456789)
+    assert loan_key == "1000000.12:60:10.123457"
+    assert decode_page(f"page:{loan_key}:3") == (1_000_000.12, 60, 10.123457, 3)
+
+
+def test_callback_data_fits_telegram_limit() -> None:
+    """Все кнопки укладываются в 64 байта, слишком длинный ключ не создаётся."""
+
+    loan_key = encode_loan(98_765_432.19, 480, 17.987654)
+    pages = -(-480 // PAGE_ROWS)
+    for page in range(pages):
+        for row in get_schedule_page_keyboard(loan_key, page, pages).inline_keyboard:
+            for button in row:
+                assert len(button.callback_data.encode()) <= CALLBACK_DATA_LIMIT
+    assert encode_loan(1e15 + 0.1234, 10**20, 12.3456789) is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "page:abc:12:10.0:0",
+        "page:1000:12:10.0",
+        "page:1000:12.5:10.0:0",
+        "page:nan:12:10.0:0",
+        "page:1000:12:inf:0",
+        "page:-1000:12:10.0:0",
+        "page:1000:0:10.0:0",
+        "page:1000:12:-1.0:0",
+        "page:1000:12:10.0:0:1",
+    ],
+)
+def test_malformed_page_data_is_rejected(data: str) -> None:
+    """Повреждённые или недопустимые данные кнопки не разбираются."""
+
+    assert decode_page(data) is None
+
+
+def test_page_is_clamped_to_schedule() -> None:
+    """Номер страницы вне графика приводится к первой или последней."""
+
+    assert [clamp_page(page, 5) for page in (-3, 0, 2, 4, 10)] == [0, 0, 2, 4, 4]
+    assert clamp_page(7, 1) == 0
+
+
+def test_keyboard_on_edge_pages() -> None:
+    """На крайних страницах нет кнопок за пределы графика."""
+
+    assert page_targets("1.0:12:1.0", 0, 1) == []
+    assert page_targets("1.0:60:1.0", 0, 5) == [("▶️", 1), ("⏭", 4)]
+    assert page_targets("1.0:60:1.0", 1, 5) == [("◀️", 0), ("▶️", 2), ("⏭", 4)]
+    assert page_targets("1.0:60:1.0", 2, 5) == [
+        ("⏮", 0),
+        ("◀️", 1),
+        ("▶️", 3),
+        ("⏭", 4),
+    ]
+    assert page_targets("1.0:60:1.0", 4, 5) == [("⏮", 0), ("◀️", 3)]
+
+
+def test_schedule_page_shows_its_rows() -> None:
+    """Страница содержит ровно свои строки графика."""
+
+    schedule = CreditCalculator(cache=None).generate_payment_schedule(300_000, 30, 9.0)
+    assert page_count(schedule) == 3
+    first = format_schedule_page(schedule, 0)
+    last = format_schedule_page(schedule, 2)
+    numbers = [line.split()[0] for line in last.split("```")[1].splitlines()[2:]]
+    assert numbers == [str(number) for number in range(25, 31)]
+    assert "*Страница 3 из 3*" in last
+    assert "\n 12 " in first and "\n 13 " not in first
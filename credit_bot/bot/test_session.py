@@ -0,0 +1,103 @@
+"""Тесты хранилища сессий."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from .session import SessionStorage
+from .session_backends import MemorySessionBackend, SqliteSessionBackend
+from .user_session import SESSION_FIELDS
+
+
+class FakeClock:
+    """Управляемые часы для проверки простоя."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingBackend(MemorySessionBackend):
+    """Хранилище, отказывающее в записи."""
+
+    def save(self, user_id: int, fields: dict[str, object], touched_at: float) -> None:
+        raise OSError("disk is full")
+
+
+def test_idle_sessions_expire() -> None:
+    """Сессия, простоявшая дольше TTL, заменяется пустой в памяти и хранилище."""
+
+    clock, backend = FakeClock(), MemorySessionBackend()
+    storage = SessionStorage(backend=backend, ttl_seconds=60, clock=clock)
+    storage.get(1).loan_amount = 500_000.0
+    storage.persist(1)
+    clock.now += 30
+    assert storage.get(1).loan_amount == 500_000.0
+
+    clock.now += 61
+    assert storage.get(1).loan_amount is None
+    assert backend.load(1) is None
+
+
+def test_lru_eviction_moves_sessions_to_backend() -> None:
+    """Вытесненная по лимиту сессия сохраняется и подгружается обратно."""
+
+    clock, backend = FakeClock(), MemorySessionBackend()
+    storage = SessionStorage(backend=backend, max_entries=2, clock=clock)
+    storage.get(1).term_months = 120
+    storage.get(2)
+    storage.get(1)
+    storage.get(3)
+    assert len(storage) == 2
+    assert backend.load(2) is not None
+    assert backend.load(1) is None
+
+    storage.get(4)
+    assert backend.load(1)[0] == {"term_months": 120}
+    assert storage.get(1).term_months == 120
+
+
+def test_sqlite_partial_upsert_round_trip(tmp_path: Path) -> None:
+    """Частичные записи дополняют строку, не затирая остальные поля."""
+
+    path = str(tmp_path / "sessions.sqlite3")
+    backend = SqliteSessionBackend(path, SESSION_FIELDS)
+    backend.save(7, {"loan_amount": 1_000_000.0, "strategy": "combined"}, 10.0)
+    backend.save(7, {"term_months": 60}, 20.0)
+    backend.close()
+
+    backend = SqliteSessionBackend(path, SESSION_FIELDS)
+    fields, touched_at = backend.load(7)
+    assert touched_at == 20.0
+    assert fields["loan_amount"] == 1_000_000.0
+    assert fields["strategy"] == "combined"
+    assert fields["term_months"] == 60
+    assert fields["tolerance"] is None
+    assert backend.purge(older_than=30.0) == 1
+    assert len(backend) == 0
+    with pytest.raises(ValueError):
+        backend.save(7, {"unknown": 1}, 30.0)
+    backend.close()
+
+
+def test_persist_async_writes_in_thread() -> None:
+    """Асинхронное сохранение записывает изменённые поля в хранилище."""
+
+    backend = MemorySessionBackend()
+    storage = SessionStorage(backend=backend, clock=FakeClock())
+    storage.get(5).payments_made = 12
+    asyncio.run(storage.persist_async(5))
+    assert backend.load(5) == ({"payments_made": 12}, 1_000.0)
+
+
+def test_failed_write_keeps_fields_dirty() -> None:
+    """После ошибки записи поля остаются отмеченными для следующей попытки."""
+
+    storage = SessionStorage(backend=FailingBackend(), clock=FakeClock())
+    session = storage.get(5)
+    session.strategy = "reduce_term"
+    asyncio.run(storage.persist_async(5))
+    assert session.take_dirty() == {"strategy": "reduce_term"}
@@ -0,0 +1,85 @@
+"""Тесты обращений к хранилищу сессий вне цикла событий."""
+
+import asyncio
+import threading
+from typing import Optional
+
+from .session import SessionStorage
+from .session_backends import MemorySessionBackend, SessionRecord
+
+
+class BlockingBackend(MemorySessionBackend):
+    """Хранилище, которое держит чтение и удаление, пока не отпустят."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def load(self, user_id: int) -> Optional[SessionRecord]:
+        assert self.release.wait(timeout=5)
+        return super().load(user_id)
+
+    def delete(self, user_id: int) -> None:
+        assert self.release.wait(timeout=5)
+        super().delete(user_id)
+
+
+class BrokenBackend(MemorySessionBackend):
+    """Хранилище, в котором база заблокирована."""
+
+    def load(self, user_id: int) -> Optional[SessionRecord]:
+        raise OSError("database is locked")
+
+    def delete(self, user_id: int) -> None:
+        raise OSError("database is locked")
+
+
+def test_storage_io_does_not_block_event_loop() -> None:
+    """Пока хранилище занято, цикл событий продолжает обрабатывать задачи."""
+
+    backend = BlockingBackend()
+    backend.save(1, {"term_months": 60}, 1_000.0)
+    storage = SessionStorage(backend=backend, clock=lambda: 1_000.0)
+
+    async def scenario() -> None:
+        for call in (storage.get_async(1), storage.reset_async(1)):
+            task = asyncio.create_task(call)
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            backend.release.set()
+            await task
+            backend.release.clear()
+
+    asyncio.run(scenario())
+    assert len(backend) == 0 and len(storage) == 0
+
+
+def test_storage_errors_do_not_raise() -> None:
+    """Ошибки чтения и удаления журналируются, сессия начинается заново."""
+
+    storage = SessionStorage(backend=BrokenBackend())
+
+    async def scenario() -> None:
+        session = await storage.get_async(1)
+        assert session.loan_amount is None
+        await storage.reset_async(1)
+
+    asyncio.run(scenario())
+    assert storage.get(1).loan_amount is None
+    storage.reset(1)
+
+
+def test_async_eviction_writes_to_backend() -> None:
+    """Вытесненная сессия записывается в потоке и подгружается обратно."""
+
+    backend = MemorySessionBackend()
+    storage = SessionStorage(backend=backend, max_entries=1, clock=lambda: 1_000.0)
+
+    async def scenario() -> int:
+        (await storage.get_async(1)).term_months = 120
+        await storage.get_async(2)
+        assert backend.load(1) == ({"term_months": 120}, 1_000.0)
+        return (await storage.get_async(1)).term_months
+
+    assert asyncio.run(scenario()) == 120
+    assert len(storage) == 1
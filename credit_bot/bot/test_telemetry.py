@@ -0,0 +1,118 @@
+"""Тесты буферизованной телеметрии."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from .telemetry import Telemetry
+
+# Интервал, за который фоновый поток не успеет сработать сам во время теста
+NEVER = 3600.0
+
+Factory = Callable[..., Telemetry]
+
+
+class SignallingTelemetry(Telemetry):
+    """Телеметрия, сообщающая о каждой записи пакета."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.flushed = threading.Event()
+
+    def flush(self) -> None:
+        super().flush()
+        self.flushed.set()
+
+
+@pytest.fixture()
+def make_telemetry(tmp_path: Path) -> Iterator[Factory]:
+    """Создаёт телеметрию в ``tmp_path`` и останавливает её после теста."""
+
+    created: list[Telemetry] = []
+
+    def factory(cls: type[Telemetry] = Telemetry, **kwargs: object) -> Telemetry:
+        kwargs.setdefault("flush_interval", NEVER)
+        instance = cls(path=tmp_path / "debug.log", **kwargs)
+        created.append(instance)
+        return instance
+
+    yield factory
+    for instance in created:
+        instance.close()
+
+
+def read_messages(path: Path) -> list[str]:
+    """Возвращает сообщения событий из файла JSONL."""
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line)["message"] for line in lines]
+
+
+def test_overflow_drops_oldest_events(make_telemetry: Factory) -> None:
+    """При переполнении буфера вытесняются старые события и считаются потери."""
+
+    telemetry = make_telemetry(capacity=3)
+    for number in range(5):
+        telemetry.emit("test", f"event {number}")
+    telemetry.flush()
+    assert telemetry.dropped == 2
+    assert read_messages(telemetry.path) == ["event 2", "event 3", "event 4"]
+
+
+def test_sampling_keeps_share_of_events(make_telemetry: Factory) -> None:
+    """Сохраняются только события, для которых выборка меньше доли."""
+
+    draws = iter([0.1, 0.7, 0.49, 0.5])
+    telemetry = make_telemetry(sample_rate=0.5, sampler=lambda: next(draws))
+    for number in range(4):
+        telemetry.emit("test", f"event {number}")
+    telemetry.flush()
+    assert read_messages(telemetry.path) == ["event 0", "event 2"]
+
+
+def test_rotation_keeps_limited_backups(make_telemetry: Factory) -> None:
+    """Переполненный файл сдвигается в копии, старше ``backups`` удаляются."""
+
+    telemetry = make_telemetry(max_bytes=300, backups=2)
+    for number in range(4):
+        telemetry.emit("test", f"event {number}", data={"padding": "x" * 100})
+        telemetry.flush()
+    path = telemetry.path
+    assert read_messages(path) == ["event 3"]
+    assert read_messages(path.with_name("debug.log.1")) == ["event 2"]
+    assert read_messages(path.with_name("debug.log.2")) == ["event 1"]
+    assert not path.with_name("debug.log.3").exists()
+
+
+def test_close_flushes_and_stops_thread(make_telemetry: Factory) -> None:
+    """При остановке поток завершается, а остаток буфера записывается."""
+
+    telemetry = make_telemetry()
+    telemetry.emit("test", "last words")
+    thread = telemetry._thread
+    assert thread is not None and thread.is_alive()
+    assert not telemetry.path.exists()
+    telemetry.close()
+    assert not thread.is_alive()
+    assert read_messages(telemetry.path) == ["last words"]
+
+
+def test_background_thread_flushes_periodically(make_telemetry: Factory) -> None:
+    """Фоновый поток сам дописывает события без вызова ``flush``."""
+
+    telemetry = make_telemetry(SignallingTelemetry, flush_interval=0.01)
+    telemetry.emit("test", "background")
+    assert telemetry.flushed.wait(timeout=5)
+    assert read_messages(telemetry.path) == ["background"]
+
+
+def test_write_errors_do_not_raise(tmp_path: Path) -> None:
+    """Ошибка записи не прерывает работу, а только отмечается."""
+
+    telemetry = Telemetry(path=tmp_path / "missing" / "debug.log", flush_interval=NEVER)
+    telemetry.emit("test", "lost")
+    telemetry.close()
+    assert telemetry._write_failed
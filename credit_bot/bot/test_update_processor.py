@@ -0,0 +1,84 @@
+"""Тесты параллельной обработки апдейтов по пользователям."""
+
+import asyncio
+
+from telegram import Update
+
+from .update_processor import PerUserUpdateProcessor
+
+HANDLER_SECONDS = 0.2
+
+
+def make_update(update_id: int, user_id: int) -> Update:
+    """Создаёт текстовый апдейт от пользователя ``user_id``."""
+
+    return Update.de_json(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 1_700_000_000,
+                "chat": {"id": user_id, "type": "private"},
+                "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+                "text": "1000000",
+            },
+        },
+        None,
+    )
+
+
+async def replay(
+    processor: PerUserUpdateProcessor, updates: list[tuple[int, float]]
+) -> tuple[dict[int, float], list[tuple[int, int]], int]:
+    """Подаёт апдейты (пользователь, длительность) как ``Application``.
+
+    Возвращает время завершения последнего апдейта каждого пользователя,
+    порядок обработки и наибольшее число одновременных обработок.
+    """
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    finished: dict[int, float] = {}
+    order: list[tuple[int, int]] = []
+    peak = 0
+
+    async def handle(update_id: int, user_id: int, seconds: float) -> None:
+        nonlocal peak
+        peak = max(peak, processor.current_concurrent_updates)
+        order.append((user_id, update_id))
+        await asyncio.sleep(seconds)
+        finished[user_id] = loop.time() - started
+
+    tasks = [
+        asyncio.create_task(
+            processor.process_update(
+                make_update(update_id, user_id), handle(update_id, user_id, seconds)
+            )
+        )
+        for update_id, (user_id, seconds) in enumerate(updates)
+    ]
+    await asyncio.gather(*tasks)
+    return finished, order, peak
+
+
+def test_busy_user_does_not_delay_others() -> None:
+    """Очередь одного пользователя не занимает слоты, нужные другим."""
+
+    processor = PerUserUpdateProcessor(max_concurrent_updates=4)
+    updates = [(1, HANDLER_SECONDS)] * 5 + [(2, 0.0)]
+    finished, order, _ = asyncio.run(replay(processor, updates))
+    assert finished[2] < HANDLER_SECONDS / 2
+    assert [update_id for user_id, update_id in order if user_id == 1] == list(range(5))
+    assert processor.queue_lengths() == {}
+
+
+def test_concurrency_limit_is_respected() -> None:
+    """Одновременно обрабатывается не больше ``max_concurrent_updates`` апдейтов."""
+
+    processor = PerUserUpdateProcessor(max_concurrent_updates=3)
+    updates = [(user_id, 0.05) for user_id in range(10)]
+    finished, _, peak = asyncio.run(replay(processor, updates))
+    assert peak == 3
+    assert processor.max_concurrent_updates == 3
+    assert len(finished) == 10
+    assert processor.current_concurrent_updates == processor.pending_updates == 0
@@ -0,0 +1,77 @@
+"""Тесты отметок изменённых полей сессии."""
+
+from pathlib import Path
+
+from .session import SessionStorage
+from .session_backends import MemorySessionBackend, SqliteSessionBackend
+from .user_session import FIELD_BITS, SESSION_FIELDS, UserSession
+
+
+class RecordingBackend(SqliteSessionBackend):
+    """Хранилище SQLite, запоминающее поля каждой записи."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, SESSION_FIELDS)
+        self.writes: list[dict[str, object]] = []
+
+    def save(self, user_id: int, fields: dict[str, object], touched_at: float) -> None:
+        self.writes.append(dict(fields))
+        super().save(user_id, fields, touched_at)
+
+
+def test_setattr_marks_only_changed_field() -> None:
+    """Присваивание ставит бит своего поля; то же значение бит не ставит."""
+
+    session = UserSession(loan_amount=100.0)
+    assert session._dirty == 0
+    session.loan_amount = 100.0
+    assert session._dirty == 0
+    session.term_months = 24
+    assert session._dirty == FIELD_BITS["term_months"]
+    session.strategy = "reduce_term"
+    assert session._dirty == FIELD_BITS["term_months"] | FIELD_BITS["strategy"]
+
+
+def test_take_dirty_clears_marks() -> None:
+    """``take_dirty`` возвращает изменённые поля и снимает отметки."""
+
+    session = UserSession()
+    session.payments_made = 6
+    session.tolerance = 50.0
+    assert session.take_dirty() == {"payments_made": 6, "tolerance": 50.0}
+    assert session._dirty == 0
+    assert session.take_dirty() == {}
+
+
+def test_loaded_session_starts_clean() -> None:
+    """Сессия, загруженная из хранилища, не считается изменённой."""
+
+    backend = MemorySessionBackend()
+    backend.save(3, {"loan_amount": 750_000.0, "term_months": 36}, 0.0)
+    storage = SessionStorage(backend=backend, ttl_seconds=None)
+    session = storage.get(3)
+    assert session.loan_amount == 750_000.0
+    assert session._dirty == 0
+
+
+def test_only_dirty_fields_reach_sqlite(tmp_path: Path) -> None:
+    """В частичный upsert SQLite попадают только изменённые поля."""
+
+    backend = RecordingBackend(str(tmp_path / "sessions.sqlite3"))
+    storage = SessionStorage(backend=backend, ttl_seconds=None)
+    session = storage.get(9)
+    session.loan_amount = 2_000_000.0
+    session.annual_interest_rate = 11.0
+    storage.persist(9)
+    session.annual_interest_rate = 9.5
+    storage.persist(9)
+
+    assert backend.writes == [
+        {"loan_amount": 2_000_000.0, "annual_interest_rate": 11.0},
+        {"annual_interest_rate": 9.5},
+    ]
+    fields, _ = backend.load(9)
+    assert fields["loan_amount"] == 2_000_000.0
+    assert fields["annual_interest_rate"] == 9.5
+    assert fields["term_months"] is None
+    backend.close()
@@ -0,0 +1,124 @@
+"""Тесты приёма апдейтов через вебхук."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from telegram import Update
+from telegram.ext import Application
+
+from .http_server import HttpServer
+from .update_processor import PerUserUpdateProcessor
+from .webhook import SECRET_HEADER, make_webhook_handler
+from .webhook_config import WebhookConfig
+
+SECRET = "s3cret_token-42"
+UPDATE = {
+    "update_id": 1001,
+    "message": {
+        "message_id": 1,
+        "date": 1_700_000_000,
+        "chat": {"id": 7, "type": "private"},
+        "from": {"id": 7, "is_bot": False, "first_name": "Test"},
+        "text": "/start",
+    },
+}
+
+
+async def post_updates(
+    requests: list[dict[str, str | bytes]], max_pending: int = 100, busy: int = 0
+) -> tuple[list[int], list[int]]:
+    """Отправляет апдейт с заголовками ``requests``; возвращает статусы и очередь.
+
+    ``busy`` апдейтов заранее висят в процессоре, пока не закончатся запросы.
+    """
+
+    application = (
+        Application.builder()
+        .token("123456:TEST")
+        .concurrent_updates(PerUserUpdateProcessor(4))
+        .build()
+    )
+    config = WebhookConfig(
+        url="https://bot.example.org", secret_token=SECRET, max_pending=max_pending
+    )
+    server = HttpServer("127.0.0.1", 0)
+    server.route("POST", config.path, make_webhook_handler(application, config))
+    body = json.dumps(UPDATE)
+    release = asyncio.Event()
+    blocked = [
+        asyncio.create_task(
+            application.update_processor.process_update(
+                Update.de_json({**UPDATE, "update_id": number}, None), release.wait()
+            )
+        )
+        for number in range(busy)
+    ]
+    await server.start()
+    try:
+        url = f"http://127.0.0.1:{server.port}{config.path}"
+        statuses = []
+        async with httpx.AsyncClient() as client:
+            for headers in requests:
+                response = await client.post(url, content=body, headers=headers)
+                statuses.append(response.status_code)
+    finally:
+        release.set()
+        await asyncio.gather(*blocked)
+        await server.stop()
+    queued = []
+    while not application.update_queue.empty():
+        queued.append(application.update_queue.get_nowait().update_id)
+    return statuses, queued
+
+
+def test_only_updates_with_valid_secret_are_queued() -> None:
+    """Апдейт с верным секретом принимается, поддельные отклоняются с 403."""
+
+    statuses, queued = asyncio.run(
+        post_updates(
+            [
+                {SECRET_HEADER: SECRET},
+                {SECRET_HEADER: "forged"},
+                {SECRET_HEADER: "пароль".encode()},
+                {},
+            ]
+        )
+    )
+    assert statuses == [200, 403, 403, 403]
+    assert queued == [1001]
+
+
+def test_unfinished_updates_trigger_503() -> None:
+    """Сверх ``max_pending`` необработанных апдейтов вебхук отвечает 503.
+
+    Учитываются и апдейты в очереди приложения, и уже забранные процессором.
+    """
+
+    valid = {SECRET_HEADER: SECRET}
+    statuses, queued = asyncio.run(post_updates([valid] * 3, max_pending=2))
+    assert statuses == [200, 200, 503]
+    assert queued == [1001, 1001]
+
+    statuses, queued = asyncio.run(post_updates([valid], max_pending=2, busy=2))
+    assert statuses == [503]
+    assert queued == []
+
+
+def test_webhook_mode_requires_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Без WEBHOOK_SECRET режим вебхука не запускается."""
+
+    monkeypatch.setenv("BOT_MODE", "webhook")
+    monkeypatch.setenv("WEBHOOK_URL", "https://bot.example.org")
+    monkeypatch.delenv("WEBHOOK_SECRET", raising=False)
+    with pytest.raises(ValueError):
+        WebhookConfig.from_env()
+
+    monkeypatch.setenv("WEBHOOK_SECRET", SECRET)
+    assert WebhookConfig.from_env().secret_token == SECRET
+    with pytest.raises(ValueError):
+        WebhookConfig(url="https://bot.example.org", secret_token="")
+
+    monkeypatch.setenv("BOT_MODE", "polling")
+    assert WebhookConfig.from_env() is None
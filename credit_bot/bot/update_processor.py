@@ -0,0 +1,135 @@
+"""Параллельная обработка апдейтов с сохранением порядка для каждого пользователя."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from typing import Any, Awaitable, Hashable, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+DEFAULT_CONCURRENCY = 16
+# Размер семафора базового класса: он не должен ограничивать ожидающих
+UNBOUNDED = sys.maxsize
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """Обрабатывает апдейты разных пользователей параллельно, а апдейты одного
+    пользователя — строго по очереди.
+
+    Апдейты пользователя выстраиваются в очередь на ``asyncio.Lock``, который
+    будит ожидающих в порядке поступления; этого требует
+    ``ConversationHandler``. Слот из ``max_concurrent_updates`` апдейт берёт,
+    только дойдя до головы своей очереди, поэтому очередь одного занятого
+    пользователя не задерживает остальных. Семафор базового класса
+    (``process_update`` берёт его до вызова ``do_process_update``) создаётся
+    неограниченным.
+    """
+
+    def __init__(self, max_concurrent_updates: int = DEFAULT_CONCURRENCY) -> None:
+        super().__init__(UNBOUNDED)
+        if max_concurrent_updates < 1:
+            raise ValueError("Число параллельных апдейтов должно быть положительным.")
+        self._limit = max_concurrent_updates
+        self._slots = asyncio.Semaphore(max_concurrent_updates)
+        self._running = 0
+        self._accepted = 0
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._pending: dict[Hashable, int] = {}
+        self.max_queue_length = 0
+
+    @property
+    def max_concurrent_updates(self) -> int:
+        """Возвращает предел одновременно обрабатываемых апдейтов."""
+
+        # Базовый __init__ читает свойство до того, как задан собственный лимит
+        return getattr(self, "_limit", UNBOUNDED)
+
+    @property
+    def current_concurrent_updates(self) -> int:
+        """Возвращает число апдейтов, занимающих слот обработки."""
+
+        return self._running
+
+    @property
+    def pending_updates(self) -> int:
+        """Возвращает число принятых и ещё не обработанных апдейтов.
+
+        В отличие от ``current_concurrent_updates`` учитывает и апдейты,
+        ожидающие своей очереди или слота обработки.
+        """
+
+        return self._accepted
+
+    @staticmethod
+    def ordering_key(update: object) -> Optional[Hashable]:
+        """Возвращает ключ очереди: пользователь, иначе чат."""
+
+        if not isinstance(update, Update):
+            return None
+        if update.effective_user is not None:
+            return update.effective_user.id
+        if update.effective_chat is not None:
+            return ("chat", update.effective_chat.id)
+        return None
+
+    def queue_lengths(self) -> dict[Hashable, int]:
+        """Возвращает число апдейтов в обработке и ожидании по пользователям."""
+
+        return dict(self._pending)
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Ждёт завершения предыдущих апдейтов пользователя и обрабатывает свой."""
+
+        self._accepted += 1
+        try:
+            await self._process_in_order(update, coroutine)
+        finally:
+            self._accepted -= 1
+
+    async def _process_in_order(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Обрабатывает апдейт после предыдущих апдейтов того же пользователя."""
+
+        key = self.ordering_key(update)
+        if key is None:
+            await self._run(coroutine)
+            return
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        pending = self._pending.get(key, 0) + 1
+        self._pending[key] = pending
+        self.max_queue_length = max(self.max_queue_length, pending)
+        try:
+            async with lock:
+                await self._run(coroutine)
+        finally:
+            pending = self._pending[key] - 1
+            if pending:
+                self._pending[key] = pending
+            else:
+                # Очередь пользователя пуста: не держим замок в памяти
+                del self._pending[key]
+                del self._locks[key]
+
+    async def _run(self, coroutine: Awaitable[Any]) -> None:
+        """Обрабатывает апдейт, заняв слот из ``max_concurrent_updates``."""
+
+        async with self._slots:
+            self._running += 1
+            try:
+                await coroutine
+            finally:
+                self._running -= 1
+
+    async def initialize(self) -> None:
+        """Ничего не выделяет: замки создаются по мере надобности."""
+
+    async def shutdown(self) -> None:
+        """Очищает очереди пользователей."""
+
+        self._locks.clear()
+        self._pending.clear()
@@ -0,0 +1,63 @@
+"""Данные диалога одного пользователя."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Iterable, Optional
+
+
+@dataclass(slots=True)
+class UserSession:
+    """Временные данные сессии пользователя.
+
+    Класс со слотами: у объекта нет ``__dict__``, что заметно при сотнях
+    тысяч резидентных сессий. Изменённые после создания поля отмечаются
+    битами в целом числе ``_dirty`` (без отдельного множества на объект),
+    чтобы хранилище записывало только их.
+    """
+
+    loan_amount: Optional[float] = None
+    term_months: Optional[int] = None
+    annual_interest_rate: Optional[float] = None
+    payments_made: Optional[int] = None
+    early_repayment_amount: Optional[float] = None
+    strategy: Optional[str] = None
+    secondary_amount: Optional[float] = None
+    secondary_payments: Optional[int] = None
+    target_overpayment: Optional[float] = None
+    tolerance: Optional[float] = None
+    _dirty: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Пока __init__ не заполнил _dirty, поля присваиваются без отметок
+        dirty = getattr(self, "_dirty", None)
+        if dirty is not None and name in FIELD_BITS and getattr(self, name) != value:
+            object.__setattr__(self, "_dirty", dirty | FIELD_BITS[name])
+        object.__setattr__(self, name, value)
+
+    def reset(self) -> None:
+        """Сбрасывает все поля сессии."""
+
+        for name in SESSION_FIELDS:
+            setattr(self, name, None)
+
+    def mark_dirty(self, names: Iterable[str]) -> None:
+        """Помечает поля как изменённые."""
+
+        for name in names:
+            self._dirty |= FIELD_BITS[name]
+
+    def take_dirty(self) -> dict[str, object]:
+        """Возвращает изменённые поля и снимает с них отметку."""
+
+        dirty = self._dirty
+        self._dirty = 0
+        return {
+            name: getattr(self, name) for name, bit in FIELD_BITS.items() if dirty & bit
+        }
+
+
+SESSION_FIELDS = tuple(
+    item.name for item in fields(UserSession) if not item.name.startswith("_")
+)
+FIELD_BITS = {name: 1 << position for position, name in enumerate(SESSION_FIELDS)}
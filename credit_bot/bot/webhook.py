@@ -0,0 +1,98 @@
+"""Режим вебхука: приём апдейтов Telegram через локальный HTTP-сервер."""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import signal
+from typing import Optional
+
+from loguru import logger
+from telegram import Update
+from telegram.ext import Application
+
+from credit_bot.bot.http_server import Handler, HttpServer, Request, Response
+from credit_bot.bot.update_processor import PerUserUpdateProcessor
+from credit_bot.bot.webhook_config import WebhookConfig
+
+SECRET_HEADER = "x-telegram-bot-api-secret-token"
+
+
+def unfinished_updates(application: Application) -> int:
+    """Возвращает число принятых вебхуком, но ещё не обработанных апдейтов.
+
+    Очередь приложения почти всегда пуста: PTB сразу забирает апдейты из неё
+    в задачи процессора, поэтому учитываются и апдейты внутри процессора.
+    """
+
+    processor = application.update_processor
+    if isinstance(processor, PerUserUpdateProcessor):
+        in_progress = processor.pending_updates
+    else:
+        in_progress = processor.current_concurrent_updates
+    return application.update_queue.qsize() + in_progress
+
+
+def make_webhook_handler(application: Application, config: WebhookConfig) -> Handler:
+    """Создаёт обработчик POST-запросов Telegram."""
+
+    async def handle(request: Request) -> Response:
+        token = request.headers.get(SECRET_HEADER, "")
+        if not hmac.compare_digest(token.encode(), config.secret_token.encode()):
+            logger.warning("Отклонён апдейт вебхука с неверным секретом.")
+            return 403, b"", "text/plain"
+        if unfinished_updates(application) >= config.max_pending:
+            logger.warning("Очередь апдейтов переполнена, вебхук отвечает 503.")
+            return 503, b"", "text/plain"
+        try:
+            update = Update.de_json(json.loads(request.body), application.bot)
+        except (ValueError, TypeError, KeyError):
+            logger.warning("Получен некорректный апдейт от вебхука.")
+            return 400, b"", "text/plain"
+        await application.update_queue.put(update)
+        return 200, b"", "text/plain"
+
+    return handle
+
+
+def _stop_on_signals(stop: asyncio.Event) -> None:
+    """Завершает работу по SIGINT/SIGTERM, где это поддерживается."""
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows: остановка через KeyboardInterrupt
+            pass
+
+
+async def run_webhook(
+    application: Application,
+    config: WebhookConfig,
+    stop: Optional[asyncio.Event] = None,
+) -> None:
+    """Запускает приложение в режиме вебхука до сигнала остановки."""
+
+    stop = stop or asyncio.Event()
+    _stop_on_signals(stop)
+    server = HttpServer(config.listen, config.port)
+    server.route("POST", config.path, make_webhook_handler(application, config))
+    await application.initialize()
+    await application.start()
+    try:
+        await server.start()
+        await application.bot.set_webhook(
+            url=config.webhook_url,
+            secret_token=config.secret_token,
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True,
+            max_connections=config.max_connections,
+        )
+        logger.info("Вебхук установлен: {}", config.webhook_url)
+        await stop.wait()
+    finally:
+        await server.stop()
+        await application.stop()
+        await application.shutdown()
@@ -0,0 +1,66 @@
+"""Настройки режима вебхука."""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+MODE_WEBHOOK = "webhook"
+# Допустимый секрет по правилам Bot API (setWebhook, secret_token)
+SECRET_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,256}")
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookConfig:
+    """Параметры вебхука.
+
+    ``secret_token`` обязателен: без него любой, кто знает адрес, мог бы
+    подсовывать боту поддельные апдейты. ``max_pending`` ограничивает число
+    принятых, но ещё не обработанных апдейтов: сверх него сервер отвечает 503,
+    и Telegram повторит доставку позже. ``max_connections`` передаётся
+    Telegram и ограничивает число одновременных соединений с его стороны.
+    """
+
+    url: str
+    secret_token: str
+    listen: str = "0.0.0.0"
+    port: int = 8443
+    path: str = "/telegram"
+    max_pending: int = 100
+    max_connections: int = 40
+
+    def __post_init__(self) -> None:
+        if not SECRET_PATTERN.fullmatch(self.secret_token or ""):
+            raise ValueError(
+                "WEBHOOK_SECRET должен содержать 1-256 символов A-Z, a-z, 0-9, _ и -."
+            )
+
+    @property
+    def webhook_url(self) -> str:
+        """Возвращает публичный адрес вебхука."""
+
+        return self.url.rstrip("/") + self.path
+
+    @classmethod
+    def from_env(cls) -> Optional[WebhookConfig]:
+        """Читает настройки вебхука; ``None``, если BOT_MODE не webhook."""
+
+        if os.getenv("BOT_MODE", "polling").strip().lower() != MODE_WEBHOOK:
+            return None
+        url = os.getenv("WEBHOOK_URL")
+        if not url:
+            raise ValueError("Для режима webhook задайте WEBHOOK_URL.")
+        secret = os.getenv("WEBHOOK_SECRET")
+        if not secret:
+            raise ValueError("Для режима webhook задайте WEBHOOK_SECRET.")
+        return cls(
+            url=url,
+            secret_token=secret,
+            listen=os.getenv("WEBHOOK_LISTEN", "0.0.0.0"),
+            port=int(os.getenv("WEBHOOK_PORT", "8443")),
+            path=os.getenv("WEBHOOK_PATH", "/telegram"),
+            max_pending=int(os.getenv("WEBHOOK_MAX_PENDING", "100")),
+            max_connections=int(os.getenv("WEBHOOK_MAX_CONNECTIONS", "40")),
+        )
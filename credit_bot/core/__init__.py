@@ -2,6 +2,13 @@
 
 from .calculator import CreditCalculator
 from .models import EarlyRepayment, Loan, Payment, PaymentSchedule
+from .serialization import (
+    decode_result,
+    decode_schedule,
+    encode_result,
+    encode_schedule,
+)
+from .streaming import export_schedules, iter_schedule
 
 __all__ = [
     "CreditCalculator",
@@ -9,5 +16,11 @@ __all__ = [
     "Loan",
     "Payment",
     "PaymentSchedule",
+    "decode_result",
+    "decode_schedule",
+    "encode_result",
+    "encode_schedule",
+    "export_schedules",
+    "iter_schedule",
 ]
 
@@ -0,0 +1,70 @@
+"""Аналитический расчёт графика без помесячного перебора."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from .annuity_estimate import AnnuityEstimate
+from .helpers import build_schedule
+from .models import Payment, PaymentSchedule
+
+
+class AnalyticSchedule(AnnuityEstimate):
+    """График с O(1)-оценками итогов и ленивым точным расчётом.
+
+    Оценки ``estimated_*`` и ``estimate_row`` не строят строк графика.
+    Точные ``months``, ``total_*``, ``row`` и ``payments`` берутся
+    из помесячного расчёта, который выполняется при первом обращении.
+    """
+
+    __slots__ = ("_full",)
+
+    def __init__(
+        self,
+        principal: float,
+        monthly_percent: float,
+        monthly_payment: float,
+        months_limit: Optional[int] = None,
+    ) -> None:
+        self._full: Optional[PaymentSchedule] = None
+        super().__init__(principal, monthly_percent, monthly_payment, months_limit)
+
+    @property
+    def months(self) -> int:
+        """Возвращает точное количество месяцев в графике."""
+
+        return self.to_schedule().months
+
+    @property
+    def total_paid(self) -> float:
+        """Возвращает точную общую сумму выплат."""
+
+        return self.to_schedule().total_paid
+
+    @property
+    def total_interest(self) -> float:
+        """Возвращает точные суммарные проценты."""
+
+        return self.to_schedule().total_interest
+
+    def row(self, number: int) -> Payment:
+        """Возвращает точную строку графика по номеру платежа."""
+
+        if number < 1 or number > self.months:
+            raise IndexError("Номер платежа вне графика.")
+        return self.payments[number - 1]
+
+    @property
+    def payments(self) -> List[Payment]:
+        """Возвращает точный список строк, строя его при первом обращении."""
+
+        return self.to_schedule().payments
+
+    def to_schedule(self) -> PaymentSchedule:
+        """Материализует точный график через помесячный расчёт."""
+
+        if self._full is None:
+            self._full = build_schedule(
+                self._principal, self._rate, self._payment, self._limit
+            )
+        return self._full
@@ -0,0 +1,121 @@
+"""Оценка аннуитетного графика за O(1) по формуле остатка."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from .closed_form import annuity_balance, drift_bound, months_to_repay
+from .helpers import (
+    EPSILON,
+    ensure_positive,
+    iter_schedule_rows,
+    round_money,
+    schedule_step,
+)
+from .models import Payment
+
+# Сколько последних месяцев досчитывается точно, с копеечным округлением
+TAIL_MONTHS = 3
+
+
+class AnnuityEstimate:
+    """O(1)-оценки итогов и строк аннуитетного графика.
+
+    Начало графика восстанавливается по формуле остатка аннуитета, последние
+    ``TAIL_MONTHS`` месяцев досчитываются по правилам ``build_schedule``.
+    Копеечные округления начала не учитываются, поэтому оценки расходятся
+    с помесячным расчётом в пределах ``error_bound``.
+    """
+
+    __slots__ = (
+        "_principal",
+        "_rate",
+        "_payment",
+        "_limit",
+        "_start",
+        "_tail",
+    )
+
+    def __init__(
+        self,
+        principal: float,
+        monthly_percent: float,
+        monthly_payment: float,
+        months_limit: Optional[int] = None,
+    ) -> None:
+        self._principal = principal
+        self._rate = monthly_percent
+        self._payment = monthly_payment
+        self._limit = months_limit
+        self._tail: List[Payment] = []
+        self._start = 0
+        if principal > EPSILON:
+            ensure_positive(monthly_payment, "monthly_payment")
+            # Первый шаг проверяет, что платёж покрывает проценты
+            schedule_step(principal, monthly_percent, monthly_payment)
+            self._solve_tail()
+
+    def _solve_tail(self) -> None:
+        """Точно досчитывает последние месяцы графика."""
+
+        estimate = months_to_repay(self._principal, self._rate, self._payment)
+        if self._limit:
+            estimate = min(estimate, self._limit)
+        start = max(estimate - TAIL_MONTHS, 0)
+        rows = iter_schedule_rows(
+            self._balance_before(start + 1),
+            self._rate,
+            self._payment,
+            self._limit,
+            first_month=start + 1,
+        )
+        self._tail = [Payment(number, None, *values) for number, *values in rows]
+        self._start = start
+
+    def _balance_before(self, number: int) -> float:
+        """Возвращает остаток перед платежом с номером ``number``."""
+
+        if number <= 1:
+            return self._principal
+        return round_money(
+            annuity_balance(self._principal, self._rate, self._payment, number - 1)
+        )
+
+    @property
+    def estimated_months(self) -> int:
+        """Оценивает количество месяцев в графике за O(1)."""
+
+        return self._start + len(self._tail)
+
+    @property
+    def estimated_total_paid(self) -> float:
+        """Оценивает общую сумму выплат за O(1), с ошибкой до ``error_bound``."""
+
+        regular = self._start * round_money(self._payment)
+        return round_money(regular + sum(p.payment_amount for p in self._tail))
+
+    @property
+    def estimated_total_interest(self) -> float:
+        """Оценивает суммарные проценты за O(1), с ошибкой до ``error_bound``."""
+
+        if not self._tail:
+            return 0.0
+        return round_money(self.estimated_total_paid - self._principal)
+
+    @property
+    def error_bound(self) -> float:
+        """Оценка сверху расхождения остатка с помесячным расчётом, в рублях."""
+
+        return drift_bound(self._rate, self._start)
+
+    def estimate_row(self, number: int) -> Payment:
+        """Оценивает строку графика по номеру платежа за O(1)."""
+
+        if number < 1 or number > self.estimated_months:
+            raise IndexError("Номер платежа вне графика.")
+        if number > self._start:
+            return self._tail[number - self._start - 1]
+        payment_value, principal_part, interest, balance = schedule_step(
+            self._balance_before(number), self._rate, self._payment
+        )
+        return Payment(number, None, payment_value, principal_part, interest, balance)
@@ -0,0 +1,146 @@
+"""Векторизованный расчёт графиков для множества кредитов за один проход."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .helpers import EPSILON, MONTHS_IN_YEAR
+from .log_limits import log_exception
+from .models import Payment, PaymentSchedule
+
+# Окрестность половины копейки, в которой округление перепроверяется через round()
+TIE_GUARD = 1e-6
+
+
+def round_money_array(values: np.ndarray) -> np.ndarray:
+    """Векторный аналог ``round_money`` с побитово совпадающим результатом."""
+
+    shifted = values + EPSILON
+    scaled = shifted * 100
+    result = np.rint(scaled) / 100
+    distance = np.abs(scaled - np.floor(scaled) - 0.5)
+    suspicious = distance < TIE_GUARD + np.abs(scaled) * 1e-14
+    if suspicious.any():
+        # Вблизи половины копейки решение принимает встроенный round()
+        result[suspicious] = [round(float(value), 2) for value in shifted[suspicious]]
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleBatch:
+    """Графики нескольких кредитов: строки — кредиты, столбцы — месяцы."""
+
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    balance: np.ndarray
+    months: np.ndarray
+
+    @property
+    def total_paid(self) -> np.ndarray:
+        """Возвращает общую сумму выплат по каждому кредиту."""
+
+        return self.payment.sum(axis=1)
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        """Возвращает суммарные проценты по каждому кредиту."""
+
+        return self.interest.sum(axis=1)
+
+    def schedule(self, index: int) -> PaymentSchedule:
+        """Возвращает график одного кредита в виде ``PaymentSchedule``."""
+
+        rows = zip(
+            self.payment[index].tolist(),
+            self.principal[index].tolist(),
+            self.interest[index].tolist(),
+            self.balance[index].tolist(),
+        )
+        payments = [
+            Payment(number, None, payment, principal, interest, balance)
+            for number, (payment, principal, interest, balance) in enumerate(rows, 1)
+            if number <= self.months[index]
+        ]
+        return PaymentSchedule(payments=payments)
+
+
+def annuity_payments(
+    amounts: np.ndarray, terms: np.ndarray, monthly_percent: np.ndarray
+) -> np.ndarray:
+    """Возвращает аннуитетные платежи так же, как ``calculate_annuity_payment``."""
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        factor = (1 + monthly_percent) ** terms
+        coefficient = monthly_percent * factor / (factor - 1)
+        raw = np.where(monthly_percent == 0, amounts / terms, amounts * coefficient)
+    if not np.isfinite(raw).all():
+        raise ValueError("Некорректные параметры для расчёта платежа.")
+    return round_money_array(raw)
+
+
+def generate_schedules_batch(
+    amounts: Sequence[float],
+    terms: Sequence[int],
+    annual_rates: Sequence[float],
+) -> ScheduleBatch:
+    """Строит аннуитетные графики для массива кредитов одним векторным проходом."""
+
+    try:
+        amount = np.asarray(amounts, dtype=np.float64)
+        term = np.asarray(terms, dtype=np.int64)
+        rate = np.asarray(annual_rates, dtype=np.float64)
+        if amount.ndim != 1 or not amount.shape == term.shape == rate.shape:
+            raise ValueError("Параметры кредитов должны быть массивами одной длины.")
+        if (amount <= 0).any() or (term <= 0).any():
+            raise ValueError("Сумма и срок кредита должны быть положительными.")
+        if (rate < 0).any():
+            raise ValueError("Ставка не может быть отрицательной.")
+        monthly_percent = rate / 100 / MONTHS_IN_YEAR
+        payment = annuity_payments(amount, term, monthly_percent)
+        return _simulate(amount, term, monthly_percent, payment)
+    except ValueError:
+        log_exception("Ошибка при пакетном расчёте графиков.")
+        raise
+
+
+def _simulate(
+    balance: np.ndarray,
+    terms: np.ndarray,
+    monthly_percent: np.ndarray,
+    monthly_payment: np.ndarray,
+) -> ScheduleBatch:
+    """Повторяет шаги ``build_schedule`` сразу для всех кредитов."""
+
+    if (monthly_payment <= 0).any():
+        raise ValueError("Параметр 'monthly_payment' должен быть положительным.")
+    regular = round_money_array(monthly_payment)
+    count = balance.shape[0]
+    width = int(terms.max()) if count else 0
+    columns = [np.zeros((count, width)) for _ in range(4)]
+    months = np.zeros(count, dtype=np.int64)
+    for month in range(1, width + 1):
+        active = balance > EPSILON
+        if not active.any():
+            break
+        interest = round_money_array(balance * monthly_percent)
+        principal_part = round_money_array(monthly_payment - interest)
+        if (principal_part[active] <= 0).any():
+            raise ValueError("Размер платежа должен покрывать проценты.")
+        is_last = terms == month
+        closing = (principal_part > balance) | (is_last & (principal_part < balance))
+        principal_part = np.where(closing, balance, principal_part)
+        payment = np.where(
+            closing, round_money_array(principal_part + interest), regular
+        )
+        new_balance = round_money_array(balance - principal_part)
+        for column, values in zip(
+            columns, (payment, principal_part, interest, np.maximum(new_balance, 0.0))
+        ):
+            column[:, month - 1] = np.where(active, values, 0.0)
+        balance = np.where(active, new_balance, balance)
+        months += active
+    return ScheduleBatch(*columns, months=months)
@@ -0,0 +1,134 @@
+"""Ограниченный LRU/TTL-кэш результатов расчётов."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Hashable, Optional, TypeVar
+
+from .models import Payment, PaymentSchedule
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 3600.0
+# Оценка размера строки графика: объект Payment и пять чисел внутри
+PAYMENT_BYTES = sys.getsizeof(Payment(1, None, 0.0, 0.0, 0.0, 0.0)) + 5 * 24
+
+
+def normalize_loan_key(
+    kind: str, amount: float, term_months: int, annual_interest_rate: float
+) -> tuple[Hashable, ...]:
+    """Приводит параметры кредита к ключу кэша: копейки и 1e-6 процента."""
+
+    return kind, round(amount, 2), int(term_months), round(annual_interest_rate, 6)
+
+
+def estimate_size(value: object) -> int:
+    """Оценивает занимаемую значением память в байтах."""
+
+    if isinstance(value, PaymentSchedule):
+        return sys.getsizeof(value.payments) + value.months * PAYMENT_BYTES
+    return sys.getsizeof(value)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Счётчики работы кэша."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class CalculationCache:
+    """Потокобезопасный LRU-кэш с TTL, лимитом записей и лимитом в байтах."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[object, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Возвращает суммарную оценку размера записей."""
+
+        return self._bytes
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Возвращает значение из кэша или вычисляет и сохраняет его."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[2]):
+                self._discard(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]  # type: ignore[return-value]
+            self.stats.misses += 1
+        # Расчёт выполняется вне блокировки, чтобы не задерживать другие потоки
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Сохраняет значение, вытесняя самые старые записи при переполнении."""
+
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Очищает кэш, сохраняя счётчики."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _expired(self, stored_at: float) -> bool:
+        """Проверяет, истёк ли срок жизни записи."""
+
+        return self.ttl_seconds is not None and (
+            self._clock() - stored_at > self.ttl_seconds
+        )
+
+    def _discard(self, key: Hashable) -> None:
+        """Удаляет запись и уменьшает занятый объём."""
+
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+# Общий кэш ядра: базовые графики и аннуитетные платежи
+calculation_cache = CalculationCache()
@@ -2,48 +2,94 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Dict, List
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, TextIO
 
+from .columnar import ColumnarSchedule
+from .comparison import StrategyComparison, compare_strategies
 from .early_repayment import apply_early_repayment
-from .models import EarlyRepayment, PaymentSchedule
-from .payment_logic import calculate_annuity_payment, generate_payment_schedule
-from .payment_search import find_payment_for_target_overpayment
-from .strategy_search import find_optimal_strategy_by_overpayment
+from .incremental import RepaymentScenario
+from .models import EarlyRepayment, Loan, Payment, PaymentSchedule, PaymentType
+from .payment_search import SEARCH_NEWTON, find_payment_for_target_overpayment
+from .payment_types import PaymentTypeComparison, compare_payment_types
+from .schedule_service import ScheduleService
+from .strategy_search import (
+    DEFAULT_MAX_EVALUATIONS,
+    find_optimal_strategy_by_overpayment,
+)
+from .streaming import EXPORT_CSV, export_schedules, iter_schedule
 
+PAYMENT_FIELDS = tuple(field.name for field in fields(Payment))
 
-class CreditCalculator:
+
+class CreditCalculator(ScheduleService):
     """Сервисный класс, объединяющий расчётные функции."""
 
-    def calculate_annuity_payment(
+    def apply_early_repayment(
         self,
-        amount: float,
-        term_months: int,
-        annual_interest_rate: float,
-    ) -> float:
-        """Возвращает аннуитетный платёж."""
+        current_schedule: PaymentSchedule,
+        repayment: EarlyRepayment,
+        payments_made: int,
+        payment_type: PaymentType = PaymentType.ANNUITY,
+    ) -> Dict[str, object]:
+        """Перерасчитывает график после досрочного платежа."""
 
-        return calculate_annuity_payment(amount, term_months, annual_interest_rate)
+        return apply_early_repayment(
+            current_schedule, repayment, payments_made, payment_type
+        )
 
-    def generate_payment_schedule(
+    def iter_schedule(
         self,
         amount: float,
         term_months: int,
         annual_interest_rate: float,
-    ) -> PaymentSchedule:
-        """Генерирует график платежей."""
+    ) -> Iterator[Payment]:
+        """Выдаёт строки графика по одной, без построения списка."""
 
-        return generate_payment_schedule(amount, term_months, annual_interest_rate)
+        return iter_schedule(amount, term_months, annual_interest_rate)
 
-    def apply_early_repayment(
+    def export_schedules(
+        self, loans: Iterable[Loan], stream: TextIO, fmt: str = EXPORT_CSV
+    ) -> int:
+        """Потоково выгружает графики кредитов в CSV или JSONL."""
+
+        return export_schedules(loans, stream, fmt)
+
+    def create_repayment_scenario(
         self,
         current_schedule: PaymentSchedule,
         repayment: EarlyRepayment,
+    ) -> RepaymentScenario:
+        """Создаёт сценарий досрочки для быстрого перебора сумм и дат."""
+
+        return RepaymentScenario(current_schedule, repayment)
+
+    def compare_strategies(
+        self,
+        loan: Loan,
+        repayment_amount: float,
         payments_made: int,
-    ) -> Dict[str, object]:
-        """Перерасчитывает график после досрочного платежа."""
+    ) -> StrategyComparison:
+        """Сравнивает все стратегии досрочки на общем базовом графике."""
 
-        return apply_early_repayment(current_schedule, repayment, payments_made)
+        generate = (
+            self.generate_differentiated_schedule
+            if loan.payment_type == PaymentType.DIFFERENTIATED
+            else self.generate_payment_schedule
+        )
+        base_schedule = generate(
+            loan.amount, loan.term_months, loan.annual_interest_rate
+        )
+        return compare_strategies(
+            loan, repayment_amount, payments_made, base_schedule=base_schedule
+        )
+
+    def compare_payment_types(
+        self, amount: float, term_months: int, annual_interest_rate: float
+    ) -> PaymentTypeComparison:
+        """Сравнивает аннуитетную и дифференцированную схемы за O(1)."""
+
+        return compare_payment_types(amount, term_months, annual_interest_rate)
 
     def find_optimal_strategy_by_overpayment(
         self,
@@ -53,6 +99,8 @@ class CreditCalculator:
         target_overpayment: float,
         repayment_strategy: EarlyRepayment,
         tolerance: float = 100.0,
+        max_evaluations: int = DEFAULT_MAX_EVALUATIONS,
+        payment_type: PaymentType = PaymentType.ANNUITY,
     ) -> Dict[str, object]:
         """Находит сумму досрочки под заданную переплату."""
 
@@ -63,6 +111,8 @@ class CreditCalculator:
             target_overpayment=target_overpayment,
             repayment_strategy=repayment_strategy,
             tolerance=tolerance,
+            max_evaluations=max_evaluations,
+            payment_type=payment_type,
         )
 
     def calculate_payment_by_target_overpayment(
@@ -71,6 +121,7 @@ class CreditCalculator:
         annual_interest_rate: float,
         target_overpayment: float,
         tolerance: float = 100.0,
+        method: str = SEARCH_NEWTON,
     ) -> Dict[str, float]:
         """Подбирает размер платежа для заданной переплаты."""
 
@@ -79,11 +130,17 @@ class CreditCalculator:
             annual_interest_rate=annual_interest_rate,
             target_overpayment=target_overpayment,
             tolerance=tolerance,
+            method=method,
         )
 
 
-def schedule_to_dict(schedule: PaymentSchedule) -> List[Dict[str, object]]:
+def schedule_to_dict(
+    schedule: PaymentSchedule | ColumnarSchedule,
+) -> List[Dict[str, object]]:
     """Преобразует график платежей в список словарей."""
 
-    return [asdict(payment) for payment in schedule.payments]
-
+    # Поля Payment плоские, поэтому глубокое копирование asdict не нужно
+    return [
+        {name: getattr(payment, name) for name in PAYMENT_FIELDS}
+        for payment in schedule.payments
+    ]
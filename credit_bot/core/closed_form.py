@@ -0,0 +1,49 @@
+"""Формулы аннуитета в замкнутой форме."""
+
+from __future__ import annotations
+
+import math
+
+from .helpers import EPSILON
+
+# Максимальная ошибка округления процентов за один месяц
+ROUNDING_STEP = 0.005
+
+
+def annuity_balance(
+    principal: float,
+    monthly_percent: float,
+    monthly_payment: float,
+    months: int,
+) -> float:
+    """Возвращает остаток долга после ``months`` платежей без округлений."""
+
+    if monthly_percent == 0:
+        return principal - monthly_payment * months
+    growth = (1 + monthly_percent) ** months
+    return principal * growth - monthly_payment * (growth - 1) / monthly_percent
+
+
+def months_to_repay(
+    principal: float,
+    monthly_percent: float,
+    monthly_payment: float,
+) -> int:
+    """Оценивает число платежей до полного погашения по формуле аннуитета."""
+
+    if monthly_percent == 0:
+        return max(math.ceil(principal / monthly_payment - EPSILON), 1)
+    ratio = 1 - monthly_percent * principal / monthly_payment
+    if ratio <= 0:
+        raise ValueError("Размер платежа должен покрывать проценты.")
+    months = -math.log(ratio) / math.log1p(monthly_percent)
+    return max(math.ceil(months - EPSILON), 1)
+
+
+def drift_bound(monthly_percent: float, months: int) -> float:
+    """Оценивает сверху накопленную ошибку округления остатка, в рублях."""
+
+    if monthly_percent == 0:
+        return ROUNDING_STEP
+    growth = (1 + monthly_percent) ** months
+    return ROUNDING_STEP * ((growth - 1) / monthly_percent + 1)
@@ -0,0 +1,137 @@
+"""Столбцовое представление графика платежей."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Sequence, Union
+
+from .helpers import iter_schedule_rows
+from .models import Payment, PaymentSchedule
+from .schedule_index import ScheduleIndex
+
+COLUMNS = ("payment", "principal", "interest", "balance")
+
+
+class PaymentsView(Sequence[Payment]):
+    """Ленивое представление столбцов в виде строк ``Payment``."""
+
+    __slots__ = ("_schedule",)
+
+    def __init__(self, schedule: ColumnarSchedule) -> None:
+        self._schedule = schedule
+
+    def __len__(self) -> int:
+        return self._schedule.months
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Payment, List[Payment]]:
+        if isinstance(index, slice):
+            numbers = range(*index.indices(len(self)))
+            return [self._schedule.row(number + 1) for number in numbers]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Номер платежа вне графика.")
+        return self._schedule.row(index + 1)
+
+
+class ColumnarSchedule:
+    """График, хранящий строки в столбцах ``array('d')`` с кэшем агрегатов.
+
+    Суммы считаются один раз в виде ``ScheduleIndex``, после чего итоги
+    и накопленные значения на любой месяц доступны за O(1).
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, **columns: Sequence[float]) -> None:
+        self._columns: Dict[str, Sequence[float]] = {
+            name: columns.get(name, array("d")) for name in COLUMNS
+        }
+        if len({len(column) for column in self._columns.values()}) != 1:
+            raise ValueError("Столбцы графика должны быть одной длины.")
+        self._index: Optional[ScheduleIndex] = None
+
+    @classmethod
+    def build(
+        cls,
+        principal: float,
+        monthly_percent: float,
+        monthly_payment: float,
+        months_limit: Optional[int] = None,
+    ) -> ColumnarSchedule:
+        """Строит график сразу в столбцах, минуя объекты ``Payment``."""
+
+        columns = [array("d") for _ in COLUMNS]
+        rows = iter_schedule_rows(
+            principal, monthly_percent, monthly_payment, months_limit
+        )
+        for _, *values in rows:
+            for column, value in zip(columns, values):
+                column.append(value)
+        return cls(**dict(zip(COLUMNS, columns)))
+
+    @classmethod
+    def from_schedule(cls, schedule: PaymentSchedule) -> ColumnarSchedule:
+        """Переводит обычный график в столбцовое представление."""
+
+        rows = schedule.payments
+        return cls(
+            payment=array("d", (p.payment_amount for p in rows)),
+            principal=array("d", (p.principal_amount for p in rows)),
+            interest=array("d", (p.interest_amount for p in rows)),
+            balance=array("d", (p.remaining_principal for p in rows)),
+        )
+
+    def column(self, name: str) -> Sequence[float]:
+        """Возвращает столбец по имени: payment, principal, interest, balance."""
+
+        return self._columns[name]
+
+    @property
+    def index(self) -> ScheduleIndex:
+        """Возвращает префиксные суммы, построенные при первом обращении."""
+
+        if self._index is None:
+            columns = self._columns
+            self._index = ScheduleIndex(
+                columns["interest"], columns["principal"], columns["payment"]
+            )
+        return self._index
+
+    @property
+    def months(self) -> int:
+        """Возвращает количество месяцев в графике."""
+
+        return len(self._columns["payment"])
+
+    @property
+    def total_paid(self) -> float:
+        """Возвращает общую сумму выплат."""
+
+        return self.index.paid_up_to(self.months)
+
+    @property
+    def total_interest(self) -> float:
+        """Возвращает суммарные проценты."""
+
+        return self.index.interest_up_to(self.months)
+
+    def row(self, number: int) -> Payment:
+        """Собирает строку графика по номеру платежа."""
+
+        if not 1 <= number <= self.months:
+            raise IndexError("Номер платежа вне графика.")
+        index = number - 1
+        values = (self._columns[name][index] for name in COLUMNS)
+        return Payment(number, None, *values)
+
+    @property
+    def payments(self) -> PaymentsView:
+        """Возвращает ленивое представление строк для совместимости."""
+
+        return PaymentsView(self)
+
+    def to_schedule(self) -> PaymentSchedule:
+        """Материализует обычный ``PaymentSchedule``."""
+
+        return PaymentSchedule(payments=list(self.payments))
@@ -0,0 +1,133 @@
+"""Сравнение всех стратегий досрочного погашения за один проход."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from loguru import logger
+
+from .early_repayment import evaluate_repayment, prepare_repayment
+from .log_limits import log_exception
+from .models import EarlyRepayment, EarlyRepaymentStrategy, Loan, PaymentSchedule
+from .payment_types import generate_schedule
+
+# Доля суммы, вносимая первой операцией комбинированных стратегий
+COMBINED_SPLIT = 0.5
+# Через сколько платежей выполняется вторая операция «срок → платёж»
+SECOND_STEP_MONTHS = 12
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyOutcome:
+    """Строка сравнения: итог одной стратегии."""
+
+    strategy: EarlyRepaymentStrategy
+    monthly_payment: float
+    months_left: int
+    total_interest: float
+    savings: float
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyComparison:
+    """Компактная таблица сравнения стратегий с базовым графиком."""
+
+    repayment_amount: float
+    payments_made: int
+    base_interest: float
+    base_months_left: int
+    rows: tuple[StrategyOutcome, ...]
+
+    def best(self) -> Optional[StrategyOutcome]:
+        """Возвращает стратегию с наибольшей экономией на процентах."""
+
+        return max(self.rows, key=lambda row: row.savings, default=None)
+
+
+def _candidates(
+    amount: float, payments_made: int, split: float, second_step_months: int
+) -> tuple[EarlyRepayment, ...]:
+    """Формирует досрочки для всех четырёх стратегий."""
+
+    first, second = amount * split, amount * (1 - split)
+    return (
+        EarlyRepayment(amount, EarlyRepaymentStrategy.REDUCE_TERM, payments_made),
+        EarlyRepayment(amount, EarlyRepaymentStrategy.REDUCE_PAYMENT, payments_made),
+        EarlyRepayment(
+            first,
+            EarlyRepaymentStrategy.COMBINED_PAYMENT_THEN_TERM,
+            payments_made,
+            secondary_amount=second,
+        ),
+        EarlyRepayment(
+            first,
+            EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT,
+            payments_made,
+            secondary_amount=second,
+            secondary_execute_after_payments=payments_made + second_step_months,
+        ),
+    )
+
+
+def compare_strategies(
+    loan: Loan,
+    repayment_amount: float,
+    payments_made: int,
+    base_schedule: Optional[PaymentSchedule] = None,
+    split: float = COMBINED_SPLIT,
+    second_step_months: int = SECOND_STEP_MONTHS,
+) -> StrategyComparison:
+    """Оценивает все стратегии досрочки на одном состоянии кредита.
+
+    Базовый график, остаток, ставка и проценты до досрочки вычисляются
+    один раз; для каждой стратегии строится только график после досрочки.
+    Комбинированные стратегии делят сумму в пропорции ``split``. Если
+    вторая операция «срок → платёж» невозможна (кредит гасится раньше),
+    строка этой стратегии в таблицу не попадает.
+    """
+
+    try:
+        if not 0 < split < 1:
+            raise ValueError("Доля первой операции должна быть между 0 и 1.")
+        schedule = base_schedule or generate_schedule(
+            loan.amount, loan.term_months, loan.annual_interest_rate, loan.payment_type
+        )
+        context = prepare_repayment(schedule, payments_made, loan.payment_type)
+        base_interest = schedule.total_interest
+        rows = []
+        for repayment in _candidates(
+            repayment_amount, payments_made, split, second_step_months
+        ):
+            try:
+                result = evaluate_repayment(context, repayment)
+            except ValueError as error:
+                logger.warning("Стратегия {} пропущена: {}", repayment.strategy, error)
+                continue
+            tail: PaymentSchedule = result["schedule"]  # type: ignore[assignment]
+            months_left = tail.months
+            if tail.payments and repayment.secondary_execute_after_payments:
+                months_left += repayment.secondary_execute_after_payments
+                months_left -= payments_made
+            total_interest = float(result["total_interest"])  # type: ignore[arg-type]
+            rows.append(
+                StrategyOutcome(
+                    strategy=repayment.strategy,
+                    monthly_payment=(
+                        tail.payments[0].payment_amount if tail.payments else 0.0
+                    ),
+                    months_left=months_left,
+                    total_interest=total_interest,
+                    savings=base_interest - total_interest,
+                )
+            )
+        return StrategyComparison(
+            repayment_amount=repayment_amount,
+            payments_made=payments_made,
+            base_interest=base_interest,
+            base_months_left=context.months_left,
+            rows=tuple(rows),
+        )
+    except ValueError:
+        log_exception("Ошибка при сравнении стратегий.")
+        raise
@@ -0,0 +1,147 @@
+"""Дифференцированный график: равные доли тела и убывающие проценты."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterator, List, Optional
+
+from .closed_form import ROUNDING_STEP
+from .columnar import PaymentsView
+from .helpers import EPSILON, ensure_positive, round_money
+from .models import Payment, PaymentSchedule
+
+
+def differentiated_principal(amount: float, months: int) -> float:
+    """Возвращает ежемесячную долю тела долга для срока ``months``.
+
+    Доля округляется до копейки вниз: тогда ``months - 1`` платежей не гасят
+    долг раньше срока, а остаток забирает последний платёж.
+    """
+
+    ensure_positive(months, "months")
+    return math.floor(amount * 100 / months + EPSILON) / 100
+
+
+def iter_differentiated_rows(
+    principal: float,
+    monthly_percent: float,
+    principal_part: float,
+    months_limit: Optional[int] = None,
+) -> Iterator[tuple[int, float, float, float, float]]:
+    """Выдаёт строки графика кортежами: номер, платёж, тело, проценты, остаток.
+
+    Тело гасится равными долями ``principal_part``, последний платёж
+    (или платёж с номером ``months_limit``) забирает остаток целиком.
+    """
+
+    if principal <= EPSILON:
+        return
+    ensure_positive(principal_part, "principal_part")
+    balance = principal
+    month = 1
+    while balance > EPSILON:
+        interest = round_money(balance * monthly_percent)
+        last = principal_part >= balance or month == months_limit
+        part = balance if last else principal_part
+        balance = 0.0 if last else round_money(balance - part)
+        yield month, round_money(part + interest), part, interest, balance
+        month += 1
+
+
+def build_differentiated_schedule(
+    principal: float,
+    monthly_percent: float,
+    principal_part: float,
+    months_limit: Optional[int] = None,
+) -> PaymentSchedule:
+    """Формирует график при фиксированной доле тела долга."""
+
+    rows = iter_differentiated_rows(
+        principal, monthly_percent, principal_part, months_limit
+    )
+    payments: List[Payment] = [
+        Payment(number, None, *values) for number, *values in rows
+    ]
+    return PaymentSchedule(payments=payments)
+
+
+class DifferentiatedSchedule:
+    """Дифференцированный график с итогами по формуле и ленивыми строками.
+
+    Остаток перед k-м платежом равен ``P - (k - 1) * d``, поэтому сумма
+    остатков — арифметическая прогрессия, и проценты за весь срок
+    считаются за O(1). Строки вычисляются по номеру при обращении.
+    """
+
+    __slots__ = ("_principal", "_rate", "_part", "_months", "_full")
+
+    def __init__(
+        self,
+        principal: float,
+        monthly_percent: float,
+        principal_part: float,
+        months_limit: Optional[int] = None,
+    ) -> None:
+        ensure_positive(principal_part, "principal_part")
+        self._principal = principal
+        self._rate = monthly_percent
+        self._part = principal_part
+        months = max(math.ceil(principal / principal_part - EPSILON), 0)
+        self._months = min(months, months_limit) if months_limit else months
+        self._full: Optional[PaymentSchedule] = None
+
+    @property
+    def months(self) -> int:
+        """Возвращает количество месяцев в графике."""
+
+        return self._months
+
+    @property
+    def total_interest(self) -> float:
+        """Возвращает суммарные проценты по формуле арифметической прогрессии."""
+
+        months = self._months
+        balances = months * self._principal - self._part * months * (months - 1) / 2
+        return round_money(self._rate * balances)
+
+    @property
+    def total_paid(self) -> float:
+        """Возвращает общую сумму выплат."""
+
+        if not self._months:
+            return 0.0
+        return round_money(self._principal + self.total_interest)
+
+    @property
+    def error_bound(self) -> float:
+        """Оценка сверху расхождения итога процентов с помесячным расчётом."""
+
+        return ROUNDING_STEP * self._months
+
+    def row(self, number: int) -> Payment:
+        """Возвращает строку графика по номеру платежа за O(1)."""
+
+        if not 1 <= number <= self._months:
+            raise IndexError("Номер платежа вне графика.")
+        balance = round_money(self._principal - (number - 1) * self._part)
+        interest = round_money(balance * self._rate)
+        part = balance if number == self._months else self._part
+        remaining = round_money(balance - part)
+        return Payment(
+            number, None, round_money(part + interest), part, interest, remaining
+        )
+
+    @property
+    def payments(self) -> PaymentsView:
+        """Возвращает ленивое представление строк."""
+
+        return PaymentsView(self)  # type: ignore[arg-type]
+
+    def to_schedule(self) -> PaymentSchedule:
+        """Материализует график через помесячный расчёт."""
+
+        if self._full is None:
+            self._full = build_differentiated_schedule(
+                self._principal, self._rate, self._part, self._months
+            )
+        return self._full
@@ -2,16 +2,12 @@
 
 from __future__ import annotations
 
-from loguru import logger
-
-from .helpers import (
-    annual_from_monthly,
-    ensure_positive,
-    infer_monthly_percent,
-    original_payment,
-    remaining_principal,
-)
-from .models import EarlyRepayment, EarlyRepaymentStrategy, PaymentSchedule
+from dataclasses import dataclass
+
+from .helpers import annual_from_monthly, infer_monthly_percent, remaining_principal
+from .log_limits import log_exception
+from .models import EarlyRepayment, EarlyRepaymentStrategy, PaymentSchedule, PaymentType
+from .payment_types import schedule_fixed_amount
 from .repayment_strategies import (
     payment_then_term,
     reduce_payment,
@@ -20,80 +16,124 @@ from .repayment_strategies import (
 )
 
 
-def apply_early_repayment(
+@dataclass(frozen=True, slots=True)
+class RepaymentContext:
+    """Состояние кредита на дату досрочки, общее для всех стратегий.
+
+    ``monthly_payment`` — фиксированная величина графика: платёж для
+    аннуитета или доля тела долга для дифференцированной схемы.
+    """
+
+    monthly_percent: float
+    annual_rate: float
+    balance: float
+    monthly_payment: float
+    months_left: int
+    payments_made: int
+    interest_before: float
+    payment_type: PaymentType = PaymentType.ANNUITY
+
+
+def prepare_repayment(
     current_schedule: PaymentSchedule,
-    repayment: EarlyRepayment,
     payments_made: int,
-) -> dict[str, object]:
-    """Пересчитывает график после досрочного платежа."""
+    payment_type: PaymentType = PaymentType.ANNUITY,
+) -> RepaymentContext:
+    """Вычисляет остаток, ставку и проценты до досрочки один раз."""
 
-    try:
-        if not current_schedule.payments:
-            raise ValueError("График платежей пуст.")
-        if repayment.amount <= 0:
-            raise ValueError("Сумма досрочного погашения должна быть положительной.")
+    if not current_schedule.payments:
+        raise ValueError("График платежей пуст.")
+    monthly_percent = infer_monthly_percent(current_schedule)
+    balance = remaining_principal(current_schedule, payments_made)
+    if balance <= 0:
+        raise ValueError("Кредит уже погашён.")
+    months_left = current_schedule.months - payments_made
+    if months_left <= 0:
+        raise ValueError("Не осталось платежей для пересчёта.")
+    return RepaymentContext(
+        monthly_percent=monthly_percent,
+        annual_rate=annual_from_monthly(monthly_percent),
+        balance=balance,
+        monthly_payment=schedule_fixed_amount(payment_type, current_schedule),
+        months_left=months_left,
+        payments_made=payments_made,
+        interest_before=current_schedule.index.interest_up_to(payments_made),
+        payment_type=payment_type,
+    )
 
-        monthly_percent = infer_monthly_percent(current_schedule)
-        annual_rate = annual_from_monthly(monthly_percent)
-        balance = remaining_principal(current_schedule, payments_made)
 
-        if balance <= 0:
-            raise ValueError("Кредит уже погашён.")
+def evaluate_repayment(
+    context: RepaymentContext,
+    repayment: EarlyRepayment,
+) -> dict[str, object]:
+    """Применяет стратегию досрочки к подготовленному состоянию кредита."""
+
+    if repayment.amount <= 0:
+        raise ValueError("Сумма досрочного погашения должна быть положительной.")
 
-        monthly_payment_value = original_payment(current_schedule)
-        months_left = current_schedule.months - payments_made
-        if months_left <= 0:
-            raise ValueError("Не осталось платежей для пересчёта.")
+    strategy = repayment.strategy
+    extra_interest = 0.0
 
-        strategy = repayment.strategy
-        interest_before = sum(
-            payment.interest_amount for payment in current_schedule.payments[:payments_made]
+    if strategy == EarlyRepaymentStrategy.REDUCE_TERM:
+        schedule = reduce_term(
+            context.balance,
+            repayment.amount,
+            context.monthly_percent,
+            context.monthly_payment,
+            context.payment_type,
         )
+    elif strategy == EarlyRepaymentStrategy.REDUCE_PAYMENT:
+        schedule = reduce_payment(
+            context.balance,
+            repayment.amount,
+            context.monthly_percent,
+            context.months_left,
+            context.payment_type,
+        )
+    elif strategy == EarlyRepaymentStrategy.COMBINED_PAYMENT_THEN_TERM:
+        schedule = payment_then_term(
+            context.balance,
+            repayment,
+            context.monthly_percent,
+            context.months_left,
+            context.payment_type,
+        )
+    elif strategy == EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT:
+        schedule, extra_interest = term_then_payment(
+            context.balance,
+            repayment,
+            context.monthly_percent,
+            context.months_left,
+            context.monthly_payment,
+            context.payments_made,
+            context.payment_type,
+        )
+    else:
+        raise ValueError("Неизвестная стратегия досрочного погашения.")
+
+    interest_before = context.interest_before + extra_interest
+    return {
+        "schedule": schedule,
+        "total_interest": interest_before + schedule.total_interest,
+        "interest_before": interest_before,
+        "months": schedule.months,
+        "annual_rate": context.annual_rate,
+    }
 
-        extra_interest = 0.0
-
-        if strategy == EarlyRepaymentStrategy.REDUCE_TERM:
-            schedule = reduce_term(
-                balance,
-                repayment.amount,
-                monthly_percent,
-                monthly_payment_value,
-            )
-        elif strategy == EarlyRepaymentStrategy.REDUCE_PAYMENT:
-            schedule = reduce_payment(
-                balance,
-                repayment.amount,
-                monthly_percent,
-                months_left,
-            )
-        elif strategy == EarlyRepaymentStrategy.COMBINED_PAYMENT_THEN_TERM:
-            schedule = payment_then_term(
-                balance,
-                repayment,
-                monthly_percent,
-                months_left,
-            )
-        elif strategy == EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT:
-            schedule, extra_interest = term_then_payment(
-                balance,
-                repayment,
-                monthly_percent,
-                months_left,
-                monthly_payment_value,
-                payments_made,
-            )
-        else:
-            raise ValueError("Неизвестная стратегия досрочного погашения.")
-
-        total_interest = interest_before + extra_interest + schedule.total_interest
-        return {
-            "schedule": schedule,
-            "total_interest": total_interest,
-            "interest_before": interest_before + extra_interest,
-            "months": schedule.months,
-            "annual_rate": annual_rate,
-        }
+
+def apply_early_repayment(
+    current_schedule: PaymentSchedule,
+    repayment: EarlyRepayment,
+    payments_made: int,
+    payment_type: PaymentType = PaymentType.ANNUITY,
+) -> dict[str, object]:
+    """Пересчитывает график после досрочного платежа."""
+
+    try:
+        if current_schedule.payments and repayment.amount <= 0:
+            raise ValueError("Сумма досрочного погашения должна быть положительной.")
+        context = prepare_repayment(current_schedule, payments_made, payment_type)
+        return evaluate_repayment(context, repayment)
     except ValueError:
-        logger.exception("Ошибка при перерасчёте графика.")
+        log_exception("Ошибка при перерасчёте графика.")
         raise
-
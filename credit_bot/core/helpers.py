@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
-
-from loguru import logger
+from typing import Iterator, List, Optional
 
+from .log_limits import log_error
 from .models import Payment, PaymentSchedule
 
 MONTHS_IN_YEAR = 12
@@ -41,49 +40,67 @@ def round_money(value: float) -> float:
     return round(value + EPSILON, 2)
 
 
-def build_schedule(
+def schedule_step(
+    balance: float,
+    monthly_percent: float,
+    monthly_payment: float,
+    is_last: bool = False,
+) -> tuple[float, float, float, float]:
+    """Рассчитывает один месяц графика: платёж, тело, проценты и остаток."""
+
+    interest = round_money(balance * monthly_percent)
+    principal_part = round_money(monthly_payment - interest)
+    if principal_part <= 0:
+        log_error("Платёж не покрывает проценты, расчёт невозможен.")
+        raise ValueError("Размер платежа должен покрывать проценты.")
+    if principal_part > balance or (is_last and principal_part < balance):
+        principal_part = balance
+        payment_value = round_money(principal_part + interest)
+    else:
+        payment_value = round_money(monthly_payment)
+    new_balance = round_money(balance - principal_part)
+    return payment_value, principal_part, interest, new_balance
+
+
+def iter_schedule_rows(
     principal: float,
     monthly_percent: float,
     monthly_payment: float,
     months_limit: Optional[int] = None,
-) -> PaymentSchedule:
-    """Формирует график платежей при фиксированном платеже."""
+    first_month: int = 1,
+) -> Iterator[tuple[int, float, float, float, float]]:
+    """Выдаёт строки графика кортежами: номер, платёж, тело, проценты, остаток."""
 
     if principal <= EPSILON:
-        return PaymentSchedule(payments=[])
+        return
     ensure_positive(monthly_payment, "monthly_payment")
-    payments: List[Payment] = []
     balance = principal
-    month = 1
+    month = first_month
 
     while balance > EPSILON:
-        interest = round_money(balance * monthly_percent)
-        principal_part = round_money(monthly_payment - interest)
-        if principal_part <= 0:
-            logger.error("Платёж не покрывает проценты, расчёт невозможен.")
-            raise ValueError("Размер платежа должен покрывать проценты.")
-        if principal_part > balance or (
-            months_limit and month == months_limit and principal_part < balance
-        ):
-            principal_part = balance
-            payment_value = round_money(principal_part + interest)
-        else:
-            payment_value = round_money(monthly_payment)
-        balance = round_money(balance - principal_part)
-        payments.append(
-            Payment(
-                number=month,
-                date=None,
-                payment_amount=payment_value,
-                principal_amount=principal_part,
-                interest_amount=interest,
-                remaining_principal=max(balance, 0.0),
-            )
+        is_last = bool(months_limit) and month == months_limit
+        payment_value, principal_part, interest, balance = schedule_step(
+            balance, monthly_percent, monthly_payment, is_last
         )
+        yield month, payment_value, principal_part, interest, max(balance, 0.0)
         month += 1
         if months_limit and month > months_limit and balance > EPSILON:
             raise ValueError("Не удалось погасить кредит за указанный срок.")
 
+
+def build_schedule(
+    principal: float,
+    monthly_percent: float,
+    monthly_payment: float,
+    months_limit: Optional[int] = None,
+) -> PaymentSchedule:
+    """Формирует график платежей при фиксированном платеже."""
+
+    rows = iter_schedule_rows(principal, monthly_percent, monthly_payment, months_limit)
+    payments: List[Payment] = [
+        Payment(number, None, payment_value, principal_part, interest, balance)
+        for number, payment_value, principal_part, interest, balance in rows
+    ]
     return PaymentSchedule(payments=payments)
 
 
@@ -0,0 +1,116 @@
+"""Инкрементальный пересчёт досрочки с общим префиксом графика."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import List, Optional, Sequence, Union
+
+from .early_repayment import RepaymentContext, evaluate_repayment, prepare_repayment
+from .log_limits import log_exception
+from .models import EarlyRepayment, Payment, PaymentSchedule, PaymentType
+
+
+class TimelineView(Sequence[Payment]):
+    """Полная хронология: строки базового графика до досрочки и новый хвост.
+
+    Строки префикса не копируются — это те же объекты ``Payment``, что и в
+    базовом графике. Строки хвоста перенумеровываются только при чтении.
+    """
+
+    __slots__ = ("_base", "_made", "_tail")
+
+    def __init__(
+        self, base: PaymentSchedule, payments_made: int, tail: PaymentSchedule
+    ) -> None:
+        self._base = base
+        self._made = payments_made
+        self._tail = tail
+
+    def __len__(self) -> int:
+        return self._made + self._tail.months
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Payment, List[Payment]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Номер платежа вне графика.")
+        if index < self._made:
+            return self._base.payments[index]
+        row = self._tail.payments[index - self._made]
+        return replace(row, number=row.number + self._made)
+
+
+class RepaymentScenario:
+    """Результат досрочки, который дёшево перестраивается при изменении суммы
+    или даты.
+
+    Состояние кредита на дату досрочки (остаток, ставка, проценты до неё)
+    хранится в ``RepaymentContext``. При смене суммы оно переиспользуется
+    целиком, при смене даты пересчитывается за O(1) по индексу графика;
+    в обоих случаях строится только график после досрочки.
+    """
+
+    __slots__ = ("base", "repayment", "context", "result")
+
+    def __init__(
+        self,
+        base: PaymentSchedule,
+        repayment: EarlyRepayment,
+        context: Optional[RepaymentContext] = None,
+        payment_type: PaymentType = PaymentType.ANNUITY,
+    ) -> None:
+        self.base = base
+        self.repayment = repayment
+        try:
+            self.context = context or prepare_repayment(
+                base, repayment.execute_after_payments, payment_type
+            )
+            self.result = evaluate_repayment(self.context, repayment)
+        except ValueError:
+            log_exception("Ошибка при пересчёте сценария досрочки.")
+            raise
+
+    @property
+    def schedule(self) -> PaymentSchedule:
+        """Возвращает график после досрочки."""
+
+        return self.result["schedule"]  # type: ignore[return-value]
+
+    @property
+    def timeline(self) -> TimelineView:
+        """Возвращает полную хронологию платежей без копирования префикса."""
+
+        return TimelineView(self.base, self.context.payments_made, self.schedule)
+
+    def update(
+        self,
+        amount: Optional[float] = None,
+        payments_made: Optional[int] = None,
+    ) -> RepaymentScenario:
+        """Возвращает сценарий с новой суммой и/или датой досрочки."""
+
+        changes: dict[str, object] = {}
+        if amount is not None:
+            changes["amount"] = amount
+        if payments_made is not None:
+            changes["execute_after_payments"] = payments_made
+        repayment = replace(self.repayment, **changes)
+        same_month = repayment.execute_after_payments == self.context.payments_made
+        return RepaymentScenario(
+            self.base,
+            repayment,
+            self.context if same_month else None,
+            self.context.payment_type,
+        )
+
+    def with_amount(self, amount: float) -> RepaymentScenario:
+        """Пересчитывает только хвост графика для новой суммы досрочки."""
+
+        return self.update(amount=amount)
+
+    def with_month(self, payments_made: int) -> RepaymentScenario:
+        """Переносит досрочку на другую дату, сохраняя сумму."""
+
+        return self.update(payments_made=payments_made)
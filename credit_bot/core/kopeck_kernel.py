@@ -0,0 +1,146 @@
+"""Целочисленное ядро аннуитетного графика: суммы в копейках.
+
+Остаток, проценты и платёж хранятся целыми копейками, годовая ставка —
+целым числом миллионных долей процента, поэтому месячная ставка является
+точной дробью ``rate / RATE_DENOMINATOR``. Округление до копейки выполняется
+одним целочисленным делением по явно выбранному правилу; ошибки
+представления float не накапливаются.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Iterator
+
+from .helpers import MONTHS_IN_YEAR, ensure_positive
+from .log_limits import log_exception
+from .models import Payment, PaymentSchedule
+from .payment_logic import calculate_annuity_payment, generate_payment_schedule
+
+ENGINE_FLOAT = "float"
+ENGINE_KOPECK = "kopeck"
+
+# Правила округления до копейки
+ROUND_HALF_UP = "half_up"
+ROUND_HALF_EVEN = "half_even"
+ROUND_DOWN = "down"
+ROUNDING_MODES = (ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_DOWN)
+
+# Точность годовой ставки (как в ключах кэша) и знаменатель месячной ставки
+RATE_SCALE = 1_000_000
+RATE_DENOMINATOR = 100 * MONTHS_IN_YEAR * RATE_SCALE
+
+
+def divide(numerator: int, denominator: int, rounding: str) -> int:
+    """Делит неотрицательные целые с округлением по правилу ``rounding``."""
+
+    quotient, remainder = divmod(numerator, denominator)
+    if rounding == ROUND_DOWN:
+        return quotient
+    twice = 2 * remainder
+    if twice > denominator:
+        return quotient + 1
+    if twice == denominator and (rounding == ROUND_HALF_UP or quotient % 2):
+        return quotient + 1
+    return quotient
+
+
+def kopeck_annuity_payment(
+    amount: int, term_months: int, rate: int, rounding: str
+) -> int:
+    """Возвращает аннуитетный платёж в копейках по точной формуле."""
+
+    if rate == 0:
+        return divide(amount, term_months, rounding)
+    # (1 + r)^n = (D + rate)^n / D^n; платёж = P * r * g / (g - 1)
+    growth = (RATE_DENOMINATOR + rate) ** term_months
+    base = RATE_DENOMINATOR**term_months
+    return divide(amount * rate * growth, RATE_DENOMINATOR * (growth - base), rounding)
+
+
+def iter_kopeck_rows(
+    principal: int, rate: int, payment: int, term_months: int, rounding: str
+) -> Iterator[tuple[int, int, int, int, int]]:
+    """Выдаёт строки графика в копейках: номер, платёж, тело, проценты, остаток."""
+
+    balance = principal
+    month = 1
+    while balance > 0:
+        interest = divide(balance * rate, RATE_DENOMINATOR, rounding)
+        part = payment - interest
+        if part <= 0:
+            raise ValueError("Размер платежа должен покрывать проценты.")
+        if part > balance or month == term_months:
+            part = balance
+        balance -= part
+        yield month, part + interest, part, interest, balance
+        month += 1
+
+
+def _validate(
+    amount: float, term_months: int, annual_interest_rate: float, rounding: str
+) -> tuple[int, int]:
+    """Проверяет параметры и переводит сумму и ставку в целые единицы."""
+
+    ensure_positive(amount, "amount")
+    ensure_positive(term_months, "term_months")
+    if annual_interest_rate < 0:
+        raise ValueError("Ставка не может быть отрицательной.")
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестное правило округления: {rounding}")
+    return round(amount * 100), round(annual_interest_rate * RATE_SCALE)
+
+
+def calculate_kopeck_payment(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+    rounding: str = ROUND_HALF_UP,
+) -> float:
+    """Возвращает аннуитетный платёж в рублях, рассчитанный в копейках."""
+
+    try:
+        kopecks, rate = _validate(amount, term_months, annual_interest_rate, rounding)
+        return kopeck_annuity_payment(kopecks, term_months, rate, rounding) / 100
+    except ValueError:
+        log_exception("Ошибка при расчёте платежа в копейках.")
+        raise
+
+
+def generate_kopeck_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+    rounding: str = ROUND_HALF_UP,
+) -> PaymentSchedule:
+    """Формирует аннуитетный график целочисленным ядром."""
+
+    try:
+        kopecks, rate = _validate(amount, term_months, annual_interest_rate, rounding)
+        payment = kopeck_annuity_payment(kopecks, term_months, rate, rounding)
+        rows = iter_kopeck_rows(kopecks, rate, payment, term_months, rounding)
+        payments = [
+            Payment(number, None, paid / 100, part / 100, interest / 100, left / 100)
+            for number, paid, part, interest, left in rows
+        ]
+        return PaymentSchedule(payments=payments)
+    except ValueError:
+        log_exception("Ошибка при генерации графика в копейках.")
+        raise
+
+
+def engine_functions(
+    engine: str, rounding: str = ROUND_HALF_UP
+) -> tuple[Callable[..., float], Callable[..., PaymentSchedule]]:
+    """Возвращает функции платежа и графика для выбранного ядра."""
+
+    if engine == ENGINE_FLOAT:
+        return calculate_annuity_payment, generate_payment_schedule
+    if engine != ENGINE_KOPECK:
+        raise ValueError(f"Неизвестное ядро расчёта: {engine}")
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестное правило округления: {rounding}")
+    return (
+        partial(calculate_kopeck_payment, rounding=rounding),
+        partial(generate_kopeck_schedule, rounding=rounding),
+    )
@@ -0,0 +1,76 @@
+"""Ограничение частоты записи ошибок проверки входных данных в журнал."""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable
+
+from loguru import logger
+
+# Окно ограничения, секунды, и число записей с одним сообщением в окне
+DEFAULT_INTERVAL = 60.0
+DEFAULT_BURST = 5
+
+
+class ErrorLogLimiter:
+    """Пропускает не более ``burst`` записей с одинаковым сообщением за окно.
+
+    Лишние записи отбрасываются до форматирования трассировки, поэтому
+    поток некорректного ввода не превращается в синхронный вывод стеков.
+    В начале следующего окна выводится число подавленных повторов.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self.burst = burst
+        self._clock = clock
+        # Сообщение -> [начало окна, записано в окне, подавлено в окне]
+        self._windows: dict[str, list[float]] = {}
+        self._lock = Lock()
+
+    def allow(self, message: str) -> tuple[bool, int]:
+        """Возвращает, можно ли писать запись, и число подавленных до неё."""
+
+        now = self._clock()
+        with self._lock:
+            window = self._windows.get(message)
+            suppressed = 0
+            if window is None or now - window[0] >= self.interval:
+                suppressed = int(window[2]) if window else 0
+                window = self._windows[message] = [now, 0, 0]
+            if window[1] >= self.burst:
+                window[2] += 1
+                return False, 0
+            window[1] += 1
+            return True, suppressed
+
+    def exception(self, message: str) -> None:
+        """Аналог ``logger.exception`` с ограничением частоты."""
+
+        self._log(message, exception=True)
+
+    def error(self, message: str) -> None:
+        """Аналог ``logger.error`` с ограничением частоты."""
+
+        self._log(message, exception=False)
+
+    def _log(self, message: str, exception: bool) -> None:
+        allowed, suppressed = self.allow(message)
+        if suppressed:
+            logger.opt(depth=2).warning(
+                "Подавлено повторов «{}»: {}", message, suppressed
+            )
+        if allowed:
+            logger.opt(exception=exception, depth=2).error(message)
+
+
+# Общий ограничитель для ошибок расчётного ядра
+error_limiter = ErrorLogLimiter()
+log_exception = error_limiter.exception
+log_error = error_limiter.error
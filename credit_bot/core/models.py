@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
 from typing import List, Optional
 
+from .schedule_index import ScheduleIndex
+
 
 class PaymentType(str, Enum):
     """Типы расчёта платежей."""
@@ -51,18 +53,30 @@ class PaymentSchedule:
     """Полный график платежей с агрегирующими свойствами."""
 
     payments: List[Payment]
+    _index: Optional[ScheduleIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def index(self) -> ScheduleIndex:
+        """Возвращает префиксные суммы графика, строя их при первом обращении."""
+
+        if self._index is None:
+            index = ScheduleIndex.from_payments(self.payments)
+            object.__setattr__(self, "_index", index)
+        return self._index
 
     @property
     def total_paid(self) -> float:
         """Возвращает общую сумму выплат."""
 
-        return sum(p.payment_amount for p in self.payments)
+        return self.index.paid_up_to(self.months)
 
     @property
     def total_interest(self) -> float:
         """Возвращает суммарные проценты."""
 
-        return sum(p.interest_amount for p in self.payments)
+        return self.index.interest_up_to(self.months)
 
     @property
     def months(self) -> int:
@@ -1,10 +1,16 @@
-"""Расчёты аннуитетного платежа и базового графика."""
+"""Расчёты платежа и базового графика: аннуитетного и дифференцированного."""
 
 from __future__ import annotations
 
-from loguru import logger
-
+from .analytic_schedule import AnalyticSchedule
+from .columnar import ColumnarSchedule
+from .differentiated import (
+    DifferentiatedSchedule,
+    build_differentiated_schedule,
+    differentiated_principal,
+)
 from .helpers import build_schedule, ensure_positive, monthly_rate, round_money
+from .log_limits import log_exception
 from .models import PaymentSchedule
 
 
@@ -30,10 +36,10 @@ def calculate_annuity_payment(
             payment = amount * coefficient
         return round_money(payment)
     except ValueError:
-        logger.exception("Ошибка при расчёте аннуитетного платежа.")
+        log_exception("Ошибка при расчёте аннуитетного платежа.")
         raise
     except ZeroDivisionError as exc:
-        logger.exception("Не удалось вычислить коэффициент аннуитета.")
+        log_exception("Не удалось вычислить коэффициент аннуитета.")
         raise ValueError("Некорректные параметры для расчёта платежа.") from exc
 
 
@@ -54,6 +60,90 @@ def generate_payment_schedule(
             months_limit=term_months,
         )
     except ValueError:
-        logger.exception("Ошибка при генерации графика платежей.")
+        log_exception("Ошибка при генерации графика платежей.")
         raise
 
+
+def summarize_payment_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+) -> AnalyticSchedule:
+    """Возвращает график с O(1)-оценками итогов; точные строки — по запросу."""
+
+    try:
+        monthly_payment = calculate_annuity_payment(
+            amount, term_months, annual_interest_rate
+        )
+        monthly_percent = monthly_rate(annual_interest_rate)
+        return AnalyticSchedule(
+            principal=amount,
+            monthly_percent=monthly_percent,
+            monthly_payment=monthly_payment,
+            months_limit=term_months,
+        )
+    except ValueError:
+        log_exception("Ошибка при аналитическом расчёте графика.")
+        raise
+
+
+def generate_columnar_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+) -> ColumnarSchedule:
+    """Формирует аннуитетный график в столбцовом представлении."""
+
+    try:
+        monthly_payment = calculate_annuity_payment(
+            amount, term_months, annual_interest_rate
+        )
+        return ColumnarSchedule.build(
+            principal=amount,
+            monthly_percent=monthly_rate(annual_interest_rate),
+            monthly_payment=monthly_payment,
+            months_limit=term_months,
+        )
+    except ValueError:
+        log_exception("Ошибка при генерации столбцового графика.")
+        raise
+
+
+def generate_differentiated_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+) -> PaymentSchedule:
+    """Формирует график с равными долями тела долга."""
+
+    try:
+        ensure_positive(amount, "amount")
+        return build_differentiated_schedule(
+            principal=amount,
+            monthly_percent=monthly_rate(annual_interest_rate),
+            principal_part=differentiated_principal(amount, term_months),
+            months_limit=term_months,
+        )
+    except ValueError:
+        log_exception("Ошибка при генерации дифференцированного графика.")
+        raise
+
+
+def summarize_differentiated_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+) -> DifferentiatedSchedule:
+    """Возвращает дифференцированный график с итогами за O(1)."""
+
+    try:
+        ensure_positive(amount, "amount")
+        return DifferentiatedSchedule(
+            principal=amount,
+            monthly_percent=monthly_rate(annual_interest_rate),
+            principal_part=differentiated_principal(amount, term_months),
+            months_limit=term_months,
+        )
+    except ValueError:
+        log_exception("Ошибка при расчёте дифференцированного графика.")
+        raise
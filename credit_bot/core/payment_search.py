@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+from typing import Callable
+
 from loguru import logger
 
+from .annuity_estimate import AnnuityEstimate
 from .helpers import build_schedule, ensure_positive, monthly_rate
+from .log_limits import log_exception
 from .payment_logic import calculate_annuity_payment
+from .payment_solver import solve_payment
+
+SEARCH_NEWTON = "newton"
+SEARCH_BISECTION = "bisection"
+# Сколько раз допускается точный пересчёт графика в режиме ``newton``
+EXACT_PASSES = 3
 
 
 def find_payment_for_target_overpayment(
@@ -13,24 +23,44 @@ def find_payment_for_target_overpayment(
     annual_interest_rate: float,
     target_overpayment: float,
     tolerance: float,
+    method: str = SEARCH_NEWTON,
 ) -> dict[str, float]:
-    """Бинарный поиск платежа, обеспечивающего заданную переплату."""
+    """Подбирает платёж, обеспечивающий заданную переплату.
+
+    Режим ``newton`` решает задачу по формуле переплаты и строит график один
+    раз, режим ``bisection`` выполняет прежний бинарный поиск по симуляциям.
+    """
 
     try:
         ensure_positive(amount, "amount")
         ensure_positive(target_overpayment, "target_overpayment")
         if tolerance <= 0:
             raise ValueError("Допуск должен быть положительным.")
+        if method not in (SEARCH_NEWTON, SEARCH_BISECTION):
+            raise ValueError(f"Неизвестный режим подбора платежа: {method}.")
 
         monthly_percent = monthly_rate(annual_interest_rate)
         base_payment = calculate_annuity_payment(amount, 360, annual_interest_rate)
         low = max(base_payment, amount * monthly_percent + 1.0)
         high = max(low * 2, amount)
+        evaluations = 0
 
         def simulate(payment_value: float) -> tuple[float, int]:
+            nonlocal evaluations
+            evaluations += 1
             schedule = build_schedule(amount, monthly_percent, payment_value)
             return schedule.total_interest, schedule.months
 
+        if method == SEARCH_NEWTON and monthly_percent > 0:
+            plan = _newton_search(
+                amount, monthly_percent, target_overpayment, tolerance, low, simulate
+            )
+            if plan is not None:
+                plan["evaluations"] += evaluations
+                return plan
+            # Допуск меньше шага округлений: переходим к бинарному поиску
+            logger.debug("Аналитический подбор не уложился в допуск.")
+
         high_interest, high_months = simulate(high)
         while high_interest > target_overpayment and high < amount * 5:
             high *= 1.5
@@ -54,8 +84,45 @@ def find_payment_for_target_overpayment(
             else:
                 high = mid
 
+        best["evaluations"] = evaluations
         return best
     except ValueError:
-        logger.exception("Ошибка при подборе платежа под переплату.")
+        log_exception("Ошибка при подборе платежа под переплату.")
         raise
 
+
+def _newton_search(
+    amount: float,
+    monthly_percent: float,
+    target_overpayment: float,
+    tolerance: float,
+    low: float,
+    simulate: Callable[[float], tuple[float, int]],
+) -> dict[str, float] | None:
+    """Подбирает платёж по формуле переплаты, проверяя точным графиком."""
+
+    # При платеже от amount * (1 + r) кредит гасится за один месяц
+    ceiling = max(low, amount * (1 + monthly_percent))
+    goal = target_overpayment
+    best: dict[str, float] | None = None
+    evaluations = 0
+    for _ in range(EXACT_PASSES):
+        payment, used = solve_payment(
+            amount, monthly_percent, goal, tolerance / 2, low, ceiling
+        )
+        evaluations += used
+        overpayment, months = simulate(payment)
+        diff = abs(overpayment - target_overpayment)
+        if best is None or diff < abs(best["overpayment"] - target_overpayment):
+            best = {"payment": payment, "overpayment": overpayment, "months": months}
+        if diff <= tolerance:
+            break
+        # Сдвигаем цель на ошибку округлений аналитического графика
+        estimate = AnnuityEstimate(amount, monthly_percent, payment)
+        goal -= overpayment - estimate.estimated_total_interest
+    # Цель вне диапазона платежей: ближе, чем на границе, не подобрать
+    at_bound = best["payment"] - low < 0.01 or ceiling - best["payment"] < 0.01
+    if abs(best["overpayment"] - target_overpayment) <= tolerance or at_bound:
+        best["evaluations"] = evaluations
+        return best
+    return None
@@ -0,0 +1,88 @@
+"""Подбор платежа по переплате через формулу в замкнутой форме."""
+
+from __future__ import annotations
+
+import math
+
+from .annuity_estimate import AnnuityEstimate
+
+# Итерации Ньютона по непрерывной модели дешёвые и не строят график
+MODEL_ITERATIONS = 50
+# Бюджет вычислений переплаты по аналитическому графику
+MAX_EVALUATIONS = 16
+# Ширина отрезка по платежу, при которой уточнение прекращается
+PAYMENT_RESOLUTION = 1e-6
+
+
+def model_interest(
+    principal: float, monthly_percent: float, payment: float
+) -> tuple[float, float]:
+    """Возвращает непрерывную оценку переплаты и её производную по платежу."""
+
+    log_growth = math.log1p(monthly_percent)
+    covered = payment - monthly_percent * principal
+    months = -math.log(covered / payment) / log_growth
+    derivative = months - monthly_percent * principal / (log_growth * covered)
+    return payment * months - principal, derivative
+
+
+def _model_root(
+    principal: float, monthly_percent: float, target: float, low: float, high: float
+) -> tuple[float, float]:
+    """Ищет корень модели методом Ньютона; возвращает платёж и наклон."""
+
+    payment = low
+    derivative = -1.0
+    for _ in range(MODEL_ITERATIONS):
+        interest, derivative = model_interest(principal, monthly_percent, payment)
+        step = (interest - target) / derivative
+        payment = min(max(payment - step, low), high)
+        if abs(step) < 1e-6:
+            break
+    return payment, derivative
+
+
+def solve_payment(
+    principal: float,
+    monthly_percent: float,
+    target: float,
+    tolerance: float,
+    low: float,
+    high: float,
+) -> tuple[float, int]:
+    """Подбирает платёж с переплатой ``target``; возвращает платёж и число оценок.
+
+    Начальное приближение даёт Ньютон по непрерывной модели, затем секущие
+    уточняют его по аналитическому графику с копеечными округлениями.
+    Если шаг секущей выходит за отрезок неопределённости, делается бисекция.
+    """
+
+    guess, slope = _model_root(principal, monthly_percent, target, low, high)
+    evaluations = 0
+    best_payment, best_diff = high, math.inf
+    previous: tuple[float, float] | None = None
+    payment = guess
+    while evaluations < MAX_EVALUATIONS:
+        estimate = AnnuityEstimate(principal, monthly_percent, payment)
+        interest = estimate.estimated_total_interest
+        evaluations += 1
+        diff = interest - target
+        if abs(diff) < best_diff:
+            best_payment, best_diff = payment, abs(diff)
+        if abs(diff) <= tolerance:
+            break
+        # Переплата убывает с ростом платежа, поэтому знак задаёт сторону отрезка
+        if diff > 0:
+            low = payment
+        else:
+            high = payment
+        if high - low < PAYMENT_RESOLUTION:
+            break
+        if previous is not None and previous[0] != payment:
+            slope = (diff - previous[1]) / (payment - previous[0])
+        previous = (payment, diff)
+        candidate = payment - diff / slope if slope < 0 else (low + high) / 2
+        if not low < candidate < high:
+            candidate = (low + high) / 2
+        payment = candidate
+    return best_payment, evaluations
@@ -0,0 +1,116 @@
+"""Выбор расчёта по типу платежей: аннуитетный или дифференцированный.
+
+Для аннуитета фиксированной величиной графика является платёж, для
+дифференцированной схемы — доля тела долга. Стратегии досрочки работают
+с этой величиной одинаково: сохраняют её (сокращение срока) или
+пересчитывают под оставшийся срок (уменьшение платежа).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .differentiated import build_differentiated_schedule, differentiated_principal
+from .helpers import annual_from_monthly, build_schedule, original_payment
+from .models import PaymentSchedule, PaymentType
+from .payment_logic import (
+    calculate_annuity_payment,
+    generate_differentiated_schedule,
+    generate_payment_schedule,
+    summarize_differentiated_schedule,
+    summarize_payment_schedule,
+)
+
+
+def fixed_amount(
+    payment_type: PaymentType, balance: float, monthly_percent: float, months: int
+) -> float:
+    """Возвращает фиксированную величину графика для срока ``months``."""
+
+    if payment_type == PaymentType.DIFFERENTIATED:
+        return differentiated_principal(balance, months)
+    annual_rate = annual_from_monthly(monthly_percent)
+    return calculate_annuity_payment(balance, months, annual_rate)
+
+
+def schedule_fixed_amount(
+    payment_type: PaymentType, schedule: PaymentSchedule
+) -> float:
+    """Извлекает фиксированную величину из построенного графика."""
+
+    if payment_type == PaymentType.DIFFERENTIATED:
+        if not schedule.payments:
+            raise ValueError("График пуст, доля тела не задана.")
+        return schedule.payments[0].principal_amount
+    return original_payment(schedule)
+
+
+def build_for_type(
+    payment_type: PaymentType,
+    principal: float,
+    monthly_percent: float,
+    fixed: float,
+    months_limit: Optional[int] = None,
+) -> PaymentSchedule:
+    """Строит график с фиксированной величиной ``fixed`` нужного типа."""
+
+    if payment_type == PaymentType.DIFFERENTIATED:
+        return build_differentiated_schedule(
+            principal, monthly_percent, fixed, months_limit
+        )
+    return build_schedule(principal, monthly_percent, fixed, months_limit)
+
+
+def generate_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+    payment_type: PaymentType = PaymentType.ANNUITY,
+) -> PaymentSchedule:
+    """Формирует базовый график кредита заданного типа."""
+
+    if payment_type == PaymentType.DIFFERENTIATED:
+        return generate_differentiated_schedule(
+            amount, term_months, annual_interest_rate
+        )
+    return generate_payment_schedule(amount, term_months, annual_interest_rate)
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentTypeComparison:
+    """Оценки итогов аннуитетной и дифференцированной схем для одного кредита.
+
+    Суммы процентов получены по формулам и могут отличаться от помесячного
+    графика на величину ``error_bound`` соответствующей схемы.
+    """
+
+    annuity_payment: float
+    annuity_interest: float
+    differentiated_first_payment: float
+    differentiated_last_payment: float
+    differentiated_interest: float
+
+    @property
+    def savings(self) -> float:
+        """Экономия на процентах при дифференцированной схеме."""
+
+        return self.annuity_interest - self.differentiated_interest
+
+
+def compare_payment_types(
+    amount: float, term_months: int, annual_interest_rate: float
+) -> PaymentTypeComparison:
+    """Сравнивает схемы платежей по формулам, без помесячного расчёта."""
+
+    annuity = summarize_payment_schedule(amount, term_months, annual_interest_rate)
+    differentiated = summarize_differentiated_schedule(
+        amount, term_months, annual_interest_rate
+    )
+    return PaymentTypeComparison(
+        annuity_payment=annuity.estimate_row(1).payment_amount,
+        annuity_interest=annuity.estimated_total_interest,
+        differentiated_first_payment=differentiated.row(1).payment_amount,
+        differentiated_last_payment=differentiated.payments[-1].payment_amount,
+        differentiated_interest=differentiated.total_interest,
+    )
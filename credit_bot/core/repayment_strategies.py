@@ -2,16 +2,9 @@
 
 from __future__ import annotations
 
-from .helpers import (
-    annual_from_monthly,
-    build_schedule,
-    ensure_positive,
-    original_payment,
-    remaining_principal,
-    round_money,
-)
-from .models import EarlyRepayment, PaymentSchedule
-from .payment_logic import calculate_annuity_payment
+from .helpers import ensure_positive, remaining_principal, round_money
+from .models import EarlyRepayment, PaymentSchedule, PaymentType
+from .payment_types import build_for_type, fixed_amount, schedule_fixed_amount
 
 
 def reduce_term(
@@ -19,14 +12,15 @@ def reduce_term(
     repayment_amount: float,
     monthly_percent: float,
     monthly_payment: float,
+    payment_type: PaymentType = PaymentType.ANNUITY,
 ) -> PaymentSchedule:
-    """Сохраняем платёж, сокращаем срок."""
+    """Сохраняем платёж (долю тела при дифференцированной схеме), сокращаем срок."""
 
     new_balance = round_money(max(balance - repayment_amount, 0.0))
     if new_balance == 0:
         return PaymentSchedule(payments=[])
     ensure_positive(monthly_payment, "monthly_payment")
-    return build_schedule(new_balance, monthly_percent, monthly_payment)
+    return build_for_type(payment_type, new_balance, monthly_percent, monthly_payment)
 
 
 def reduce_payment(
@@ -34,6 +28,7 @@ def reduce_payment(
     repayment_amount: float,
     monthly_percent: float,
     months_left: int,
+    payment_type: PaymentType = PaymentType.ANNUITY,
 ) -> PaymentSchedule:
     """Сохраняем срок, уменьшаем платёж."""
 
@@ -41,9 +36,9 @@ def reduce_payment(
     new_balance = round_money(max(balance - repayment_amount, 0.0))
     if new_balance == 0:
         return PaymentSchedule(payments=[])
-    annual_rate = annual_from_monthly(monthly_percent)
-    new_payment = calculate_annuity_payment(new_balance, months_left, annual_rate)
-    return build_schedule(
+    new_payment = fixed_amount(payment_type, new_balance, monthly_percent, months_left)
+    return build_for_type(
+        payment_type,
         new_balance,
         monthly_percent,
         new_payment,
@@ -56,6 +51,7 @@ def payment_then_term(
     repayment: EarlyRepayment,
     monthly_percent: float,
     months_left: int,
+    payment_type: PaymentType = PaymentType.ANNUITY,
 ) -> PaymentSchedule:
     """Сначала уменьшаем платёж, затем срок."""
 
@@ -67,16 +63,18 @@ def payment_then_term(
         repayment.amount,
         monthly_percent,
         months_left,
+        payment_type,
     )
     if not intermediate.payments:
         return PaymentSchedule(payments=[])
     new_balance = remaining_principal(intermediate, 0)
-    new_payment_value = original_payment(intermediate)
+    new_payment_value = schedule_fixed_amount(payment_type, intermediate)
     return reduce_term(
         new_balance,
         repayment.secondary_amount,
         monthly_percent,
         monthly_payment=new_payment_value,
+        payment_type=payment_type,
     )
 
 
@@ -87,6 +85,7 @@ def term_then_payment(
     months_left: int,
     monthly_payment: float,
     payments_made: int,
+    payment_type: PaymentType = PaymentType.ANNUITY,
 ) -> tuple[PaymentSchedule, float]:
     """Сначала уменьшаем срок, затем платёж (с двумя датами)."""
 
@@ -100,6 +99,7 @@ def term_then_payment(
         repayment.amount,
         monthly_percent,
         monthly_payment,
+        payment_type,
     )
     delta = repayment.secondary_execute_after_payments - payments_made
     if delta < 0:
@@ -109,11 +109,7 @@ def term_then_payment(
     if delta > after_term.months:
         raise ValueError("Вторая дата превышает длительность графика.")
 
-    interest_between = 0.0
-    if delta > 0:
-        interest_between = sum(
-            payment.interest_amount for payment in after_term.payments[:delta]
-        )
+    interest_between = after_term.index.interest_up_to(delta)
 
     balance_after = remaining_principal(after_term, delta)
     months_after = after_term.months - delta
@@ -125,6 +121,7 @@ def term_then_payment(
         repayment.secondary_amount,
         monthly_percent,
         months_after,
+        payment_type,
     )
     return schedule, interest_between
 
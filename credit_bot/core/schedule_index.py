@@ -0,0 +1,66 @@
+"""Префиксные суммы графика для запросов «за первые k месяцев»."""
+
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from .models import Payment
+
+
+class ScheduleIndex:
+    """Накопленные проценты, тело и выплаты, построенные один раз за O(n).
+
+    Любой запрос вида «сумма за первые k платежей» после построения
+    выполняется за O(1) и не копирует срез графика.
+    """
+
+    __slots__ = ("_interest", "_principal", "_paid")
+
+    def __init__(
+        self,
+        interest: Iterable[float],
+        principal: Iterable[float],
+        paid: Iterable[float],
+    ) -> None:
+        self._interest = array("d", accumulate(interest, initial=0.0))
+        self._principal = array("d", accumulate(principal, initial=0.0))
+        self._paid = array("d", accumulate(paid, initial=0.0))
+
+    @classmethod
+    def from_payments(cls, payments: Sequence[Payment]) -> ScheduleIndex:
+        """Строит индекс по списку строк графика."""
+
+        return cls(
+            (p.interest_amount for p in payments),
+            (p.principal_amount for p in payments),
+            (p.payment_amount for p in payments),
+        )
+
+    @property
+    def months(self) -> int:
+        """Возвращает количество месяцев в проиндексированном графике."""
+
+        return len(self._paid) - 1
+
+    def _position(self, months: int) -> int:
+        """Ограничивает номер месяца границами графика."""
+
+        return min(max(months, 0), self.months)
+
+    def interest_up_to(self, months: int) -> float:
+        """Возвращает проценты, уплаченные за первые ``months`` платежей."""
+
+        return self._interest[self._position(months)]
+
+    def principal_up_to(self, months: int) -> float:
+        """Возвращает погашенное тело долга за первые ``months`` платежей."""
+
+        return self._principal[self._position(months)]
+
+    def paid_up_to(self, months: int) -> float:
+        """Возвращает сумму выплат за первые ``months`` платежей."""
+
+        return self._paid[self._position(months)]
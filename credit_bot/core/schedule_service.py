@@ -0,0 +1,148 @@
+"""Расчёт базовых графиков с кэшированием."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Optional, Sequence, TypeVar
+
+from .analytic_schedule import AnalyticSchedule
+from .batch import ScheduleBatch, generate_schedules_batch
+from .cache import CalculationCache, calculation_cache, normalize_loan_key
+from .columnar import ColumnarSchedule
+from .differentiated import DifferentiatedSchedule
+from .kopeck_kernel import ENGINE_FLOAT, ROUND_HALF_UP, engine_functions
+from .models import PaymentSchedule
+from .payment_logic import (
+    generate_columnar_schedule,
+    generate_differentiated_schedule,
+    summarize_differentiated_schedule,
+    summarize_payment_schedule,
+)
+
+T = TypeVar("T")
+
+
+class ScheduleService:
+    """Построение базовых графиков и платежей.
+
+    Графики и платежи кэшируются в ``cache`` (по умолчанию общий кэш ядра);
+    ``cache=None`` отключает кэширование. Графики из кэша разделяются между
+    вызовами и не должны изменяться. ``engine`` выбирает ядро графика
+    (``"float"`` или ``"kopeck"``), ``rounding`` — округление копеечного ядра.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[CalculationCache] = calculation_cache,
+        engine: str = ENGINE_FLOAT,
+        rounding: str = ROUND_HALF_UP,
+    ) -> None:
+        self._cache = cache
+        self.engine, self.rounding = engine, rounding
+        self._payment, self._schedule = engine_functions(engine, rounding)
+        self._suffix = "" if engine == ENGINE_FLOAT else f":{engine}:{rounding}"
+
+    def __reduce__(self) -> tuple[Callable[[], ScheduleService], tuple[()]]:
+        """Передаёт сервис в другой процесс без кэша: там используется свой.
+
+        Отключённое кэширование (``cache=None``) сохраняется и после передачи.
+        """
+
+        options = {"engine": self.engine, "rounding": self.rounding}
+        if self._cache is None:
+            options["cache"] = None
+        return partial(type(self), **options), ()
+
+    def _cached(
+        self,
+        kind: str,
+        compute: Callable[[float, int, float], T],
+        amount: float,
+        term_months: int,
+        annual_interest_rate: float,
+    ) -> T:
+        """Выполняет расчёт через кэш, если он включён."""
+
+        if self._cache is None:
+            return compute(amount, term_months, annual_interest_rate)
+        kind += self._suffix
+        key = normalize_loan_key(kind, amount, term_months, annual_interest_rate)
+        return self._cache.get_or_compute(
+            key, lambda: compute(amount, term_months, annual_interest_rate)
+        )
+
+    def calculate_annuity_payment(
+        self,
+        amount: float,
+        term_months: int,
+        annual_interest_rate: float,
+    ) -> float:
+        """Возвращает аннуитетный платёж."""
+
+        return self._cached(
+            "payment", self._payment, amount, term_months, annual_interest_rate
+        )
+
+    def generate_payment_schedule(
+        self,
+        amount: float,
+        term_months: int,
+        annual_interest_rate: float,
+    ) -> PaymentSchedule:
+        """Генерирует график платежей."""
+
+        return self._cached(
+            "schedule", self._schedule, amount, term_months, annual_interest_rate
+        )
+
+    def generate_payment_schedules_batch(
+        self,
+        amounts: Sequence[float],
+        terms: Sequence[int],
+        rates: Sequence[float],
+    ) -> ScheduleBatch:
+        """Генерирует графики для множества кредитов одним векторным проходом."""
+
+        return generate_schedules_batch(amounts, terms, rates)
+
+    def generate_columnar_schedule(
+        self,
+        amount: float,
+        term_months: int,
+        annual_interest_rate: float,
+    ) -> ColumnarSchedule:
+        """Генерирует график в компактном столбцовом представлении."""
+
+        return generate_columnar_schedule(amount, term_months, annual_interest_rate)
+
+    def summarize_payment_schedule(
+        self,
+        amount: float,
+        term_months: int,
+        annual_interest_rate: float,
+    ) -> AnalyticSchedule:
+        """Возвращает график с O(1)-оценками итогов и точным расчётом по запросу."""
+
+        return summarize_payment_schedule(amount, term_months, annual_interest_rate)
+
+    def generate_differentiated_schedule(
+        self, amount: float, term_months: int, annual_interest_rate: float
+    ) -> PaymentSchedule:
+        """Генерирует дифференцированный график платежей."""
+
+        return self._cached(
+            "differentiated",
+            generate_differentiated_schedule,
+            amount,
+            term_months,
+            annual_interest_rate,
+        )
+
+    def summarize_differentiated_schedule(
+        self, amount: float, term_months: int, annual_interest_rate: float
+    ) -> DifferentiatedSchedule:
+        """Возвращает итоги дифференцированного графика по формуле."""
+
+        return summarize_differentiated_schedule(
+            amount, term_months, annual_interest_rate
+        )
@@ -0,0 +1,134 @@
+"""Компактный двоичный формат графиков и результатов досрочки.
+
+Формат версионирован: заголовок ``HEADER`` содержит сигнатуру, версию,
+вид записи и число строк. Строки хранятся не построчно, а четырьмя
+столбцами little-endian float64 в порядке ``COLUMNS``, поэтому при
+разборе столбцы становятся срезами ``memoryview`` без копирования.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Dict, Sequence
+
+from .columnar import COLUMNS, ColumnarSchedule
+from .models import PaymentSchedule
+
+MAGIC = b"CBS"
+FORMAT_VERSION = 1
+KIND_SCHEDULE = 1
+KIND_RESULT = 2
+
+# Сигнатура, версия, вид, выравнивание до 8 байт, число строк
+HEADER = struct.Struct("<3sBB3xQ")
+# Итоговые проценты, проценты до досрочки, годовая ставка, число месяцев
+RESULT = struct.Struct("<dddQ")
+ITEM_SIZE = array("d").itemsize
+NATIVE_LITTLE = sys.byteorder == "little"
+
+
+def _columns(schedule: PaymentSchedule | ColumnarSchedule) -> list[Sequence[float]]:
+    """Возвращает столбцы графика, проверяя, что формат их не исказит."""
+
+    if isinstance(schedule, ColumnarSchedule):
+        return [schedule.column(name) for name in COLUMNS]
+    rows = schedule.payments
+    for number, payment in enumerate(rows, start=1):
+        if payment.number != number or payment.date is not None:
+            raise ValueError(
+                "Формат поддерживает только графики без дат с 1-го месяца."
+            )
+    return [
+        array("d", (p.payment_amount for p in rows)),
+        array("d", (p.principal_amount for p in rows)),
+        array("d", (p.interest_amount for p in rows)),
+        array("d", (p.remaining_principal for p in rows)),
+    ]
+
+
+def _pack(
+    kind: int, schedule: PaymentSchedule | ColumnarSchedule, extra: bytes
+) -> bytes:
+    columns = _columns(schedule)
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, kind, schedule.months), extra]
+    for column in columns:
+        if NATIVE_LITTLE:
+            parts.append(memoryview(column).cast("B"))
+        else:
+            swapped = array("d", column)
+            swapped.byteswap()
+            parts.append(swapped.tobytes())
+    return b"".join(parts)
+
+
+def _unpack(
+    data: bytes | bytearray | memoryview, kind: int, offset: int
+) -> ColumnarSchedule:
+    view = memoryview(data).cast("B")
+    if len(view) < HEADER.size:
+        raise ValueError("Данные короче заголовка.")
+    magic, version, stored_kind, rows = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Неизвестная сигнатура данных.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {version}")
+    if stored_kind != kind:
+        raise ValueError("Данные содержат запись другого вида.")
+    size = rows * ITEM_SIZE
+    if len(view) != offset + size * len(COLUMNS):
+        raise ValueError("Длина данных не совпадает с заголовком.")
+    columns: Dict[str, Sequence[float]] = {}
+    for name in COLUMNS:
+        end = offset + size
+        chunk = view[offset:end]
+        if NATIVE_LITTLE:
+            columns[name] = chunk.cast("d")
+        else:
+            column = array("d", chunk.tobytes())
+            column.byteswap()
+            columns[name] = column
+        offset = end
+    return ColumnarSchedule(**columns)
+
+
+def encode_schedule(schedule: PaymentSchedule | ColumnarSchedule) -> bytes:
+    """Упаковывает график в двоичный вид."""
+
+    return _pack(KIND_SCHEDULE, schedule, b"")
+
+
+def decode_schedule(data: bytes | bytearray | memoryview) -> ColumnarSchedule:
+    """Разбирает график; столбцы ссылаются на ``data`` без копирования."""
+
+    return _unpack(data, KIND_SCHEDULE, HEADER.size)
+
+
+def encode_result(result: Dict[str, object]) -> bytes:
+    """Упаковывает результат ``apply_early_repayment`` вместе с графиком."""
+
+    extra = RESULT.pack(
+        result["total_interest"],
+        result["interest_before"],
+        result["annual_rate"],
+        result["months"],
+    )
+    return _pack(KIND_RESULT, result["schedule"], extra)
+
+
+def decode_result(data: bytes | bytearray | memoryview) -> Dict[str, object]:
+    """Разбирает результат досрочки; график возвращается столбцовым."""
+
+    schedule = _unpack(data, KIND_RESULT, HEADER.size + RESULT.size)
+    view = memoryview(data).cast("B")
+    total_interest, interest_before, annual_rate, months = RESULT.unpack_from(
+        view, HEADER.size
+    )
+    return {
+        "schedule": schedule,
+        "total_interest": total_interest,
+        "interest_before": interest_before,
+        "months": months,
+        "annual_rate": annual_rate,
+    }
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from loguru import logger
 
-from .early_repayment import apply_early_repayment
+from .early_repayment import evaluate_repayment, prepare_repayment
 from .helpers import ensure_positive
-from .models import EarlyRepayment
-from .payment_logic import generate_payment_schedule
+from .log_limits import log_exception
+from .models import EarlyRepayment, PaymentType
+from .payment_types import generate_schedule
+
+# Бюджет пересчётов графика на один поиск
+DEFAULT_MAX_EVALUATIONS = 30
+# Точность по сумме досрочки, рубли
+AMOUNT_RESOLUTION = 1.0
 
 
 def find_optimal_strategy_by_overpayment(
@@ -17,60 +25,85 @@ def find_optimal_strategy_by_overpayment(
     target_overpayment: float,
     repayment_strategy: EarlyRepayment,
     tolerance: float,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS,
+    payment_type: PaymentType = PaymentType.ANNUITY,
 ) -> dict[str, object]:
-    """Выполняет бинарный поиск по сумме досрочного платежа."""
+    """Ищет сумму досрочки методом Иллинойса (регула фальси с защитой).
+
+    Переплата монотонно убывает с ростом досрочки, поэтому корень всегда
+    остаётся внутри отрезка [0, остаток долга]. Остаток, ставка и проценты
+    до досрочки вычисляются один раз, каждая итерация пересчитывает только
+    график после досрочки. Число пересчётов возвращается в ``evaluations``.
+    """
 
     try:
         ensure_positive(target_overpayment, "target_overpayment")
-        base_schedule = generate_payment_schedule(amount, term_months, annual_interest_rate)
+        ensure_positive(max_evaluations, "max_evaluations")
+        base_schedule = generate_schedule(
+            amount, term_months, annual_interest_rate, payment_type
+        )
         base_interest = base_schedule.total_interest
+        fallback = {
+            "early_repayment": 0.0,
+            "overpayment": base_interest,
+            "schedule": base_schedule,
+            "evaluations": 0,
+        }
         if base_interest <= target_overpayment:
-            return {
-                "early_repayment": 0.0,
-                "overpayment": base_interest,
-                "schedule": base_schedule,
-            }
+            return fallback
 
-        low, high = 0.0, amount
+        context = prepare_repayment(
+            base_schedule, repayment_strategy.execute_after_payments, payment_type
+        )
+        evaluations = 0
         best_result: dict[str, object] | None = None
         best_diff = float("inf")
 
-        while high - low > 1:
-            mid = (low + high) / 2
-            candidate = EarlyRepayment(
-                amount=mid,
-                strategy=repayment_strategy.strategy,
-                execute_after_payments=repayment_strategy.execute_after_payments,
-                secondary_amount=repayment_strategy.secondary_amount,
-            )
-            recalculated = apply_early_repayment(
-                current_schedule=base_schedule,
-                repayment=candidate,
-                payments_made=repayment_strategy.execute_after_payments,
-            )
+        def excess(value: float) -> float:
+            """Пересчитывает график и возвращает отклонение от цели."""
+
+            nonlocal evaluations, best_result, best_diff
+            evaluations += 1
+            candidate = replace(repayment_strategy, amount=value)
+            recalculated = evaluate_repayment(context, candidate)
             overpayment = recalculated["total_interest"]
             diff = overpayment - target_overpayment
-            abs_diff = abs(diff)
-            if abs_diff < best_diff:
-                best_diff = abs_diff
+            if abs(diff) < best_diff:
+                best_diff = abs(diff)
                 best_result = {
-                    "early_repayment": mid,
+                    "early_repayment": value,
                     "overpayment": overpayment,
                     "schedule": recalculated["schedule"],
                 }
-            if abs_diff <= tolerance:
+            return diff
+
+        low, low_diff = 0.0, base_interest - target_overpayment
+        high = context.balance
+        high_diff = excess(high)
+        side = 0
+        while best_diff > tolerance and high - low > AMOUNT_RESOLUTION:
+            if evaluations >= max_evaluations:
+                logger.warning("Поиск досрочки исчерпал бюджет пересчётов.")
+                break
+            if high_diff >= 0:
+                # Даже полное погашение не даёт нужной переплаты
                 break
-            if diff > 0:
-                low = mid
+            point = high - high_diff * (high - low) / (high_diff - low_diff)
+            point_diff = excess(point)
+            if point_diff < 0:
+                high, high_diff = point, point_diff
+                if side == -1:
+                    low_diff /= 2
+                side = -1
             else:
-                high = mid
+                low, low_diff = point, point_diff
+                if side == 1:
+                    high_diff /= 2
+                side = 1
 
-        return best_result or {
-            "early_repayment": 0.0,
-            "overpayment": base_interest,
-            "schedule": base_schedule,
-        }
+        result = best_result or fallback
+        result["evaluations"] = evaluations
+        return result
     except ValueError:
-        logger.exception("Ошибка при поиске оптимальной стратегии.")
+        log_exception("Ошибка при поиске оптимальной стратегии.")
         raise
-
@@ -0,0 +1,102 @@
+"""Потоковая выдача строк графика и экспорт без материализации списков."""
+
+from __future__ import annotations
+
+import csv
+import json
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+
+from .helpers import iter_schedule_rows, monthly_rate
+from .log_limits import log_exception
+from .models import Loan, Payment
+from .payment_logic import calculate_annuity_payment
+
+EXPORT_CSV = "csv"
+EXPORT_JSONL = "jsonl"
+DEFAULT_CHUNK_ROWS = 1024
+EXPORT_FIELDS = (
+    "loan",
+    "number",
+    "payment_amount",
+    "principal_amount",
+    "interest_amount",
+    "remaining_principal",
+)
+
+Row = tuple[int, float, float, float, float]
+
+
+def _rows(
+    amount: float, term_months: int, annual_interest_rate: float
+) -> Iterator[Row]:
+    """Проверяет параметры сразу и возвращает ленивый генератор строк."""
+
+    try:
+        payment = calculate_annuity_payment(amount, term_months, annual_interest_rate)
+        monthly_percent = monthly_rate(annual_interest_rate)
+    except ValueError:
+        log_exception("Ошибка при потоковом расчёте графика.")
+        raise
+    return iter_schedule_rows(amount, monthly_percent, payment, term_months)
+
+
+def iter_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+) -> Iterator[Payment]:
+    """Выдаёт строки аннуитетного графика по одной, не собирая список.
+
+    Строки совпадают с ``generate_payment_schedule``; некорректные
+    параметры отклоняются при вызове, а не при первой итерации.
+    """
+
+    rows = _rows(amount, term_months, annual_interest_rate)
+    return (Payment(number, None, *values) for number, *values in rows)
+
+
+def _chunks(loans: Iterable[Loan], size: int) -> Iterator[list[tuple]]:
+    """Группирует строки всех кредитов в порции не длиннее ``size``."""
+
+    rows = (
+        (index, *row)
+        for index, loan in enumerate(loans)
+        for row in _rows(loan.amount, loan.term_months, loan.annual_interest_rate)
+    )
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def export_schedules(
+    loans: Iterable[Loan],
+    stream: TextIO,
+    fmt: str = EXPORT_CSV,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Пишет графики кредитов в ``stream`` порциями и возвращает число строк.
+
+    Кредиты и строки перебираются лениво, поэтому в памяти одновременно
+    находится не больше ``chunk_rows`` строк независимо от числа кредитов.
+    Колонка ``loan`` содержит порядковый номер кредита во входных данных.
+    """
+
+    if fmt not in (EXPORT_CSV, EXPORT_JSONL):
+        raise ValueError(f"Неизвестный формат экспорта: {fmt}")
+    if chunk_rows <= 0:
+        raise ValueError("Размер порции должен быть положительным.")
+    written = 0
+    writer = csv.writer(stream, lineterminator="\n") if fmt == EXPORT_CSV else None
+    if writer is not None:
+        writer.writerow(EXPORT_FIELDS)
+    for chunk in _chunks(loans, chunk_rows):
+        if writer is not None:
+            writer.writerows(chunk)
+        else:
+            stream.write(
+                "".join(
+                    json.dumps(dict(zip(EXPORT_FIELDS, row))) + "\n" for row in chunk
+                )
+            )
+        written += len(chunk)
+    return written
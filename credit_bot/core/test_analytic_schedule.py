@@ -0,0 +1,80 @@
+"""Тесты аналитического расчёта графика."""
+
+import pytest
+
+from .analytic_schedule import AnalyticSchedule
+from .helpers import build_schedule, monthly_rate
+from .payment_logic import (
+    calculate_annuity_payment,
+    generate_payment_schedule,
+    summarize_payment_schedule,
+)
+
+CASES = [
+    (1_000_000, 60, 10.0),
+    (3_500_000, 360, 8.5),
+    (250_000, 12, 0.0),
+    (12_000_000, 480, 17.9),
+]
+
+
+@pytest.mark.parametrize(("amount", "term", "rate"), CASES)
+def test_totals_match_monthly_schedule(amount: float, term: int, rate: float) -> None:
+    """Точные итоги совпадают с помесячным расчётом до копейки."""
+
+    analytic = summarize_payment_schedule(amount, term, rate)
+    exact = generate_payment_schedule(amount, term, rate)
+    assert analytic.months == exact.months
+    assert analytic.total_paid == exact.total_paid
+    assert analytic.total_interest == exact.total_interest
+
+
+@pytest.mark.parametrize(("amount", "term", "rate"), CASES)
+def test_estimates_stay_within_error_bound(
+    amount: float, term: int, rate: float
+) -> None:
+    """O(1)-оценки отличаются от точного графика не больше ``error_bound``."""
+
+    analytic = summarize_payment_schedule(amount, term, rate)
+    exact = generate_payment_schedule(amount, term, rate)
+    assert analytic.estimated_months == exact.months
+    assert analytic.estimated_total_interest == pytest.approx(
+        exact.total_interest, abs=analytic.error_bound + 0.01
+    )
+    for number in (1, 2, term // 2, term - 1, term):
+        row = analytic.estimate_row(number)
+        reference = exact.payments[number - 1]
+        assert row.number == reference.number
+        assert row.remaining_principal == pytest.approx(
+            reference.remaining_principal, abs=analytic.error_bound + 0.01
+        )
+
+
+@pytest.mark.parametrize(("amount", "term", "rate"), CASES)
+def test_row_access_matches_monthly_schedule(
+    amount: float, term: int, rate: float
+) -> None:
+    """Точные строки совпадают с помесячным графиком."""
+
+    analytic = summarize_payment_schedule(amount, term, rate)
+    exact = generate_payment_schedule(amount, term, rate)
+    for number in (1, 2, term // 2, term - 1, term):
+        assert analytic.row(number) == exact.payments[number - 1]
+
+
+def test_rows_are_not_built_until_requested() -> None:
+    """Полный список строк создаётся только по запросу."""
+
+    rate = monthly_rate(12.0)
+    payment = calculate_annuity_payment(700_000, 36, 12.0)
+    analytic = AnalyticSchedule(700_000, rate, payment, months_limit=36)
+    assert analytic.estimated_months == 36
+    assert analytic._full is None
+    assert analytic.payments == build_schedule(700_000, rate, payment, 36).payments
+
+
+def test_payment_below_interest_is_rejected() -> None:
+    """Платёж меньше процентов приводит к ошибке, как и в помесячном расчёте."""
+
+    with pytest.raises(ValueError):
+        AnalyticSchedule(1_000_000, monthly_rate(12.0), 5_000.0)
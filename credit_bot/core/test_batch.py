@@ -0,0 +1,44 @@
+"""Тесты пакетного расчёта графиков."""
+
+import numpy as np
+import pytest
+
+from .batch import round_money_array
+from .calculator import CreditCalculator
+from .helpers import round_money
+
+LOANS = [
+    (1_000_000, 60, 10.0),
+    (500_000, 24, 11.0),
+    (3_500_000, 360, 8.5),
+    (250_000, 12, 0.0),
+    (99_999.99, 1, 19.99),
+    (12_345_678.9, 480, 23.7),
+]
+
+
+def test_batch_matches_single_schedules_exactly() -> None:
+    """Каждая строка пакета побитово совпадает с одиночным расчётом."""
+
+    calculator = CreditCalculator()
+    amounts, terms, rates = zip(*LOANS)
+    batch = calculator.generate_payment_schedules_batch(amounts, terms, rates)
+    for index, loan in enumerate(LOANS):
+        single = calculator.generate_payment_schedule(*loan)
+        assert batch.months[index] == single.months
+        assert batch.schedule(index).payments == single.payments
+
+
+def test_round_money_array_matches_round_money() -> None:
+    """Векторное округление совпадает со скалярным, включая половину копейки."""
+
+    values = np.array([0.005, 1.005, 2.675, 1234.565, -0.004, 10.0049999999, 1e9 / 3])
+    expected = [round_money(float(value)) for value in values]
+    assert round_money_array(values).tolist() == expected
+
+
+def test_batch_rejects_mismatched_lengths() -> None:
+    """Массивы параметров разной длины отклоняются."""
+
+    with pytest.raises(ValueError):
+        CreditCalculator().generate_payment_schedules_batch([100_000], [12, 24], [5.0])
@@ -0,0 +1,54 @@
+"""Тесты кэша расчётов."""
+
+from .cache import CalculationCache, estimate_size
+from .calculator import CreditCalculator
+
+
+class FakeClock:
+    """Управляемые часы для проверки TTL."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_calculator_reuses_cached_schedule() -> None:
+    """Повторный запрос с теми же параметрами берётся из кэша."""
+
+    cache = CalculationCache()
+    calculator = CreditCalculator(cache=cache)
+    first = calculator.generate_payment_schedule(1_000_000, 60, 10.0)
+    second = CreditCalculator(cache=cache).generate_payment_schedule(
+        1_000_000.0, 60, 10.0000000001
+    )
+    assert first is second
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.size_bytes == estimate_size(first)
+
+
+def test_cache_evicts_least_recently_used_by_bytes() -> None:
+    """При превышении лимита в байтах вытесняется самая старая запись."""
+
+    calculator = CreditCalculator(cache=None)
+    schedule = calculator.generate_payment_schedule(500_000, 24, 11.0)
+    cache = CalculationCache(max_bytes=estimate_size(schedule) * 2)
+    cache.put("a", schedule)
+    cache.put("b", schedule)
+    cache.get_or_compute("a", lambda: None)
+    cache.put("c", schedule)
+    assert cache.stats.evictions == 1
+    assert cache.get_or_compute("b", lambda: "fresh") == "fresh"
+    assert len(cache) == 2
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    """Запись старше TTL пересчитывается."""
+
+    clock = FakeClock()
+    cache = CalculationCache(ttl_seconds=10.0, clock=clock)
+    cache.put("key", 1)
+    clock.now = 11.0
+    assert cache.get_or_compute("key", lambda: 2) == 2
+    assert cache.stats.expirations == 1
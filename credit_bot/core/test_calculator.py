@@ -76,6 +76,23 @@ def test_find_optimal_strategy_by_overpayment(calculator: CreditCalculator) -> N
         tolerance=500.0,
     )
     assert abs(result["overpayment"] - 150_000) <= 500.0
+    assert result["evaluations"] <= 10
+
+
+def test_find_optimal_strategy_respects_budget(calculator: CreditCalculator) -> None:
+    """Поиск досрочки не превышает заданный бюджет пересчётов."""
+
+    repayment = EarlyRepayment(
+        amount=0,
+        strategy=EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT,
+        execute_after_payments=12,
+        secondary_amount=50_000,
+        secondary_execute_after_payments=24,
+    )
+    result = calculator.find_optimal_strategy_by_overpayment(
+        2_000_000, 120, 11.0, 700_000, repayment, tolerance=0.01, max_evaluations=3
+    )
+    assert result["evaluations"] <= 3
 
 
 def test_calculate_payment_by_target_overpayment(calculator: CreditCalculator) -> None:
@@ -90,3 +107,33 @@ def test_calculate_payment_by_target_overpayment(calculator: CreditCalculator) -
     assert abs(result["overpayment"] - 120_000) <= 1_000.0
     assert result["payment"] > 0
 
+
+def test_schedule_index_prefix_sums(calculator: CreditCalculator) -> None:
+    """Префиксные суммы графика совпадают с суммами по срезам."""
+
+    schedule = calculator.generate_payment_schedule(600_000, 30, 13.0)
+    assert schedule.index is schedule.index
+    for months in (0, 5, 30, 40):
+        head = schedule.payments[:months]
+        assert schedule.index.interest_up_to(months) == sum(
+            p.interest_amount for p in head
+        )
+        assert schedule.index.paid_up_to(months) == sum(p.payment_amount for p in head)
+
+
+@pytest.mark.parametrize("method", ["newton", "bisection"])
+def test_payment_search_methods_reach_target(
+    calculator: CreditCalculator, method: str
+) -> None:
+    """Оба режима подбора платежа укладываются в допуск."""
+
+    result = calculator.calculate_payment_by_target_overpayment(
+        amount=3_000_000,
+        annual_interest_rate=9.0,
+        target_overpayment=1_500_000,
+        tolerance=50.0,
+        method=method,
+    )
+    assert abs(result["overpayment"] - 1_500_000) <= 50.0
+    if method == "newton":
+        assert result["evaluations"] <= 10
@@ -0,0 +1,43 @@
+"""Тесты столбцового представления графика."""
+
+import pytest
+
+from .calculator import CreditCalculator, schedule_to_dict
+from .columnar import ColumnarSchedule
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator()
+
+
+def test_columnar_matches_payment_schedule(calculator: CreditCalculator) -> None:
+    """Строки и итоги совпадают с обычным графиком."""
+
+    schedule = calculator.generate_payment_schedule(3_500_000, 360, 8.5)
+    columnar = calculator.generate_columnar_schedule(3_500_000, 360, 8.5)
+    assert columnar.months == schedule.months
+    assert list(columnar.payments) == schedule.payments
+    assert columnar.total_paid == schedule.total_paid
+    assert columnar.total_interest == schedule.total_interest
+    assert schedule_to_dict(columnar) == schedule_to_dict(schedule)
+
+
+def test_cumulative_sums(calculator: CreditCalculator) -> None:
+    """Накопленные суммы совпадают с суммой по срезу."""
+
+    schedule = calculator.generate_payment_schedule(700_000, 36, 12.0)
+    columnar = ColumnarSchedule.from_schedule(schedule)
+    for months in (0, 1, 12, 36, 100):
+        expected = sum(p.interest_amount for p in schedule.payments[:months])
+        assert columnar.index.interest_up_to(months) == expected
+
+
+def test_payments_view_indexing(calculator: CreditCalculator) -> None:
+    """Представление строк поддерживает отрицательные индексы и срезы."""
+
+    columnar = calculator.generate_columnar_schedule(500_000, 24, 11.0)
+    assert columnar.payments[-1].number == 24
+    assert [p.number for p in columnar.payments[2:5]] == [3, 4, 5]
+    with pytest.raises(IndexError):
+        columnar.payments[24]
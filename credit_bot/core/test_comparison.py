@@ -0,0 +1,43 @@
+"""Тесты сравнения стратегий досрочки."""
+
+import pytest
+
+from .calculator import CreditCalculator
+from .models import EarlyRepayment, EarlyRepaymentStrategy, Loan
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator()
+
+
+def test_comparison_matches_single_strategies(calculator: CreditCalculator) -> None:
+    """Строки таблицы совпадают с расчётом каждой стратегии по отдельности."""
+
+    loan = Loan(amount=3_000_000, term_months=240, annual_interest_rate=11.0)
+    table = calculator.compare_strategies(loan, 400_000, 24)
+    schedule = calculator.generate_payment_schedule(3_000_000, 240, 11.0)
+
+    assert [row.strategy for row in table.rows] == list(EarlyRepaymentStrategy)
+    assert table.base_months_left == 216
+    for strategy, row in zip(
+        (EarlyRepaymentStrategy.REDUCE_TERM, EarlyRepaymentStrategy.REDUCE_PAYMENT),
+        table.rows,
+    ):
+        single = calculator.apply_early_repayment(
+            schedule, EarlyRepayment(400_000, strategy, 24), 24
+        )
+        assert row.total_interest == single["total_interest"]
+        assert row.savings == schedule.total_interest - single["total_interest"]
+    assert table.best().strategy == EarlyRepaymentStrategy.REDUCE_TERM
+    assert table.rows[1].months_left == 216
+
+
+def test_comparison_skips_impossible_second_step(calculator: CreditCalculator) -> None:
+    """Если кредит гасится раньше второй даты, строка стратегии опускается."""
+
+    loan = Loan(amount=100_000, term_months=24, annual_interest_rate=10.0)
+    table = calculator.compare_strategies(loan, 80_000, 2)
+    assert EarlyRepaymentStrategy.COMBINED_TERM_THEN_PAYMENT not in {
+        row.strategy for row in table.rows
+    }
@@ -0,0 +1,99 @@
+"""Тесты дифференцированной схемы платежей."""
+
+import pytest
+
+from .calculator import CreditCalculator
+from .models import EarlyRepayment, EarlyRepaymentStrategy, Loan, PaymentType
+
+CASES = [
+    (1_000_000, 60, 10.0),
+    (3_500_000, 360, 8.5),
+    (250_000, 12, 0.0),
+    (100, 3, 12.0),
+]
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator()
+
+
+@pytest.mark.parametrize(("amount", "term", "rate"), CASES)
+def test_summary_matches_monthly_schedule(
+    calculator: CreditCalculator, amount: float, term: int, rate: float
+) -> None:
+    """Ленивые строки совпадают с графиком, итоги — в пределах оценки."""
+
+    schedule = calculator.generate_differentiated_schedule(amount, term, rate)
+    summary = calculator.summarize_differentiated_schedule(amount, term, rate)
+    assert schedule.months == summary.months == term
+    assert list(summary.payments) == schedule.payments
+    assert summary.total_interest == pytest.approx(
+        schedule.total_interest, abs=summary.error_bound
+    )
+    assert sum(p.principal_amount for p in schedule.payments) == pytest.approx(amount)
+    assert schedule.payments[-1].remaining_principal == 0.0
+
+
+@pytest.mark.parametrize(
+    ("amount", "term"), [(1_000, 600), (1_000_000, 7), (99.99, 33)]
+)
+def test_requested_term_is_kept(
+    calculator: CreditCalculator, amount: float, term: int
+) -> None:
+    """Округление доли тела не сокращает срок: остаток идёт в последний платёж."""
+
+    schedule = calculator.generate_differentiated_schedule(amount, term, 10.0)
+    summary = calculator.summarize_differentiated_schedule(amount, term, 10.0)
+    part = schedule.payments[0].principal_amount
+    assert schedule.months == summary.months == term
+    assert all(p.principal_amount == part for p in schedule.payments[:-1])
+    assert schedule.payments[-1].principal_amount >= part
+    assert sum(p.principal_amount for p in schedule.payments) == pytest.approx(amount)
+    assert list(summary.payments) == schedule.payments
+
+
+def test_compare_payment_types(calculator: CreditCalculator) -> None:
+    """Дифференцированная схема дешевле аннуитета и начинается с большего платежа."""
+
+    comparison = calculator.compare_payment_types(1_000_000, 60, 10.0)
+    assert comparison.differentiated_interest == pytest.approx(254_166.67, abs=0.5)
+    assert comparison.savings > 0
+    assert comparison.differentiated_first_payment > comparison.annuity_payment
+    assert comparison.differentiated_last_payment < comparison.annuity_payment
+
+
+def test_early_repayment_keeps_schedule_type(calculator: CreditCalculator) -> None:
+    """Сокращение срока сохраняет долю тела, уменьшение платежа — срок."""
+
+    schedule = calculator.generate_differentiated_schedule(1_000_000, 60, 10.0)
+    part = schedule.payments[0].principal_amount
+    shorter = calculator.apply_early_repayment(
+        schedule,
+        EarlyRepayment(100_000, EarlyRepaymentStrategy.REDUCE_TERM, 12),
+        12,
+        PaymentType.DIFFERENTIATED,
+    )["schedule"]
+    assert shorter.payments[0].principal_amount == part
+    assert shorter.months < 48
+    lower = calculator.apply_early_repayment(
+        schedule,
+        EarlyRepayment(100_000, EarlyRepaymentStrategy.REDUCE_PAYMENT, 12),
+        12,
+        PaymentType.DIFFERENTIATED,
+    )["schedule"]
+    assert lower.months == 48
+    assert lower.payments[0].principal_amount < part
+
+
+def test_compare_strategies_for_differentiated_loan(
+    calculator: CreditCalculator,
+) -> None:
+    """Сравнение стратегий строит базовый график по типу платежей кредита."""
+
+    loan = Loan(1_000_000, 60, 10.0, PaymentType.DIFFERENTIATED)
+    comparison = calculator.compare_strategies(loan, 100_000, 12)
+    base = calculator.generate_differentiated_schedule(1_000_000, 60, 10.0)
+    assert comparison.base_interest == base.total_interest
+    assert len(comparison.rows) == 4
+    assert all(row.savings > 0 for row in comparison.rows)
@@ -0,0 +1,43 @@
+"""Тесты инкрементального пересчёта досрочки."""
+
+import pytest
+
+from .calculator import CreditCalculator
+from .models import EarlyRepayment, EarlyRepaymentStrategy
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator()
+
+
+def test_scenario_matches_full_recalculation(calculator: CreditCalculator) -> None:
+    """Смена суммы и даты даёт тот же результат, что и полный пересчёт."""
+
+    schedule = calculator.generate_payment_schedule(2_000_000, 120, 12.0)
+    repayment = EarlyRepayment(100_000, EarlyRepaymentStrategy.REDUCE_TERM, 12)
+    scenario = calculator.create_repayment_scenario(schedule, repayment)
+
+    moved = scenario.with_amount(250_000).with_month(30)
+    expected = calculator.apply_early_repayment(
+        schedule,
+        EarlyRepayment(250_000, EarlyRepaymentStrategy.REDUCE_TERM, 30),
+        30,
+    )
+    assert moved.result["total_interest"] == expected["total_interest"]
+    assert moved.schedule.payments == expected["schedule"].payments
+    assert scenario.with_amount(50_000).context is scenario.context
+
+
+def test_timeline_shares_prefix_rows(calculator: CreditCalculator) -> None:
+    """Префикс хронологии — те же объекты, что и в базовом графике."""
+
+    schedule = calculator.generate_payment_schedule(1_000_000, 60, 10.0)
+    repayment = EarlyRepayment(200_000, EarlyRepaymentStrategy.REDUCE_PAYMENT, 6)
+    scenario = calculator.create_repayment_scenario(schedule, repayment)
+    timeline = scenario.timeline
+
+    assert len(timeline) == 6 + scenario.schedule.months
+    assert timeline[5] is schedule.payments[5]
+    assert timeline[6].number == 7
+    assert timeline[-1].remaining_principal == 0
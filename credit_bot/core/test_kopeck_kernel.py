@@ -0,0 +1,92 @@
+"""Тесты целочисленного ядра графика в копейках."""
+
+import pytest
+
+from .cache import CalculationCache
+from .calculator import CreditCalculator
+from .kopeck_kernel import (
+    ENGINE_KOPECK,
+    ROUND_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    divide,
+)
+
+CASES = [
+    (1_000_000, 60, 10.0),
+    (3_500_000, 360, 8.5),
+    (250_000, 12, 0.0),
+    (1_234_567.89, 37, 11.5),
+    (12_000_000, 480, 17.9),
+]
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator(cache=None, engine=ENGINE_KOPECK)
+
+
+def test_divide_rounding_modes() -> None:
+    """Половина копейки округляется по выбранному правилу."""
+
+    assert [divide(n, 10, ROUND_HALF_UP) for n in (14, 15, 25, 26)] == [1, 2, 3, 3]
+    assert [divide(n, 10, ROUND_HALF_EVEN) for n in (14, 15, 25, 26)] == [1, 2, 2, 3]
+    assert [divide(n, 10, ROUND_DOWN) for n in (14, 15, 25, 26)] == [1, 1, 2, 2]
+
+
+@pytest.mark.parametrize(("amount", "term", "rate"), CASES)
+def test_half_up_matches_float_engine(
+    calculator: CreditCalculator, amount: float, term: int, rate: float
+) -> None:
+    """При округлении половины вверх графики ядер совпадают построчно."""
+
+    reference = CreditCalculator(cache=None).generate_payment_schedule(
+        amount, term, rate
+    )
+    assert calculator.generate_payment_schedule(amount, term, rate) == reference
+    assert calculator.calculate_annuity_payment(amount, term, rate) == (
+        reference.payments[0].payment_amount
+    )
+
+
+@pytest.mark.parametrize("rounding", [ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_DOWN])
+def test_rows_balance_in_kopecks(rounding: str) -> None:
+    """Тело, проценты и платёж сходятся до копейки при любом правиле."""
+
+    calculator = CreditCalculator(cache=None, engine=ENGINE_KOPECK, rounding=rounding)
+    schedule = calculator.generate_payment_schedule(1_234_567.89, 37, 11.5)
+    principal = 0
+    for payment in schedule.payments:
+        paid, part, interest = (
+            round(value * 100)
+            for value in (
+                payment.payment_amount,
+                payment.principal_amount,
+                payment.interest_amount,
+            )
+        )
+        assert paid == part + interest
+        principal += part
+    assert principal == 123_456_789
+    assert schedule.months == 37
+
+
+def test_engines_use_separate_cache_keys() -> None:
+    """Графики разных ядер и правил не подменяют друг друга в общем кэше."""
+
+    cache = CalculationCache()
+    down = CreditCalculator(cache=cache, engine=ENGINE_KOPECK, rounding=ROUND_DOWN)
+    plain = CreditCalculator(cache=cache)
+    first = down.generate_payment_schedule(1_000_000, 60, 10.0)
+    second = plain.generate_payment_schedule(1_000_000, 60, 10.0)
+    assert first is not second
+    assert first.total_interest < second.total_interest
+
+
+def test_unknown_engine_is_rejected() -> None:
+    """Неизвестные ядро и правило округления отклоняются при создании."""
+
+    with pytest.raises(ValueError):
+        CreditCalculator(engine="decimal")
+    with pytest.raises(ValueError):
+        CreditCalculator(engine=ENGINE_KOPECK, rounding="ceiling")
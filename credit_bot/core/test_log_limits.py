@@ -0,0 +1,45 @@
+"""Тесты ограничения частоты журналирования ошибок."""
+
+from loguru import logger
+
+from .log_limits import ErrorLogLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_allows_burst_then_suppresses() -> None:
+    """Проверяет, что сверх лимита записи в окне подавляются."""
+
+    limiter = ErrorLogLimiter(interval=60.0, burst=2, clock=FakeClock())
+    decisions = [limiter.allow("ошибка") for _ in range(4)]
+    assert decisions == [(True, 0), (True, 0), (False, 0), (False, 0)]
+    assert limiter.allow("другая ошибка") == (True, 0)
+
+
+def test_limiter_reports_suppressed_in_next_window() -> None:
+    """Проверяет сводку о подавленных повторах и запись стека."""
+
+    clock = FakeClock()
+    limiter = ErrorLogLimiter(interval=10.0, burst=1, clock=clock)
+    messages: list[str] = []
+    sink = logger.add(messages.append, format="{level} {message}")
+    try:
+        for _ in range(3):
+            try:
+                raise ValueError("bad")
+            except ValueError:
+                limiter.exception("Ошибка расчёта.")
+        clock.now = 10.0
+        limiter.error("Ошибка расчёта.")
+    finally:
+        logger.remove(sink)
+    assert messages[0].startswith("ERROR Ошибка расчёта.")
+    assert "ValueError: bad" in messages[0]
+    assert messages[1].strip() == "WARNING Подавлено повторов «Ошибка расчёта.»: 2"
+    assert messages[2].strip() == "ERROR Ошибка расчёта."
@@ -0,0 +1,27 @@
+"""Тесты сервиса базовых графиков."""
+
+import pickle
+
+from .cache import calculation_cache
+from .kopeck_kernel import ENGINE_KOPECK, ROUND_DOWN
+from .schedule_service import ScheduleService
+
+
+def test_pickling_keeps_cache_choice() -> None:
+    """После передачи в процесс сервис без кэша остаётся без кэша."""
+
+    restored = pickle.loads(pickle.dumps(ScheduleService(cache=None)))
+    assert restored._cache is None
+    restored = pickle.loads(pickle.dumps(ScheduleService()))
+    assert restored._cache is calculation_cache
+
+
+def test_pickling_keeps_engine() -> None:
+    """Ядро и правило округления передаются вместе с сервисом."""
+
+    service = ScheduleService(cache=None, engine=ENGINE_KOPECK, rounding=ROUND_DOWN)
+    restored = pickle.loads(pickle.dumps(service))
+    assert (restored.engine, restored.rounding) == (ENGINE_KOPECK, ROUND_DOWN)
+    assert restored.generate_payment_schedule(
+        500_000, 24, 9.5
+    ) == service.generate_payment_schedule(500_000, 24, 9.5)
@@ -0,0 +1,67 @@
+"""Тесты двоичного формата графиков и результатов досрочки."""
+
+import pytest
+
+from .calculator import CreditCalculator, schedule_to_dict
+from .models import EarlyRepayment, EarlyRepaymentStrategy
+from .serialization import (
+    HEADER,
+    decode_result,
+    decode_schedule,
+    encode_result,
+    encode_schedule,
+)
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator()
+
+
+def test_schedule_round_trip(calculator: CreditCalculator) -> None:
+    """Строки и итоги после разбора совпадают с исходным графиком."""
+
+    schedule = calculator.generate_payment_schedule(3_500_000, 360, 8.5)
+    data = encode_schedule(schedule)
+    decoded = decode_schedule(data)
+    assert len(data) == HEADER.size + 4 * 8 * schedule.months
+    assert decoded.to_schedule() == schedule
+    assert schedule_to_dict(decoded) == schedule_to_dict(schedule)
+    assert decoded.total_interest == schedule.total_interest
+    assert encode_schedule(decoded) == data
+
+
+def test_decode_does_not_copy_columns(calculator: CreditCalculator) -> None:
+    """Столбцы разобранного графика ссылаются на исходный буфер."""
+
+    data = bytearray(encode_schedule(calculator.generate_payment_schedule(1e6, 12, 10)))
+    decoded = decode_schedule(data)
+    start, end = HEADER.size, HEADER.size + 8
+    data[start:end] = bytes(8)
+    assert decoded.column("payment")[0] == 0.0
+
+
+def test_result_round_trip(calculator: CreditCalculator) -> None:
+    """Результат досрочки сохраняет итоги и график для всех стратегий."""
+
+    schedule = calculator.generate_payment_schedule(2_000_000, 120, 9.0)
+    for strategy in EarlyRepaymentStrategy:
+        repayment = EarlyRepayment(150_000, strategy, 12, 50_000, 24)
+        result = calculator.apply_early_repayment(schedule, repayment, 12)
+        decoded = decode_result(encode_result(result))
+        assert decoded["schedule"].to_schedule() == result["schedule"]
+        assert {k: v for k, v in decoded.items() if k != "schedule"} == {
+            k: v for k, v in result.items() if k != "schedule"
+        }
+
+
+def test_decode_rejects_foreign_data(calculator: CreditCalculator) -> None:
+    """Чужая версия, вид записи и обрезанные данные отклоняются."""
+
+    data = encode_schedule(calculator.generate_payment_schedule(500_000, 24, 11.0))
+    with pytest.raises(ValueError):
+        decode_result(data)
+    with pytest.raises(ValueError):
+        decode_schedule(data[:-1])
+    with pytest.raises(ValueError):
+        decode_schedule(data[:3] + bytes([99]) + data[4:])
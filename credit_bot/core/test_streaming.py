@@ -0,0 +1,52 @@
+"""Тесты потоковой выдачи и экспорта графиков."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from .calculator import CreditCalculator, schedule_to_dict
+from .models import Loan
+from .streaming import EXPORT_JSONL, export_schedules
+
+
+@pytest.fixture()
+def calculator() -> CreditCalculator:
+    return CreditCalculator()
+
+
+def test_iter_schedule_matches_generated_schedule(
+    calculator: CreditCalculator,
+) -> None:
+    """Проверяет совпадение потоковых строк с полным графиком."""
+
+    schedule = calculator.generate_payment_schedule(1_200_000, 240, 11.5)
+    rows = calculator.iter_schedule(1_200_000, 240, 11.5)
+    assert list(rows) == schedule.payments
+
+
+def test_iter_schedule_rejects_invalid_parameters_eagerly(
+    calculator: CreditCalculator,
+) -> None:
+    """Проверяет, что ошибка возникает при вызове, а не при итерации."""
+
+    with pytest.raises(ValueError):
+        calculator.iter_schedule(-1, 12, 10.0)
+
+
+def test_export_csv_and_jsonl_in_chunks(calculator: CreditCalculator) -> None:
+    """Проверяет экспорт нескольких кредитов порциями в оба формата."""
+
+    loans = [Loan(500_000, 36, 9.0), Loan(300_000, 12, 0.0)]
+    csv_stream, jsonl_stream = io.StringIO(), io.StringIO()
+    assert export_schedules(iter(loans), csv_stream, chunk_rows=5) == 48
+    assert export_schedules(loans, jsonl_stream, EXPORT_JSONL, chunk_rows=7) == 48
+
+    csv_rows = list(csv.DictReader(io.StringIO(csv_stream.getvalue())))
+    json_rows = [json.loads(line) for line in jsonl_stream.getvalue().splitlines()]
+    expected = schedule_to_dict(calculator.generate_payment_schedule(500_000, 36, 9.0))
+    assert [row["loan"] for row in json_rows].count(1) == 12
+    assert json_rows[35]["remaining_principal"] == expected[35]["remaining_principal"]
+    assert float(csv_rows[0]["interest_amount"]) == expected[0]["interest_amount"]
+    assert csv_rows[-1]["loan"] == "1"
@@ -7,11 +7,13 @@ import sys
 from loguru import logger
 
 from credit_bot.bot.bot import create_bot
+from credit_bot.bot.logging_config import configure_logging
 
 
 def main() -> None:
     """Запускает Telegram-бота."""
 
+    configure_logging()
     try:
         bot = create_bot()
         bot.run()
@@ -23,6 +25,9 @@ def main() -> None:
     except Exception as exc:
         logger.exception("Сбой при запуске бота: {}", exc)
         raise
+    finally:
+        # Дожидаемся записи сообщений из очереди фонового вывода
+        logger.complete()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,231 @@
+"""Бенчмарки расчётного ядра credit_bot.core.
+
+Запуск::
+
+    python scripts/benchmark_core.py --output bench.json
+    python scripts/benchmark_core.py --baseline bench.json --threshold 0.2
+
+Сетки параметров фиксированы, поэтому результаты разных запусков сравнимы.
+Для каждого случая берётся минимум из ``--repeat`` замеров времени одного
+вызова; кэш калькулятора отключён. Случаи ``schedule_kopeck`` строят те же
+графики целочисленным ядром, после замера печатается его ускорение
+относительно float-ядра. В режиме сравнения скрипт завершается с кодом 1,
+если хотя бы один случай замедлился сильнее порога.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from credit_bot.core.calculator import CreditCalculator  # noqa: E402
+from credit_bot.core.kopeck_kernel import ENGINE_KOPECK  # noqa: E402
+from credit_bot.core.models import (  # noqa: E402
+    EarlyRepayment,
+    EarlyRepaymentStrategy,
+)
+from credit_bot.core.payment_search import (  # noqa: E402
+    SEARCH_BISECTION,
+    SEARCH_NEWTON,
+)
+
+FORMAT_VERSION = 1
+AMOUNT = 3_000_000.0
+RATE = 12.0
+SCHEDULE_TERMS = (12, 36, 60, 120, 240, 360, 480)
+REPAYMENT_TERMS = (60, 240, 480)
+SEARCH_TERMS = (60, 240)
+PAYMENTS_MADE = 12
+SECOND_STEP_MONTHS = 12
+# Доля кредита, вносимая досрочно, и доля базовой переплаты в цели поиска
+REPAYMENT_SHARE = 0.1
+TARGET_SHARE = 0.7
+TOLERANCE = 100.0
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """Один замеряемый вызов ядра."""
+
+    name: str
+    func: Callable[[], object]
+
+
+def make_repayment(strategy: EarlyRepaymentStrategy) -> EarlyRepayment:
+    """Досрочка для сетки; комбинированные стратегии делят сумму пополам."""
+
+    amount = AMOUNT * REPAYMENT_SHARE
+    if strategy in (
+        EarlyRepaymentStrategy.REDUCE_TERM,
+        EarlyRepaymentStrategy.REDUCE_PAYMENT,
+    ):
+        return EarlyRepayment(amount, strategy, PAYMENTS_MADE)
+    return EarlyRepayment(
+        amount / 2,
+        strategy,
+        PAYMENTS_MADE,
+        secondary_amount=amount / 2,
+        secondary_execute_after_payments=PAYMENTS_MADE + SECOND_STEP_MONTHS,
+    )
+
+
+def iter_cases(calculator: CreditCalculator) -> Iterator[Case]:
+    """Строит сетку случаев для всех замеряемых операций."""
+
+    for term in SCHEDULE_TERMS:
+        yield Case(
+            f"schedule/term={term}",
+            lambda t=term: calculator.generate_payment_schedule(AMOUNT, t, RATE),
+        )
+    kopeck = CreditCalculator(cache=None, engine=ENGINE_KOPECK)
+    for term in SCHEDULE_TERMS:
+        yield Case(
+            f"schedule_kopeck/term={term}",
+            lambda t=term: kopeck.generate_payment_schedule(AMOUNT, t, RATE),
+        )
+    for term in REPAYMENT_TERMS:
+        schedule = calculator.generate_payment_schedule(AMOUNT, term, RATE)
+        for strategy in EarlyRepaymentStrategy:
+            repayment = make_repayment(strategy)
+            yield Case(
+                f"early_repayment/{strategy.value}/term={term}",
+                lambda s=schedule, r=repayment: calculator.apply_early_repayment(
+                    s, r, PAYMENTS_MADE
+                ),
+            )
+    for term in SEARCH_TERMS:
+        base = calculator.generate_payment_schedule(AMOUNT, term, RATE)
+        target = base.total_interest * TARGET_SHARE
+        for strategy in (
+            EarlyRepaymentStrategy.REDUCE_TERM,
+            EarlyRepaymentStrategy.REDUCE_PAYMENT,
+        ):
+            repayment = EarlyRepayment(
+                amount=0.0, strategy=strategy, execute_after_payments=PAYMENTS_MADE
+            )
+            yield Case(
+                f"strategy_search/{strategy.value}/term={term}",
+                lambda t=term, g=target, r=repayment: (
+                    calculator.find_optimal_strategy_by_overpayment(
+                        AMOUNT, t, RATE, g, r, TOLERANCE
+                    )
+                ),
+            )
+        for method in (SEARCH_NEWTON, SEARCH_BISECTION):
+            yield Case(
+                f"payment_search/{method}/term={term}",
+                lambda g=target, m=method: (
+                    calculator.calculate_payment_by_target_overpayment(
+                        AMOUNT, RATE, g, TOLERANCE, method=m
+                    )
+                ),
+            )
+
+
+def measure(case: Case, repeat: int) -> dict[str, float]:
+    """Замеряет время одного вызова: минимум и медиану по повторам."""
+
+    timer = timeit.Timer(case.func)
+    number, _ = timer.autorange()
+    samples = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "loops": number,
+    }
+
+
+def run(repeat: int, pattern: str) -> dict[str, object]:
+    """Выполняет все случаи, имя которых содержит ``pattern``."""
+
+    calculator = CreditCalculator(cache=None)
+    results: dict[str, dict[str, float]] = {}
+    for case in iter_cases(calculator):
+        if pattern in case.name:
+            results[case.name] = measure(case, repeat)
+            print(f"{case.name:<55} {results[case.name]['min'] * 1e6:>12.1f} мкс")
+    print_engine_speedup(results)
+    return {
+        "version": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def print_engine_speedup(results: dict[str, dict[str, float]]) -> None:
+    """Печатает ускорение целочисленного ядра относительно float-ядра."""
+
+    for name, stats in results.items():
+        reference = results.get(name.replace("schedule_kopeck/", "schedule/"))
+        if name.startswith("schedule_kopeck/") and reference:
+            ratio = reference["min"] / stats["min"]
+            print(f"{name:<55} {ratio:>7.2f}x быстрее float")
+
+
+def compare(
+    current: dict[str, object], baseline: dict[str, object], threshold: float
+) -> list[str]:
+    """Возвращает случаи, замедлившиеся относительно базы сильнее порога."""
+
+    regressions = []
+    base_results = baseline.get("results", {})
+    for name, stats in current["results"].items():
+        reference = base_results.get(name)
+        if not reference:
+            continue
+        ratio = stats["min"] / reference["min"]
+        marker = "РЕГРЕССИЯ" if ratio > 1.0 + threshold else ""
+        print(f"{name:<55} {ratio:>7.2f}x {marker}")
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--filter", default="", help="подстрока имени случая")
+    parser.add_argument("--output", type=pathlib.Path, help="куда сохранить JSON")
+    parser.add_argument("--baseline", type=pathlib.Path, help="JSON прошлого запуска")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="допустимое относительное замедление (0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.filter)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if not args.baseline:
+        return 0
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"Не удалось прочитать базовый замер: {exc}", file=sys.stderr)
+        return 2
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"Замедлились сильнее {args.threshold:.0%}: {len(regressions)}")
+        return 1
+    print("Регрессий не обнаружено.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
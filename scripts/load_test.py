@@ -0,0 +1,279 @@
+"""Нагрузочный прогон диалогов бота без обращения к Telegram.
+
+Запуск::
+
+    python scripts/load_test.py --users 2000 --concurrency 64
+
+Скрипт собирает приложение с обработчиками из ``register_handlers``,
+подменяет HTTP-транспорт Bot API заглушкой и проигрывает синтетические
+апдейты: каждый пользователь последовательно проходит один из сценариев
+(график с листанием страниц, досрочка, комбинированная стратегия,
+сравнение стратегий, подбор платежа), а сами пользователи работают
+одновременно. Апдейты проходят через тот же
+``PerUserUpdateProcessor``, что и в боевом режиме. В отчёте — пропускная
+способность, p50/p99 задержки обработки апдейта по сценариям, число
+ошибок и прирост памяти.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import pathlib
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import Optional
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from loguru import logger  # noqa: E402
+from telegram import Update  # noqa: E402
+from telegram.ext import Application, ApplicationBuilder  # noqa: E402
+from telegram.request import BaseRequest, RequestData  # noqa: E402
+
+from credit_bot.bot.executor import executor  # noqa: E402
+from credit_bot.bot.registration import register_handlers  # noqa: E402
+from credit_bot.bot.schedule_pages import encode_loan  # noqa: E402
+from credit_bot.bot.session import sessions  # noqa: E402
+from credit_bot.bot.update_processor import PerUserUpdateProcessor  # noqa: E402
+
+TOKEN = "1:load-test"
+BOT_USER = {"id": 1, "is_bot": True, "first_name": "credit_bot", "username": "bot"}
+BASE_STEPS = ["/calculate", "1000000", "120", "12"]
+LOAN_KEY = encode_loan(1_000_000, 120, 12)
+# Сценарии: текст сообщения или ``("cb", data)`` для нажатия inline-кнопки
+FLOWS: dict[str, list[object]] = {
+    "schedule": BASE_STEPS,
+    "pages": BASE_STEPS + [("cb", f"page:{LOAN_KEY}:1"), ("cb", f"page:{LOAN_KEY}:9")],
+    "early": BASE_STEPS + [("cb", "action:reduce_term"), "12", "100000"],
+    "combined": BASE_STEPS
+    + [("cb", "action:combined"), "12", "100000", ("cb", "strategy:combo_pt"), "50000"],
+    "compare": BASE_STEPS
+    + [("cb", "action:combined"), "12", "100000", ("cb", "strategy:compare")],
+    "payment": BASE_STEPS + [("cb", "action:payment"), "500000", "100"],
+}
+
+
+class FakeBotApi(BaseRequest):
+    """Транспорт Bot API, отвечающий правдоподобными заглушками без сети."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self._ids = itertools.count(1)
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return None
+
+    async def initialize(self) -> None:
+        """Ресурсы не нужны."""
+
+    async def shutdown(self) -> None:
+        """Ресурсы не нужны."""
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        *args: object,
+        **kwargs: object,
+    ) -> tuple[int, bytes]:
+        endpoint = url.rsplit("/", 1)[-1]
+        self.calls[endpoint] += 1
+        params = request_data.parameters if request_data else {}
+        result: object = True
+        if endpoint == "getMe":
+            result = BOT_USER
+        elif endpoint in ("sendMessage", "editMessageText"):
+            chat_id = params.get("chat_id", 0)
+            result = {
+                "message_id": params.get("message_id") or next(self._ids),
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "from": BOT_USER,
+                "text": params.get("text", ""),
+            }
+        return 200, json.dumps({"ok": True, "result": result}).encode()
+
+
+def make_update(update_id: int, user_id: int, step: object, bot: object) -> Update:
+    """Строит апдейт с сообщением или нажатием кнопки от пользователя."""
+
+    user = {"id": user_id, "is_bot": False, "first_name": f"user{user_id}"}
+    message = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": user_id, "type": "private"},
+        "from": user,
+    }
+    if isinstance(step, tuple):
+        message["from"] = BOT_USER
+        query = {
+            "id": str(update_id),
+            "from": user,
+            "chat_instance": str(user_id),
+            "message": message,
+            "data": step[1],
+        }
+        return Update.de_json({"update_id": update_id, "callback_query": query}, bot)
+    message["text"] = step
+    if step.startswith("/"):
+        message["entities"] = [
+            {"type": "bot_command", "offset": 0, "length": len(step)}
+        ]
+    return Update.de_json({"update_id": update_id, "message": message}, bot)
+
+
+async def play_user(
+    application: Application,
+    user_id: int,
+    flow: str,
+    ids: itertools.count,
+    latencies: dict[str, list[float]],
+    handler_times: dict[str, list[float]],
+) -> None:
+    """Проигрывает сценарий одного пользователя, апдейт за апдейтом.
+
+    ``latencies`` — время от поступления апдейта до конца обработки (с
+    ожиданием в очереди процессора), ``handler_times`` — только обработка.
+    """
+
+    async def handle(update: Update) -> None:
+        started = time.perf_counter()
+        await application.process_update(update)
+        handler_times[flow].append(time.perf_counter() - started)
+
+    processor = application.update_processor
+    for step in FLOWS[flow]:
+        update = make_update(next(ids), user_id, step, application.bot)
+        started = time.perf_counter()
+        await processor.process_update(update, handle(update))
+        latencies[flow].append(time.perf_counter() - started)
+
+
+def summarize(samples_by_flow: dict[str, list[float]]) -> dict[str, object]:
+    """Возвращает p50/p99 в миллисекундах: общие и по сценариям."""
+
+    def stats(samples: list[float]) -> dict[str, float]:
+        return {
+            "p50_ms": percentile(samples, 0.5) * 1000,
+            "p99_ms": percentile(samples, 0.99) * 1000,
+            "mean_ms": statistics.fmean(samples) * 1000,
+        }
+
+    samples = [value for values in samples_by_flow.values() for value in values]
+    return {
+        **stats(samples),
+        "flows": {flow: stats(values) for flow, values in samples_by_flow.items()},
+    }
+
+
+def percentile(samples: list[float], share: float) -> float:
+    """Возвращает перцентиль по отсортированной выборке."""
+
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+async def run(users: int, concurrency: int, trace_memory: bool) -> dict[str, object]:
+    """Прогоняет нагрузку и возвращает отчёт."""
+
+    api = FakeBotApi()
+    application = (
+        ApplicationBuilder()
+        .token(TOKEN)
+        .request(api)
+        .get_updates_request(FakeBotApi())
+        .concurrent_updates(PerUserUpdateProcessor(concurrency))
+        .build()
+    )
+    register_handlers(application)
+    errors: Counter[str] = Counter()
+
+    async def count_error(update: object, context: object) -> None:
+        errors[type(context.error).__name__] += 1
+
+    application.add_error_handler(count_error)
+    await application.initialize()
+
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+    latencies: dict[str, list[float]] = defaultdict(list)
+    handler_times: dict[str, list[float]] = defaultdict(list)
+    ids = itertools.count(1)
+    flows = list(FLOWS)
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            play_user(
+                application,
+                10_000 + index,
+                flows[index % len(flows)],
+                ids,
+                latencies,
+                handler_times,
+            )
+            for index in range(users)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    memory_growth = (
+        tracemalloc.get_traced_memory()[0] - memory_before if trace_memory else None
+    )
+    tracemalloc.stop()
+    await application.shutdown()
+    executor.shutdown()
+
+    updates = sum(len(values) for values in latencies.values())
+    return {
+        "users": users,
+        "concurrency": concurrency,
+        "updates": updates,
+        "seconds": elapsed,
+        "updates_per_second": updates / elapsed,
+        "latency": summarize(latencies),
+        "handler": summarize(handler_times),
+        "api_calls": dict(api.calls),
+        "errors": dict(errors),
+        "calculations_rejected": executor.metrics.rejected,
+        "sessions": len(sessions),
+        "memory_growth_bytes": memory_growth,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--output", type=pathlib.Path, help="куда сохранить JSON")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="замерять прирост памяти через tracemalloc (замедляет прогон)",
+    )
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+    report = asyncio.run(run(args.users, args.concurrency, args.trace_memory))
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())